@@ -1,8 +1,13 @@
 """Entrypoint for the FastAPI server."""
 
+import asyncio
+import contextlib
+from collections.abc import AsyncGenerator
+
 import fastapi
 
-from ctk_functions.core import config, middleware
+from ctk_functions.core import config, middleware, nlp
+from ctk_functions.microservices import cloai_service, language_tool
 from ctk_functions.routers.file_conversion import views as file_conversion_views
 from ctk_functions.routers.health import views as health_views
 from ctk_functions.routers.intake import views as intake_views
@@ -13,10 +18,24 @@ from ctk_functions.routers.referral import views as referral_views
 
 logger = config.get_logger()
 
+
+@contextlib.asynccontextmanager
+async def lifespan(_: fastapi.FastAPI) -> AsyncGenerator[None, None]:
+    """Opens the shared resources on startup and closes them on shutdown."""
+    if config.get_settings().SPACY_PRELOAD:
+        await asyncio.to_thread(nlp.preload)
+    language_tool.get_session()
+    cloai_service.get_session()
+    yield
+    await language_tool.close_session()
+    await cloai_service.close_session()
+
+
 app = fastapi.FastAPI(
     title="Clinician Toolkit API",
     summary="Clinician toolkit functionality too complex for the webapp's backend.",
     version="0.1.0",
+    lifespan=lifespan,
     swagger_ui_parameters={
         "operationsSorter": "method",
         "displayRequestDuration": True,
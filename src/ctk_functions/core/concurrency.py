@@ -0,0 +1,152 @@
+"""Fair limits on the number of concurrent calls to a shared service.
+
+A FairLimiter admits a fixed number of callers at a time and queues the others.
+Callers identify the client they act for, e.g. a report, and queued callers
+are admitted round-robin over clients, such that a client with many queued
+calls does not starve the others. Every admission is logged at debug level
+with the limiter's statistics.
+"""
+
+import asyncio
+import collections
+import contextlib
+import dataclasses
+import time
+from collections.abc import AsyncGenerator, Hashable
+
+from ctk_functions.core import config
+
+logger = config.get_logger()
+
+
+@dataclasses.dataclass
+class LimiterStats:
+    """Statistics of the calls admitted by a limiter.
+
+    Attributes:
+        admitted: The number of admitted calls.
+        queued: The number of admitted calls that had to wait.
+        total_wait: The total time admitted calls waited, in seconds.
+        max_wait: The longest time an admitted call waited, in seconds.
+        max_queue_depth: The largest number of calls waiting at once.
+    """
+
+    admitted: int = 0
+    queued: int = 0
+    total_wait: float = 0.0
+    max_wait: float = 0.0
+    max_queue_depth: int = 0
+
+    def record(self, wait: float) -> None:
+        """Records an admitted call.
+
+        Args:
+            wait: The time the call waited in seconds, 0 if it was not queued.
+        """
+        self.admitted += 1
+        if wait > 0:
+            self.queued += 1
+        self.total_wait += wait
+        self.max_wait = max(self.max_wait, wait)
+
+    @property
+    def mean_wait(self) -> float:
+        """The mean time admitted calls waited, 0 without calls."""
+        if not self.admitted:
+            return 0.0
+        return self.total_wait / self.admitted
+
+
+class FairLimiter:
+    """Limits concurrent calls, admitting queued calls round-robin over clients.
+
+    The limiter is bound to the event loop it is used in.
+    """
+
+    def __init__(self, limit: int) -> None:
+        """Initializes the limiter.
+
+        Args:
+            limit: The maximum number of concurrent calls.
+        """
+        self.limit = limit
+        self.stats = LimiterStats()
+        self.in_flight = 0
+        # The waiting calls of each client; the first client is admitted next.
+        self._queues: collections.OrderedDict[
+            Hashable, collections.deque[asyncio.Future[None]]
+        ] = collections.OrderedDict()
+
+    @property
+    def queue_depth(self) -> int:
+        """The number of calls waiting to be admitted."""
+        return sum(len(queue) for queue in self._queues.values())
+
+    @contextlib.asynccontextmanager
+    async def acquire(self, client: Hashable) -> AsyncGenerator[None, None]:
+        """Waits until a call may proceed and holds its slot until exit.
+
+        Args:
+            client: The client the call is made for.
+        """
+        wait = 0.0
+        if self.in_flight < self.limit and not self._queues:
+            self.in_flight += 1
+        else:
+            start = time.perf_counter()
+            future = asyncio.get_running_loop().create_future()
+            self._queues.setdefault(client, collections.deque()).append(future)
+            self.stats.max_queue_depth = max(
+                self.stats.max_queue_depth, self.queue_depth
+            )
+            try:
+                await future
+            except asyncio.CancelledError:
+                if future.cancelled():
+                    self._remove(client, future)
+                else:
+                    self._release()
+                raise
+            wait = time.perf_counter() - start
+
+        self.stats.record(wait)
+        logger.debug(
+            "Admitted a call after %.3f seconds; %s in flight, %s queued, "
+            "%s of %s admitted calls queued, mean wait %.3f seconds, "
+            "max wait %.3f seconds, max queue depth %s.",
+            wait,
+            self.in_flight,
+            self.queue_depth,
+            self.stats.queued,
+            self.stats.admitted,
+            self.stats.mean_wait,
+            self.stats.max_wait,
+            self.stats.max_queue_depth,
+        )
+        try:
+            yield
+        finally:
+            self._release()
+
+    def _release(self) -> None:
+        """Hands a released slot to the next client, or frees it."""
+        while self._queues:
+            client, queue = next(iter(self._queues.items()))
+            future = queue.popleft()
+            if queue:
+                self._queues.move_to_end(client)
+            else:
+                del self._queues[client]
+            if not future.done():
+                future.set_result(None)
+                return
+        self.in_flight -= 1
+
+    def _remove(self, client: Hashable, future: asyncio.Future[None]) -> None:
+        """Removes a cancelled call from the queue of its client."""
+        queue = self._queues.get(client)
+        if queue is None or future not in queue:
+            return
+        queue.remove(future)
+        if not queue:
+            del self._queues[client]
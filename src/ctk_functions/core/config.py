@@ -1,9 +1,10 @@
 """Configuration module for the ctk_functions package."""
 
+import datetime
 import functools
 import logging
 import pathlib
-from typing import Self
+from typing import Literal, Self
 
 import pydantic
 import pydantic_settings
@@ -19,9 +20,116 @@ class Settings(pydantic_settings.BaseSettings):
     )
 
     LANGUAGE_TOOL_URL: str
+    LANGUAGE_TOOL_ADDITIONAL_URLS: tuple[str, ...] = pydantic.Field(
+        default=(),
+        description=(
+            "URLs of further LanguageTool servers to balance requests over, "
+            "together with LANGUAGE_TOOL_URL. Provided as a JSON list."
+        ),
+    )
+    LANGUAGE_TOOL_EJECTION_COOLDOWN: float = pydantic.Field(
+        default=30,
+        ge=0,
+        description="Seconds to skip a failing or slow LanguageTool server for.",
+    )
+    LANGUAGE_TOOL_SLOW_RESPONSE: float = pydantic.Field(
+        default=30,
+        gt=0,
+        description=(
+            "Seconds after which a LanguageTool response counts as slow, "
+            "ejecting its server if there are others."
+        ),
+    )
+    LANGUAGE_TOOL_MAX_CONNECTIONS: int = pydantic.Field(32, ge=1)
+    LANGUAGE_TOOL_MAX_CONCURRENT_REQUESTS: int = pydantic.Field(
+        default=8,
+        ge=1,
+        description=(
+            "Maximum number of concurrent requests to LanguageTool per process. "
+            "Further requests are queued, taking turns between reports."
+        ),
+    )
+    LANGUAGE_TOOL_TIMEOUT: float = pydantic.Field(
+        default=60,
+        gt=0,
+        description="Seconds before a request to LanguageTool is aborted.",
+    )
+    LANGUAGE_TOOL_CONNECT_TIMEOUT: float = pydantic.Field(10, gt=0)
+    LANGUAGE_TOOL_SPACY_FALLBACK: bool = pydantic.Field(
+        default=True,
+        description=(
+            "Whether to tag verbs with spaCy if the verb form table cannot "
+            "resolve a pronoun agreement correction."
+        ),
+    )
+    LANGUAGE_TOOL_MAX_REQUEST_CHARACTERS: int = pydantic.Field(
+        default=20_000,
+        ge=1,
+        description=(
+            "Maximum number of characters of text batched into a single "
+            "LanguageTool request. Longer texts are sent on their own."
+        ),
+    )
+
+    LANGUAGE_TOOL_CACHE_SIZE: int = pydantic.Field(
+        default=10_000,
+        ge=0,
+        description=(
+            "Maximum number of texts whose LanguageTool results are cached in "
+            "memory. Results are not cached if 0."
+        ),
+    )
+    LANGUAGE_TOOL_CACHE_PATH: pathlib.Path | None = pydantic.Field(
+        default=None,
+        description=(
+            "SQLite file storing LanguageTool results across restarts. Results "
+            "are only cached in memory if unset."
+        ),
+    )
 
     CLOAI_SERVICE_URL: str
     CLOAI_MODEL: str
+    CLOAI_MAX_CONNECTIONS: int = pydantic.Field(
+        default=32,
+        ge=1,
+        description="Maximum number of concurrent connections to cloai-service.",
+    )
+    CLOAI_CONNECT_TIMEOUT: float = pydantic.Field(10, gt=0)
+    CLOAI_READ_TIMEOUT: float = pydantic.Field(
+        default=300,
+        gt=0,
+        description=(
+            "Seconds to wait for data from cloai-service before aborting a call. "
+            "LLM calls may take minutes."
+        ),
+    )
+
+    SPACY_PRELOAD: bool = pydantic.Field(
+        default=False,
+        description=(
+            "Whether to load the spaCy model on startup rather than on first use."
+        ),
+    )
+
+    DOCX_COMPRESSION_LEVEL: int = pydantic.Field(6, ge=0, le=9)
+
+    PYRITE_SNAPSHOT_PATH: pathlib.Path | None = pydantic.Field(
+        default=None,
+        description=(
+            "SQLite file storing per-participant snapshots of the Pyrite data. "
+            "Snapshots are not used if unset."
+        ),
+    )
+    PYRITE_SNAPSHOT_MAX_AGE: datetime.timedelta = datetime.timedelta(days=1)
+    PYRITE_DATA_BACKEND: Literal["sql", "file"] = pydantic.Field(
+        default="sql",
+        description=(
+            "Whether Pyrite reads from the NextGen database, or from a SQLite "
+            "export of its tables."
+        ),
+    )
+    PYRITE_DATA_FILE: pathlib.Path | None = None
+    PYRITE_DATA_FILE_MMAP_SIZE: int = pydantic.Field(2**30, ge=0)
 
     LOGGER_VERBOSITY: int = logging.INFO
     LOGGER_PHI_LOGGING_LEVEL: int = pydantic.Field(1, lt=logging.DEBUG)
@@ -38,6 +146,14 @@ class Settings(pydantic_settings.BaseSettings):
     POSTGRES_HOST: str
     POSTGRES_PORT: int
     POSTGRES_DATABASE: str
+    POSTGRES_READ_REPLICA_HOSTS: tuple[str, ...] = pydantic.Field(
+        default=(),
+        description=(
+            "Hosts of read replicas of the SQL server, used for read-only "
+            "queries. Provided as a JSON list."
+        ),
+    )
+    POSTGRES_READ_REPLICA_COOLDOWN: float = pydantic.Field(30, ge=0)
 
     @pydantic.model_validator(mode="after")
     def check_phi_logging(self) -> Self:
@@ -59,6 +175,14 @@ class Settings(pydantic_settings.BaseSettings):
             raise ValueError(msg)
         return self
 
+    @pydantic.model_validator(mode="after")
+    def check_pyrite_data_file(self) -> Self:
+        """Checks if a data file is provided for the file backend."""
+        if self.PYRITE_DATA_BACKEND == "file" and self.PYRITE_DATA_FILE is None:
+            msg = "PYRITE_DATA_FILE must be set when using the file backend."
+            raise ValueError(msg)
+        return self
+
 
 @functools.lru_cache
 def get_settings() -> Settings:
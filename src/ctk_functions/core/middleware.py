@@ -5,13 +5,17 @@ from collections.abc import Awaitable, Callable
 import fastapi
 from starlette.middleware import base
 
-from ctk_functions.core import config
+from ctk_functions.core import config, query_accounting
 
 logger = config.get_logger()
 
 
 class LoggingMiddleware(base.BaseHTTPMiddleware):
-    """Logs requests and the status of their responses."""
+    """Logs requests, the status of their responses, and their SQL statements.
+
+    The SQL statement counts, rows, and time are also added to the response
+    headers X-Query-Count, X-Query-Rows, and X-Query-Time-Ms.
+    """
 
     async def dispatch(
         self,
@@ -36,7 +40,10 @@ class LoggingMiddleware(base.BaseHTTPMiddleware):
             user,
             endpoint,
         )
-        response = await call_next(request)
+        with query_accounting.track_queries() as query_stats:
+            response = await call_next(request)
+        # Statements executed while streaming a response body are not included.
+        response.headers.update(query_stats.to_headers())
         logger.debug(
             "Finish request %s from user %s targeting %s with status %s.",
             request_id,
@@ -44,6 +51,21 @@ class LoggingMiddleware(base.BaseHTTPMiddleware):
             endpoint,
             response.status_code,
         )
+        logger.debug(
+            "Request %s executed %s SQL statements returning %s rows in %.1f ms.",
+            request_id,
+            query_stats.statements,
+            query_stats.rows,
+            query_stats.duration * 1000,
+        )
+        repeated = query_stats.most_repeated()
+        if repeated and repeated[1] > 1:
+            logger.debug(
+                "Request %s executed a statement %s times: %s",
+                request_id,
+                repeated[1],
+                " ".join(repeated[0].split())[:100],
+            )
         return response
 
 
@@ -0,0 +1,103 @@
+"""Shared, lazily loaded spaCy pipeline.
+
+The spaCy model is loaded once per process on first use, rather than on import,
+such that routes that do not use it do not pay for it. Modules use a
+PipelineView to run only the components they need.
+"""
+
+import functools
+import threading
+from collections.abc import Iterable, Iterator
+
+import spacy
+from spacy import language, tokens
+
+from ctk_functions.core import config
+
+logger = config.get_logger()
+
+MODEL_NAME = "en_core_web_sm"
+# Components that are not used by any view and are therefore not loaded.
+_EXCLUDED_COMPONENTS = ("ner",)
+# Components that other components depend on, enabled in every view.
+_SHARED_COMPONENTS = ("tok2vec",)
+
+_load_lock = threading.Lock()
+
+
+def get_pipeline() -> language.Language:
+    """Gets the shared pipeline, loading it on first use.
+
+    Returns:
+        The pipeline with all components enabled.
+    """
+    with _load_lock:
+        return _load_pipeline()
+
+
+def preload() -> None:
+    """Loads the shared pipeline ahead of its first use."""
+    get_pipeline()
+
+
+@functools.cache
+def _load_pipeline() -> language.Language:
+    logger.info("Loading spaCy model %s.", MODEL_NAME)
+    return spacy.load(MODEL_NAME, exclude=_EXCLUDED_COMPONENTS)
+
+
+class PipelineView:
+    """Runs a subset of the components of the shared pipeline.
+
+    The other components are disabled per call, such that views can be used
+    concurrently without altering the shared pipeline.
+    """
+
+    def __init__(self, *components: str) -> None:
+        """Initializes the view.
+
+        Args:
+            components: The names of the components to run.
+        """
+        self.components = frozenset(components)
+
+    def __call__(self, text: str) -> tokens.Doc:
+        """Processes a text.
+
+        Args:
+            text: The text to process.
+
+        Returns:
+            The processed document.
+        """
+        pipeline = get_pipeline()
+        return pipeline(text, disable=self._get_disabled(pipeline))
+
+    def pipe(
+        self, texts: Iterable[str], batch_size: int | None = None
+    ) -> Iterator[tokens.Doc]:
+        """Processes texts in batches.
+
+        Args:
+            texts: The texts to process.
+            batch_size: The number of texts per batch, defaults to spaCy's.
+
+        Returns:
+            The processed documents, in the order of the texts.
+        """
+        pipeline = get_pipeline()
+        return pipeline.pipe(
+            texts, batch_size=batch_size, disable=self._get_disabled(pipeline)
+        )
+
+    def _get_disabled(self, pipeline: language.Language) -> list[str]:
+        """Gets the components of the pipeline that are not part of the view."""
+        missing = self.components.difference(pipeline.pipe_names)
+        if missing:
+            msg = f"The spaCy pipeline has no components {sorted(missing)}."
+            raise ValueError(msg)
+        return [
+            name
+            for name in pipeline.pipe_names
+            if name not in self.components and name not in _SHARED_COMPONENTS
+        ]
@@ -0,0 +1,240 @@
+"""Serialization of Word documents to .docx packages.
+
+python-docx recompresses every part of the package on each save, even though
+most parts (styles, theme, fonts, images) are copied verbatim from a template.
+This module writes the zip archive itself so that the deflated bytes of
+template parts that were seen before can be reused. Parts that may contain
+report content, such as the document body and comments, are never cached.
+"""
+
+import collections
+import hashlib
+import struct
+import threading
+import zlib
+from collections.abc import Iterable
+
+from docx import document
+from docx.opc import packuri, pkgwriter
+from docx.opc import part as opc_part
+from docx.opc.constants import CONTENT_TYPE
+
+from ctk_functions.core import config
+
+_LOCAL_FILE_HEADER = struct.Struct("<4s5H3L2H")
+_CENTRAL_DIRECTORY_HEADER = struct.Struct("<4s6H3L5H2L")
+_END_OF_CENTRAL_DIRECTORY = struct.Struct("<4s4H2LH")
+
+_ZIP_VERSION = 20
+_METHOD_STORED = 0
+_METHOD_DEFLATED = 8
+# 1980-01-01 00:00:00 in MS-DOS format; a fixed timestamp keeps output stable.
+_DOS_DATE = (1 << 5) | 1
+_DOS_TIME = 0
+_MAX_ZIP32 = 0xFFFFFFFF
+
+# Content types of parts that are copied from the template and carry no report
+# content; their compressed bytes are cached.
+_TEMPLATE_CONTENT_TYPES = frozenset(
+    {
+        CONTENT_TYPE.OFC_THEME,
+        CONTENT_TYPE.OFC_THEME_OVERRIDE,
+        CONTENT_TYPE.WML_FONT_TABLE,
+        CONTENT_TYPE.WML_NUMBERING,
+        CONTENT_TYPE.WML_PRINTER_SETTINGS,
+        CONTENT_TYPE.WML_SETTINGS,
+        CONTENT_TYPE.WML_STYLES,
+        CONTENT_TYPE.WML_WEB_SETTINGS,
+        CONTENT_TYPE.X_FONTDATA,
+        CONTENT_TYPE.X_FONT_TTF,
+    }
+)
+_TEMPLATE_CACHE_SIZE = 64
+# Least recently used cache of compressed template parts, keyed by member name,
+# digest of the uncompressed data, and compression level.
+_template_cache: collections.OrderedDict[
+    tuple[str, bytes, int], tuple[int, int, bytes]
+] = collections.OrderedDict()
+_template_cache_lock = threading.Lock()
+
+
+def document_to_bytes(doc: document.Document) -> bytes:
+    """Serializes a Word document to the bytes of a .docx file.
+
+    Args:
+        doc: The document to serialize.
+
+    Returns:
+        The .docx file.
+    """
+    level = config.get_settings().DOCX_COMPRESSION_LEVEL
+    package = doc.part.package
+    parts = list(package.iter_parts())
+
+    writer = _ZipWriter(level)
+    content_types = pkgwriter._ContentTypesItem.from_parts(  # type: ignore[no-untyped-call] # noqa: SLF001
+        parts
+    )
+    writer.write(packuri.CONTENT_TYPES_URI.membername, content_types.blob)
+    writer.write(packuri.PACKAGE_URI.rels_uri.membername, package.rels.xml)
+    for name, blob, is_template in _iter_part_blobs(parts):
+        writer.write(name, blob, is_template=is_template)
+    return writer.close()
+
+
+def _iter_part_blobs(
+    parts: Iterable[opc_part.Part],
+) -> Iterable[tuple[str, bytes, bool]]:
+    """Yields the member names and blobs of parts and their relationships.
+
+    The third item is whether the member is a template part, see
+    _TEMPLATE_CONTENT_TYPES.
+    """
+    for part in parts:
+        is_template = (
+            part.content_type in _TEMPLATE_CONTENT_TYPES
+            or part.content_type.startswith("image/")
+        )
+        yield part.partname.membername, part.blob, is_template
+        if len(part.rels):
+            yield part.partname.rels_uri.membername, part.rels.xml, False
+
+
+def _compress_template_part(
+    name: str, blob: bytes, level: int
+) -> tuple[int, int, bytes]:
+    """Compresses a template part, reusing earlier results for identical data.
+
+    Args:
+        name: The member name of the part.
+        blob: The uncompressed data.
+        level: The zlib compression level.
+
+    Returns:
+        The CRC-32 of the blob, the zip compression method, and the
+        compressed data, see _compress.
+    """
+    key = (name, hashlib.sha256(blob).digest(), level)
+    with _template_cache_lock:
+        cached = _template_cache.get(key)
+        if cached is not None:
+            _template_cache.move_to_end(key)
+            return cached
+
+    compressed = _compress(blob, level)
+    with _template_cache_lock:
+        _template_cache[key] = compressed
+        while len(_template_cache) > _TEMPLATE_CACHE_SIZE:
+            _template_cache.popitem(last=False)
+    return compressed
+
+
+def _compress(blob: bytes, level: int) -> tuple[int, int, bytes]:
+    """Compresses a blob for a zip archive.
+
+    Args:
+        blob: The uncompressed data.
+        level: The zlib compression level.
+
+    Returns:
+        The CRC-32 of the blob, the zip compression method, and the
+        compressed data. Data that does not shrink, such as PNG images, is
+        stored uncompressed.
+    """
+    compressor = zlib.compressobj(level, zlib.DEFLATED, -zlib.MAX_WBITS)
+    deflated = compressor.compress(blob) + compressor.flush()
+    crc = zlib.crc32(blob)
+    if len(deflated) < len(blob):
+        return crc, _METHOD_DEFLATED, deflated
+    return crc, _METHOD_STORED, blob
+
+
+class _ZipWriter:
+    """Minimal in-memory zip writer that accepts pre-compressed members."""
+
+    def __init__(self, level: int) -> None:
+        """Initializes the writer.
+
+        Args:
+            level: The zlib compression level.
+        """
+        self._level = level
+        self._buffer = bytearray()
+        self._central_directory = bytearray()
+        self._n_entries = 0
+
+    def write(self, name: str, blob: bytes, *, is_template: bool = False) -> None:
+        """Adds a member to the archive.
+
+        Args:
+            name: The name of the member.
+            blob: The uncompressed data of the member.
+            is_template: Whether the member is a template part, whose
+                compressed data may be cached.
+        """
+        if is_template:
+            crc, method, data = _compress_template_part(name, blob, self._level)
+        else:
+            crc, method, data = _compress(blob, self._level)
+        encoded_name = name.encode()
+        offset = len(self._buffer)
+        if max(offset, len(blob)) > _MAX_ZIP32:
+            msg = "Documents larger than 4GB are not supported."
+            raise ValueError(msg)
+
+        self._buffer += _LOCAL_FILE_HEADER.pack(
+            b"PK\x03\x04",
+            _ZIP_VERSION,
+            0,
+            method,
+            _DOS_TIME,
+            _DOS_DATE,
+            crc,
+            len(data),
+            len(blob),
+            len(encoded_name),
+            0,
+        )
+        self._buffer += encoded_name
+        self._buffer += data
+        self._central_directory += _CENTRAL_DIRECTORY_HEADER.pack(
+            b"PK\x01\x02",
+            _ZIP_VERSION,
+            _ZIP_VERSION,
+            0,
+            method,
+            _DOS_TIME,
+            _DOS_DATE,
+            crc,
+            len(data),
+            len(blob),
+            len(encoded_name),
+            0,
+            0,
+            0,
+            0,
+            0,
+            offset,
+        )
+        self._central_directory += encoded_name
+        self._n_entries += 1
+
+    def close(self) -> bytes:
+        """Finalizes the archive.
+
+        Returns:
+            The bytes of the zip archive.
+        """
+        offset = len(self._buffer)
+        self._buffer += self._central_directory
+        self._buffer += _END_OF_CENTRAL_DIRECTORY.pack(
+            b"PK\x05\x06",
+            0,
+            0,
+            self._n_entries,
+            self._n_entries,
+            len(self._central_directory),
+            offset,
+            0,
+        )
+        return bytes(self._buffer)
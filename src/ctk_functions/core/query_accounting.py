@@ -0,0 +1,177 @@
+"""Accounting of the SQL statements executed within a request.
+
+Engines are instrumented with SQLAlchemy events that record every statement
+into the statistics of the active tracking contexts. The LoggingMiddleware
+tracks each request; tests can use query_budget to fail when a code path
+issues more statements than expected, e.g. due to N+1 queries.
+"""
+
+import collections
+import contextlib
+import contextvars
+import dataclasses
+import time
+from collections.abc import Generator
+from typing import Any
+
+import sqlalchemy
+from sqlalchemy import engine
+
+from ctk_functions.core import config
+
+logger = config.get_logger()
+
+_START_TIMES_KEY = "query_accounting_start_times"
+_STATEMENT_LOG_LENGTH = 100
+
+
+@dataclasses.dataclass
+class QueryStats:
+    """Statistics of the SQL statements executed within a context.
+
+    Attributes:
+        statements: The number of executed statements.
+        rows: The number of rows affected or returned, as reported by the
+            database driver.
+        duration: The total execution time in seconds.
+        statement_counts: The number of executions of each distinct statement.
+    """
+
+    statements: int = 0
+    rows: int = 0
+    duration: float = 0.0
+    statement_counts: collections.Counter[str] = dataclasses.field(
+        default_factory=collections.Counter
+    )
+
+    def record(self, statement: str, rows: int, duration: float) -> None:
+        """Records an executed statement.
+
+        Args:
+            statement: The SQL statement, without parameters.
+            rows: The number of rows affected or returned.
+            duration: The execution time in seconds.
+        """
+        self.statements += 1
+        self.rows += rows
+        self.duration += duration
+        self.statement_counts[statement] += 1
+
+    def most_repeated(self) -> tuple[str, int] | None:
+        """Gets the statement that was executed most often.
+
+        Returns:
+            The statement and its number of executions, None if no statements
+            were executed.
+        """
+        if not self.statement_counts:
+            return None
+        return self.statement_counts.most_common(1)[0]
+
+    def to_headers(self) -> dict[str, str]:
+        """Converts the statistics to HTTP response headers."""
+        return {
+            "X-Query-Count": str(self.statements),
+            "X-Query-Rows": str(self.rows),
+            "X-Query-Time-Ms": f"{self.duration * 1000:.1f}",
+        }
+
+
+class QueryBudgetExceededError(AssertionError):
+    """Raised when a code path executes more statements than its budget."""
+
+
+_active_stats: contextvars.ContextVar[tuple[QueryStats, ...]] = contextvars.ContextVar(
+    "_active_stats", default=()
+)
+
+
+@contextlib.contextmanager
+def track_queries() -> Generator[QueryStats, None, None]:
+    """Records the statements executed on instrumented engines.
+
+    Contexts may be nested; statements are recorded in all active contexts.
+    Work offloaded to threads is tracked if the context is copied to the
+    thread, as is done for FastAPI's synchronous endpoints.
+
+    Yields:
+        The statistics, updated as statements are executed.
+    """
+    stats = QueryStats()
+    token = _active_stats.set((*_active_stats.get(), stats))
+    try:
+        yield stats
+    finally:
+        _active_stats.reset(token)
+
+
+@contextlib.contextmanager
+def query_budget(max_statements: int) -> Generator[QueryStats, None, None]:
+    """Asserts that a code path executes at most a number of statements.
+
+    Args:
+        max_statements: The maximum number of statements.
+
+    Yields:
+        The statistics of the code path.
+
+    Raises:
+        QueryBudgetExceededError: If more statements were executed.
+    """
+    with track_queries() as stats:
+        yield stats
+
+    if stats.statements > max_statements:
+        msg = (
+            f"Executed {stats.statements} SQL statements, exceeding the budget of "
+            f"{max_statements}."
+        )
+        if (repeated := stats.most_repeated()) and repeated[1] > 1:
+            msg += f" Executed {repeated[1]} times: {repeated[0]}"
+        raise QueryBudgetExceededError(msg)
+
+
+def instrument(target: engine.Engine) -> None:
+    """Records the statements executed on an engine in the active contexts.
+
+    Args:
+        target: The engine to instrument.
+    """
+    if sqlalchemy.event.contains(target, "after_cursor_execute", _after_execute):
+        return
+    sqlalchemy.event.listen(target, "before_cursor_execute", _before_execute)
+    sqlalchemy.event.listen(target, "after_cursor_execute", _after_execute)
+    sqlalchemy.event.listen(target, "handle_error", _on_error)
+
+
+def _before_execute(connection: engine.Connection, *_: Any) -> None:  # noqa: ANN401
+    connection.info.setdefault(_START_TIMES_KEY, []).append(time.perf_counter())
+
+
+def _after_execute(  # noqa: PLR0913
+    connection: engine.Connection,
+    cursor: Any,  # noqa: ANN401
+    statement: str,
+    parameters: Any,  # noqa: ANN401, ARG001
+    context: Any,  # noqa: ANN401, ARG001
+    executemany: bool,  # noqa: ARG001, FBT001
+) -> None:
+    duration = time.perf_counter() - connection.info[_START_TIMES_KEY].pop()
+    active_stats = _active_stats.get()
+    if not active_stats:
+        return
+
+    rows = max(cursor.rowcount, 0)
+    for stats in active_stats:
+        stats.record(statement, rows, duration)
+    logger.debug(
+        "Executed SQL statement in %.1f ms: %s",
+        duration * 1000,
+        " ".join(statement.split())[:_STATEMENT_LOG_LENGTH],
+    )
+
+
+def _on_error(exception_context: engine.ExceptionContext) -> None:
+    connection = exception_context.connection
+    if connection is not None and connection.info.get(_START_TIMES_KEY):
+        connection.info[_START_TIMES_KEY].pop()
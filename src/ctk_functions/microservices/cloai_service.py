@@ -1,5 +1,15 @@
-"""Interactions with Large Language Models via cloai-service."""
+"""Interactions with Large Language Models via cloai-service.
 
+All calls share a session per event loop, see get_session, which keeps
+connections to cloai-service alive between calls. The latency of the calls is
+recorded per endpoint in LATENCY_STATS.
+"""
+
+import asyncio
+import collections
+import dataclasses
+import time
+import weakref
 from typing import TypeVar
 
 import aiohttp
@@ -17,6 +27,89 @@ CLOAI_MODEL = settings.CLOAI_MODEL
 
 logger = config.get_logger()
 
+_KEEPALIVE_TIMEOUT = 30
+
+# aiohttp sessions are bound to the event loop they were created in.
+_sessions: weakref.WeakKeyDictionary[
+    asyncio.AbstractEventLoop, aiohttp.ClientSession
+] = weakref.WeakKeyDictionary()
+
+
+@dataclasses.dataclass
+class LatencyStats:
+    """Statistics of the calls to an endpoint.
+
+    Attributes:
+        calls: The number of calls, including those that raised.
+        failures: The number of calls with an error response, a timeout, or a
+            connection error.
+        total: The total duration of the calls in seconds.
+        max: The longest duration of a call in seconds.
+    """
+
+    calls: int = 0
+    failures: int = 0
+    total: float = 0.0
+    max: float = 0.0
+
+    def record(self, duration: float, *, ok: bool) -> None:
+        """Records a call.
+
+        Args:
+            duration: The duration of the call in seconds.
+            ok: Whether the call succeeded.
+        """
+        self.calls += 1
+        self.failures += not ok
+        self.total += duration
+        self.max = max(self.max, duration)
+
+    @property
+    def mean(self) -> float:
+        """The mean duration of the calls, 0 without calls."""
+        if not self.calls:
+            return 0.0
+        return self.total / self.calls
+
+
+LATENCY_STATS: collections.defaultdict[str, LatencyStats] = collections.defaultdict(
+    LatencyStats
+)
+
+
+def get_session() -> aiohttp.ClientSession:
+    """Gets the shared cloai-service session of the running event loop.
+
+    The session is opened and closed by the app's lifespan, and created on
+    first use in other event loops.
+
+    Returns:
+        The session.
+    """
+    loop = asyncio.get_running_loop()
+    session = _sessions.get(loop)
+    if session is None or session.closed:
+        session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(
+                limit_per_host=settings.CLOAI_MAX_CONNECTIONS,
+                keepalive_timeout=_KEEPALIVE_TIMEOUT,
+            ),
+            timeout=aiohttp.ClientTimeout(
+                total=None,
+                connect=settings.CLOAI_CONNECT_TIMEOUT,
+                sock_read=settings.CLOAI_READ_TIMEOUT,
+            ),
+        )
+        _sessions[loop] = session
+    return session
+
+
+async def close_session() -> None:
+    """Closes the shared cloai-service session of the running event loop."""
+    session = _sessions.pop(asyncio.get_running_loop(), None)
+    if session is not None:
+        await session.close()
+
 
 class Client:
     """Client for interactions with cloai-service."""
@@ -33,22 +126,14 @@ class Client:
             user_prompt: The user's message.
             system_prompt: The system's message.
         """
-        async with aiohttp.request(
-            "post",
-            url=f"{self.url}/llm/run?id={self.model}",
-            json={
+        result = await self._post(
+            "run",
+            {
                 "system_prompt": system_prompt,
                 "user_prompt": user_prompt,
             },
-        ) as response:
-            if response.ok:
-                return str((await response.json())["result"])
-            text = await response.text()
-            logger.error(text)
-            raise fastapi.HTTPException(
-                status.HTTP_502_BAD_GATEWAY,
-                text,
-            )
+        )
+        return str(result)
 
     async def call_instructor(
         self,
@@ -63,24 +148,15 @@ class Client:
             user_prompt: The user's message.
             system_prompt: The system's message.
         """
-        async with aiohttp.request(
-            "post",
-            url=f"{self.url}/llm/instructor?id={self.model}",
-            json={
+        result = await self._post(
+            "instructor",
+            {
                 "system_prompt": system_prompt,
                 "user_prompt": user_prompt,
                 "response_model": model.model_json_schema(),
             },
-        ) as response:
-            if response.ok:
-                data = (await response.json())["result"]
-                return model(**data)
-            text = await response.text()
-            logger.error(text)
-            raise fastapi.HTTPException(
-                status.HTTP_502_BAD_GATEWAY,
-                text,
-            )
+        )
+        return model.model_validate(result)
 
     async def chain_of_verification(
         self,
@@ -93,20 +169,48 @@ class Client:
             user_prompt: The user's message.
             system_prompt: The system's message.
         """
-        async with aiohttp.request(
-            "post",
-            url=f"{self.url}/llm/cov?id={self.model}",
-            json={
+        result = await self._post(
+            "cov",
+            {
                 "system_prompt": system_prompt,
                 "user_prompt": user_prompt,
                 "create_new_statements": True,
             },
-        ) as response:
-            if response.ok:
-                return str((await response.json())["result"])
-            text = await response.text()
+        )
+        return str(result)
+
+    async def _post(self, endpoint: str, payload: dict[str, object]) -> object:
+        """Posts a request to an LLM endpoint of cloai-service.
+
+        Args:
+            endpoint: The name of the endpoint, e.g. 'run'.
+            payload: The JSON body of the request.
+
+        Returns:
+            The result of the call.
+        """
+        start = time.perf_counter()
+        ok = False
+        try:
+            async with get_session().post(
+                url=f"{self.url}/llm/{endpoint}?id={self.model}",
+                json=payload,
+            ) as response:
+                if response.ok:
+                    result = (await response.json())["result"]
+                    ok = True
+                else:
+                    text = await response.text()
+        finally:
+            # Timeouts and connection errors are recorded as failed calls.
+            duration = time.perf_counter() - start
+            LATENCY_STATS[endpoint].record(duration, ok=ok)
+            logger.debug("cloai-service %s call took %.2f seconds.", endpoint, duration)
+
+        if not ok:
             logger.error(text)
             raise fastapi.HTTPException(
                 status.HTTP_502_BAD_GATEWAY,
                 text,
             )
+        return result
@@ -0,0 +1,180 @@
+"""Content-addressed cache of LanguageTool results.
+
+Intake reports repeat many generated sentences, which LanguageTool would
+otherwise check again for every report. Results are stored under a key derived
+from their content, see LanguageCorrecter, in a bounded least recently used
+memory tier and, optionally, in a SQLite file that is shared between processes
+and survives restarts.
+"""
+
+import collections
+import dataclasses
+import functools
+import pathlib
+import threading
+from collections.abc import Iterable, Mapping
+
+import sqlalchemy
+from sqlalchemy import engine
+from sqlalchemy.dialects import sqlite
+
+from ctk_functions.core import config, query_accounting
+
+_metadata = sqlalchemy.MetaData()
+_results = sqlalchemy.Table(
+    "language_tool_results",
+    _metadata,
+    sqlalchemy.Column("key", sqlalchemy.String, primary_key=True),
+    sqlalchemy.Column("value", sqlalchemy.Text, nullable=False),
+)
+# SQLite limits the number of parameters of a statement.
+_LOOKUP_BATCH_SIZE = 500
+
+
+@dataclasses.dataclass
+class CacheStats:
+    """Statistics of the lookups in a cache.
+
+    Attributes:
+        memory_hits: The number of keys found in memory.
+        disk_hits: The number of keys found on disk but not in memory.
+        misses: The number of keys that were not found.
+    """
+
+    memory_hits: int = 0
+    disk_hits: int = 0
+    misses: int = 0
+
+    @property
+    def lookups(self) -> int:
+        """The total number of looked up keys."""
+        return self.memory_hits + self.disk_hits + self.misses
+
+    @property
+    def hit_rate(self) -> float:
+        """The fraction of looked up keys that were found, 0 without lookups."""
+        if not self.lookups:
+            return 0.0
+        return (self.memory_hits + self.disk_hits) / self.lookups
+
+
+class ResultCache:
+    """Two-tier key-value cache of serialized results.
+
+    The cache is thread-safe, such that it can be used from worker threads to
+    keep disk access off the event loop.
+    """
+
+    def __init__(self, max_size: int, path: pathlib.Path | None = None) -> None:
+        """Initializes the cache.
+
+        Args:
+            max_size: The maximum number of entries kept in memory.
+            path: The SQLite file of the disk tier, no disk tier if None.
+        """
+        self.max_size = max_size
+        self.path = path
+        self.stats = CacheStats()
+        self._memory: collections.OrderedDict[str, str] = collections.OrderedDict()
+        self._lock = threading.Lock()
+        self._engine = None if path is None else _create_engine(path)
+
+    def get_many(self, keys: Iterable[str]) -> dict[str, str]:
+        """Gets the values of keys, promoting disk hits to memory.
+
+        Args:
+            keys: The keys to look up.
+
+        Returns:
+            The values of the keys that were found.
+        """
+        found: dict[str, str] = {}
+        missing: list[str] = []
+        with self._lock:
+            for key in dict.fromkeys(keys):
+                if key in self._memory:
+                    self._memory.move_to_end(key)
+                    found[key] = self._memory[key]
+                else:
+                    missing.append(key)
+            self.stats.memory_hits += len(found)
+
+        disk_found = self._read(missing)
+        with self._lock:
+            self._remember(disk_found)
+            self.stats.disk_hits += len(disk_found)
+            self.stats.misses += len(missing) - len(disk_found)
+        return found | disk_found
+
+    def put_many(self, items: Mapping[str, str]) -> None:
+        """Stores values in both tiers.
+
+        Args:
+            items: The values keyed by their keys.
+        """
+        if not items:
+            return
+        with self._lock:
+            self._remember(items)
+        if self._engine is None:
+            return
+        statement = sqlite.insert(_results).on_conflict_do_nothing()
+        with self._engine.begin() as connection:
+            connection.execute(
+                statement,
+                [{"key": key, "value": value} for key, value in items.items()],
+            )
+
+    def clear(self) -> None:
+        """Removes all entries from both tiers and resets the statistics."""
+        with self._lock:
+            self._memory.clear()
+            self.stats = CacheStats()
+        if self._engine is not None:
+            with self._engine.begin() as connection:
+                connection.execute(sqlalchemy.delete(_results))
+
+    def _remember(self, items: Mapping[str, str]) -> None:
+        """Adds items to the memory tier, evicting the least recently used."""
+        for key, value in items.items():
+            self._memory[key] = value
+            self._memory.move_to_end(key)
+        while len(self._memory) > self.max_size:
+            self._memory.popitem(last=False)
+
+    def _read(self, keys: list[str]) -> dict[str, str]:
+        """Reads the values of keys from the disk tier."""
+        if self._engine is None or not keys:
+            return {}
+        found: dict[str, str] = {}
+        with self._engine.connect() as connection:
+            for start in range(0, len(keys), _LOOKUP_BATCH_SIZE):
+                statement = sqlalchemy.select(_results.c.key, _results.c.value).where(
+                    _results.c.key.in_(keys[start : start + _LOOKUP_BATCH_SIZE])
+                )
+                found.update(connection.execute(statement).tuples().all())
+        return found
+
+
+@functools.cache
+def get_cache() -> ResultCache | None:
+    """Gets the shared LanguageTool result cache.
+
+    Returns:
+        The cache configured by the LANGUAGE_TOOL_CACHE_* settings, None if
+        LANGUAGE_TOOL_CACHE_SIZE is 0.
+    """
+    settings = config.get_settings()
+    if settings.LANGUAGE_TOOL_CACHE_SIZE == 0:
+        return None
+    return ResultCache(
+        settings.LANGUAGE_TOOL_CACHE_SIZE, settings.LANGUAGE_TOOL_CACHE_PATH
+    )
+
+
+def _create_engine(path: pathlib.Path) -> engine.Engine:
+    """Creates the engine of the disk tier, creating the table if needed."""
+    cache_engine = sqlalchemy.create_engine(f"sqlite:///{path}")
+    query_accounting.instrument(cache_engine)
+    _metadata.create_all(cache_engine)
+    return cache_engine
@@ -0,0 +1,175 @@
+"""Local implementations of mechanical LanguageTool rules.
+
+The rules in this module are simple pattern rules that do not require the
+grammatical analysis of LanguageTool. Running them in-process saves a request to
+the LanguageTool server per round of corrections. Each rule yields the start,
+end, and replacement text of its matches in the same way as the corresponding
+LanguageTool rule; see tests/integration for the parity tests against a
+LanguageTool server.
+"""
+
+import re
+from collections.abc import Callable, Iterable, Iterator
+
+Match = tuple[int, int, str]
+
+_NUMBER_WORDS = (
+    "one|two|three|four|five|six|seven|eight|nine|ten|eleven|twelve|"
+    "thirteen|fourteen|fifteen|sixteen|seventeen|eighteen|nineteen|twenty"
+)
+
+# Words that may follow "<number> week" without it being a compound adjective.
+_WEEK_FOLLOWERS = (
+    "after|ago|and|are|at|because|before|but|during|earlier|for|from|in|is|"
+    "later|of|old|on|or|per|prior|since|so|then|to|until|was|were|when|while|with"
+)
+
+# Abbreviations that end in a period without ending the sentence, lowercase and
+# without their final period.
+_ABBREVIATIONS = frozenset(
+    {
+        "a.m",
+        "al",
+        "approx",
+        "cf",
+        "dr",
+        "e.g",
+        "etc",
+        "fig",
+        "i.e",
+        "inc",
+        "jr",
+        "ltd",
+        "mr",
+        "mrs",
+        "ms",
+        "no",
+        "p.m",
+        "prof",
+        "sr",
+        "st",
+        "vs",
+    }
+)
+
+_OPENING_PUNCTUATION = "\"'\u201c\u2018(["
+_CLOSING_PUNCTUATION = "\"'\u201d\u2019)]"
+
+_CONSECUTIVE_SPACES = re.compile(r"(?<=\S) {2,}")
+_THE_US = re.compile(
+    r"(?<!\w)(?i:across|around|from|in|into|outside|throughout|to|within) "
+    r"(?P<country>U\.S\.A\.|U\.S\.|USA|US)(?![\w.])"
+)
+_WEEK_HYPHEN = re.compile(
+    rf"(?<![\w-])(?P<number>\d+|(?i:{_NUMBER_WORDS})) (?P<week>week)"
+    rf"(?= (?!(?:{_WEEK_FOLLOWERS})\b)[a-z])"
+)
+_SENTENCE_END = re.compile(
+    rf"(?P<token>\S*?)(?P<punctuation>[.!?])[{re.escape(_CLOSING_PUNCTUATION)}]*\s+"
+    r"|\n\s*\n",
+)
+_SENTENCE_FIRST_WORD = re.compile(
+    rf"[{re.escape(_OPENING_PUNCTUATION)}]*(?P<word>[^\W\d_][\w'\u2019-]*)"
+)
+
+
+def consecutive_spaces(text: str) -> Iterator[Match]:
+    """Replaces repeated spaces between words by a single space."""
+    for match in _CONSECUTIVE_SPACES.finditer(text):
+        yield match.start(), match.end(), " "
+
+
+def the_us(text: str) -> Iterator[Match]:
+    """Adds the missing article to 'US' after a preposition."""
+    for match in _THE_US.finditer(text):
+        country = match.group("country")
+        yield match.start("country"), match.end("country"), f"the {country}"
+
+
+def week_hyphen(text: str) -> Iterator[Match]:
+    """Hyphenates compound adjectives such as 'a 3 week course'."""
+    for match in _WEEK_HYPHEN.finditer(text):
+        yield match.start(), match.end(), f"{match['number']}-{match['week']}"
+
+
+def uppercase_sentence_start(text: str) -> Iterator[Match]:
+    """Capitalizes the first word of sentences that start in lowercase."""
+    for start in sentence_starts(text):
+        first_word = _SENTENCE_FIRST_WORD.match(text, start)
+        if first_word is None:
+            continue
+        word = first_word.group("word")
+        # Mixed case words, such as 'iPad', and words with digits, such as the
+        # UUIDs of LLM placeholders, are not capitalized.
+        if (
+            word[0].islower()
+            and not any(char.isupper() for char in word[1:])
+            and not any(char.isdigit() for char in word)
+        ):
+            yield (
+                first_word.start("word"),
+                first_word.end("word"),
+                word[0].upper() + word[1:],
+            )
+
+
+LOCAL_RULES: dict[str, Callable[[str], Iterable[Match]]] = {
+    "CONSECUTIVE_SPACES": consecutive_spaces,
+    "THE_US": the_us,
+    "UPPERCASE_SENTENCE_START": uppercase_sentence_start,
+    "WEEK_HYPHEN": week_hyphen,
+}
+
+
+def sentence_starts(text: str) -> list[int]:
+    """Finds the start offsets of the sentences in a text.
+
+    Sentences end at a period, exclamation mark, or question mark followed by
+    whitespace, except after abbreviations, and at blank lines.
+
+    Args:
+        text: The text to split.
+
+    Returns:
+        The ascending start offsets, the first is always 0.
+    """
+    starts = [0]
+    for match in _SENTENCE_END.finditer(text):
+        if match.group("punctuation") == "." and _is_abbreviation(match["token"]):
+            continue
+        starts.append(match.end())
+    return starts
+
+
+def find_matches(text: str, rule_ids: Iterable[str]) -> list[Match]:
+    """Finds the matches of local rules in a text.
+
+    Args:
+        text: The text to check.
+        rule_ids: The rules to run, must be keys of LOCAL_RULES.
+
+    Returns:
+        The non-overlapping matches, sorted from back to front such that they
+        can be applied in order. Of overlapping matches, only the match that
+        starts last is kept.
+    """
+    matches = sorted(
+        (match for rule_id in rule_ids for match in LOCAL_RULES[rule_id](text)),
+        reverse=True,
+    )
+    selected: list[Match] = []
+    for match in matches:
+        if selected and match[1] > selected[-1][0]:
+            continue
+        selected.append(match)
+    return selected
+
+
+def _is_abbreviation(token: str) -> bool:
+    """Whether the token preceding a period is an abbreviation or initial."""
+    token = token.lstrip(_OPENING_PUNCTUATION).lower()
+    return (
+        token in _ABBREVIATIONS
+        or (len(token) == 1 and token.isalpha())
+        or token.endswith(".")
+    )
@@ -0,0 +1,135 @@
+"""Load balancing of requests over LanguageTool servers.
+
+Each LanguageTool server is a single JVM; running several of them scales the
+throughput of corrections. Requests are sent to the available server with the
+fewest outstanding requests. Servers are checked passively: a server that fails
+a request, or that responds slower than LANGUAGE_TOOL_SLOW_RESPONSE, is ejected
+for a cooldown period.
+"""
+
+import contextlib
+import functools
+import itertools
+import time
+from collections.abc import Generator, Sequence
+
+import aiohttp
+
+from ctk_functions.core import config
+
+logger = config.get_logger()
+
+# HTTP statuses at and above this indicate a failing server.
+_SERVER_ERROR = 500
+
+
+class ServerPool:
+    """Balances requests over servers by least outstanding requests.
+
+    Ties are broken in round-robin order. If all servers are ejected, the one
+    whose ejection ends first is used.
+    """
+
+    def __init__(
+        self, urls: Sequence[str], cooldown: float, slow_response: float
+    ) -> None:
+        """Initializes the pool.
+
+        Args:
+            urls: The base URLs of the servers.
+            cooldown: The number of seconds to eject a server for.
+            slow_response: The number of seconds after which a response counts
+                as slow.
+        """
+        if not urls:
+            msg = "A server pool requires at least one URL."
+            raise ValueError(msg)
+        self.urls = tuple(urls)
+        self.cooldown = cooldown
+        self.slow_response = slow_response
+        self.outstanding = [0] * len(self.urls)
+        # The software version of the last response of any server.
+        self.version: str | None = None
+        self._counter = itertools.count()
+        self._ejected_until = [0.0] * len(self.urls)
+
+    @contextlib.contextmanager
+    def select(self) -> Generator[str, None, None]:
+        """Selects a server for a request and tracks the request's outcome.
+
+        Yields:
+            The base URL of the selected server.
+        """
+        index = self._select_index()
+        self.outstanding[index] += 1
+        start = time.monotonic()
+        try:
+            yield self.urls[index]
+        except aiohttp.ClientResponseError as exc_info:
+            if exc_info.status >= _SERVER_ERROR:
+                self._eject(index, f"failed with status {exc_info.status}")
+            raise
+        except (aiohttp.ClientConnectionError, TimeoutError):
+            self._eject(index, "failed to respond")
+            raise
+        finally:
+            self.outstanding[index] -= 1
+
+        duration = time.monotonic() - start
+        if duration > self.slow_response:
+            self._eject(index, f"took {duration:.1f} seconds to respond")
+
+    def is_available(self, index: int) -> bool:
+        """Whether a server is not ejected."""
+        return self._ejected_until[index] <= time.monotonic()
+
+    def _select_index(self) -> int:
+        """Selects the index of the server to send the next request to."""
+        n_servers = len(self.urls)
+        start = next(self._counter)
+        candidates = [
+            (start + offset) % n_servers
+            for offset in range(n_servers)
+            if self.is_available((start + offset) % n_servers)
+        ]
+        if not candidates:
+            return min(range(n_servers), key=self._ejected_until.__getitem__)
+        return min(candidates, key=self.outstanding.__getitem__)
+
+    def _eject(self, index: int, reason: str) -> None:
+        if len(self.urls) == 1:
+            return
+        logger.warning(
+            "LanguageTool server %s %s; ejecting it for %s seconds.",
+            self.urls[index],
+            reason,
+            self.cooldown,
+        )
+        self._ejected_until[index] = time.monotonic() + self.cooldown
+
+
+def get_server_urls() -> tuple[str, ...]:
+    """Gets the URLs of the configured LanguageTool servers."""
+    settings = config.get_settings()
+    return (settings.LANGUAGE_TOOL_URL, *settings.LANGUAGE_TOOL_ADDITIONAL_URLS)
+
+
+@functools.cache
+def get_pool(urls: tuple[str, ...]) -> ServerPool:
+    """Gets the shared pool of a set of servers.
+
+    Pools are shared, such that the outstanding requests of all correcters are
+    counted together.
+
+    Args:
+        urls: The base URLs of the servers.
+
+    Returns:
+        The pool.
+    """
+    settings = config.get_settings()
+    return ServerPool(
+        urls,
+        cooldown=settings.LANGUAGE_TOOL_EJECTION_COOLDOWN,
+        slow_response=settings.LANGUAGE_TOOL_SLOW_RESPONSE,
+    )
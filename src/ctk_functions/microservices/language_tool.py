@@ -1,16 +1,53 @@
 """Module for syntax and grammatical corrections of text."""
 
-from collections.abc import Iterable
+import asyncio
+import bisect
+import collections
+import hashlib
+import itertools
+import json
+import threading
+import weakref
+from collections.abc import Iterable, Sequence
 
 import aiohttp
 import pydantic
-import spacy
 import tenacity
 
-NLP = spacy.load("en_core_web_sm", enable=["tagger"])
+from ctk_functions.core import concurrency, config, nlp
+from ctk_functions.microservices import (
+    language_cache,
+    language_rules,
+    language_servers,
+    verb_forms,
+)
+
+logger = config.get_logger()
+
+NLP = nlp.PipelineView("tagger")
+# Least recently used cache of the part-of-speech tags of sentences.
+_TAG_CACHE_SIZE = 1024
+_tag_cache: collections.OrderedDict[str, dict[int, str]] = collections.OrderedDict()
+_tag_cache_lock = threading.Lock()
+
+_DNS_CACHE_TTL = 300
+_KEEPALIVE_TIMEOUT = 30
+
+# aiohttp sessions are bound to the event loop they were created in.
+_sessions: weakref.WeakKeyDictionary[
+    asyncio.AbstractEventLoop, aiohttp.ClientSession
+] = weakref.WeakKeyDictionary()
+_limiters: weakref.WeakKeyDictionary[
+    asyncio.AbstractEventLoop, concurrency.FairLimiter
+] = weakref.WeakKeyDictionary()
+
+# Joins texts that are checked in a single request. LanguageTool treats it as a
+# paragraph break, such that rules apply to each text as if checked separately.
+BATCH_SEPARATOR = "\n\n"
 
 # These rules are unlikely to interfere with each other and can be executed without
-# rerunning LanguageTool.
+# rerunning LanguageTool. All of them are also implemented locally, see
+# language_rules.
 SIMULTANEOUS_RULES = (
     "THE_US",
     "UPPERCASE_SENTENCE_START",
@@ -104,6 +141,9 @@ class LanguageToolResponse(pydantic.BaseModel):
     matches: list[Match]
 
 
+_MATCH_LIST = pydantic.TypeAdapter(list[Match])
+
+
 class ReplacementData(pydantic.BaseModel):
     """The start, end, and text of a replacement.
 
@@ -116,24 +156,195 @@ class ReplacementData(pydantic.BaseModel):
     text: str
 
 
+def get_session() -> aiohttp.ClientSession:
+    """Gets the shared LanguageTool session of the running event loop.
+
+    The session keeps connections to LanguageTool alive between requests. It is
+    opened and closed by the app's lifespan, and created on first use in other
+    event loops.
+
+    Returns:
+        The session.
+    """
+    loop = asyncio.get_running_loop()
+    session = _sessions.get(loop)
+    if session is None or session.closed:
+        settings = config.get_settings()
+        session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(
+                limit=settings.LANGUAGE_TOOL_MAX_CONNECTIONS,
+                ttl_dns_cache=_DNS_CACHE_TTL,
+                keepalive_timeout=_KEEPALIVE_TIMEOUT,
+            ),
+            timeout=aiohttp.ClientTimeout(
+                total=settings.LANGUAGE_TOOL_TIMEOUT,
+                connect=settings.LANGUAGE_TOOL_CONNECT_TIMEOUT,
+            ),
+        )
+        _sessions[loop] = session
+    return session
+
+
+async def close_session() -> None:
+    """Closes the shared LanguageTool session of the running event loop."""
+    session = _sessions.pop(asyncio.get_running_loop(), None)
+    if session is not None:
+        await session.close()
+
+
+def get_limiter() -> concurrency.FairLimiter:
+    """Gets the limiter of concurrent LanguageTool requests of the running loop.
+
+    Requests wait in the limiter's queue rather than in the session's connection
+    pool, such that queueing does not count towards the request timeout and
+    overloads do not turn into retries.
+
+    Returns:
+        The limiter, admitting requests round-robin over correcters.
+    """
+    loop = asyncio.get_running_loop()
+    limiter = _limiters.get(loop)
+    if limiter is None:
+        limiter = concurrency.FairLimiter(
+            config.get_settings().LANGUAGE_TOOL_MAX_CONCURRENT_REQUESTS
+        )
+        _limiters[loop] = limiter
+    return limiter
+
+
+def find_local_replacements(
+    text: str, rule_ids: Iterable[str]
+) -> list[ReplacementData]:
+    """Finds the replacements of rules that are implemented locally.
+
+    Args:
+        text: The text to correct.
+        rule_ids: The rules to run, see language_rules.LOCAL_RULES.
+
+    Returns:
+        The replacements, sorted from back to front such that they can be
+        applied in order.
+    """
+    return [
+        ReplacementData(start=start, end=end, text=replacement)
+        for start, end, replacement in language_rules.find_matches(text, rule_ids)
+    ]
+
+
+def merge_replacements(
+    text: str, replacements: Iterable[ReplacementData]
+) -> list[ReplacementData]:
+    """Converts sequential replacements to replacements on the original text.
+
+    Each replacement from LanguageCorrecter.provide_replacements refers to the
+    text as altered by all preceding replacements. This maps them to the
+    original text, combining replacements that touch or overlap, such that all
+    of them can be applied in a single pass.
+
+    Args:
+        text: The original text.
+        replacements: The replacements, in the order they are to be applied.
+
+    Returns:
+        Non-overlapping replacements on the original text, sorted by start.
+    """
+    merged: list[ReplacementData] = []
+    for replacement in replacements:
+        # Offset of the altered text relative to the original text.
+        shift = 0
+        first = 0
+        while (
+            first < len(merged)
+            and merged[first].start + shift + len(merged[first].text)
+            < replacement.start
+        ):
+            shift += _length_change(merged[first])
+            first += 1
+        shift_before = shift
+        last = first
+        while last < len(merged) and merged[last].start + shift <= replacement.end:
+            shift += _length_change(merged[last])
+            last += 1
+
+        if first == last:
+            merged.insert(
+                first,
+                ReplacementData(
+                    start=replacement.start - shift_before,
+                    end=replacement.end - shift_before,
+                    text=replacement.text,
+                ),
+            )
+            continue
+
+        overlapping = merged[first:last]
+        start = min(replacement.start - shift_before, overlapping[0].start)
+        end = max(replacement.end - shift, overlapping[-1].end)
+        pieces = [text[start : overlapping[0].start]]
+        for current, following in itertools.pairwise(overlapping):
+            pieces += [current.text, text[current.end : following.start]]
+        pieces += [overlapping[-1].text, text[overlapping[-1].end : end]]
+        region = "".join(pieces)
+        region_start = start + shift_before
+        merged[first:last] = [
+            ReplacementData(
+                start=start,
+                end=end,
+                text=region[: replacement.start - region_start]
+                + replacement.text
+                + region[replacement.end - region_start :],
+            ),
+        ]
+    return merged
+
+
+def apply_replacements(text: str, replacements: Sequence[ReplacementData]) -> str:
+    """Applies non-overlapping replacements to a text in a single pass.
+
+    Args:
+        text: The text to alter.
+        replacements: The replacements, sorted by start, see merge_replacements.
+
+    Returns:
+        The altered text.
+    """
+    pieces = []
+    position = 0
+    for replacement in replacements:
+        pieces += [text[position : replacement.start], replacement.text]
+        position = replacement.end
+    pieces.append(text[position:])
+    return "".join(pieces)
+
+
+def _length_change(replacement: ReplacementData) -> int:
+    return len(replacement.text) - (replacement.end - replacement.start)
+
+
 class LanguageCorrecter:
     """Corrects the grammar and syntax of text."""
 
     def __init__(
         self,
         enabled_rules: Iterable[str],
-        url: str,
+        url: str | Sequence[str],
     ) -> None:
         """Initializes the language tool.
 
         Args:
             enabled_rules: The rules to enable for the correction.
-            url: The remote server to connect to.
+            url: The remote server to connect to, or multiple servers to
+                balance the requests over, see language_servers.
 
         """
-        self.url = url
+        self.pool = language_servers.get_pool(
+            (url,) if isinstance(url, str) else tuple(url)
+        )
         self.language_tool = "en-US"
         self.enabled_rules = set(enabled_rules)
+        self.local_rules = self.enabled_rules & language_rules.LOCAL_RULES.keys()
+        self.remote_rules = self.enabled_rules - self.local_rules
+        self.cache = language_cache.get_cache()
 
     @tenacity.retry(
         stop=tenacity.stop_after_attempt(3),
@@ -142,26 +353,116 @@ class LanguageCorrecter:
     async def check(self, text: str) -> LanguageToolResponse:
         """Sends a request to LanguageTool and returns the response.
 
+        Only the enabled rules that are not implemented locally are checked.
+        Each attempt waits for a slot of the limiter, see get_limiter; requests
+        of different correcters are admitted in turn. The attempt is then sent
+        to the server of the pool with the fewest outstanding requests.
+
         Args:
             text: The text to check.
 
         Returns:
             The response from LanguageTool.
         """
-        async with aiohttp.ClientSession() as client:
-            response = await client.post(
-                url=self.url + "/check",
-                data={
-                    "text": text,
-                    "language": "en-US",
-                    "enabledRules": ",".join(self.enabled_rules),
-                    "enabledOnly": "true",
-                },
-            )
-            text = await response.text()
+        async with get_limiter().acquire(self):
+            with self.pool.select() as url:
+                async with get_session().post(
+                    url=url + "/check",
+                    data={
+                        "text": text,
+                        "language": "en-US",
+                        "enabledRules": ",".join(sorted(self.remote_rules)),
+                        "enabledOnly": "true",
+                    },
+                ) as response:
+                    response.raise_for_status()
+                    text = await response.text()
 
         return LanguageToolResponse.model_validate_json(text)
 
+    async def check_batch(self, texts: Sequence[str]) -> list[list[Match]]:
+        """Checks multiple texts in as few requests as possible.
+
+        Results are looked up in the result cache first, and repeated texts are
+        checked once. The remaining texts are joined by BATCH_SEPARATOR into
+        documents of at most LANGUAGE_TOOL_MAX_REQUEST_CHARACTERS characters.
+        The offsets of the matches are mapped back to the text they were found
+        in; matches that span a separator are discarded.
+
+        Args:
+            texts: The texts to check.
+
+        Returns:
+            The matches of each text, in the order returned by LanguageTool.
+        """
+        results: dict[str, list[Match]] = {}
+        version = self.pool.version
+        if self.cache is not None and version is not None:
+            keys = {text: self._get_cache_key(text, version) for text in texts}
+            hits = await asyncio.to_thread(self.cache.get_many, keys.values())
+            results = {
+                text: _MATCH_LIST.validate_json(hits[key])
+                for text, key in keys.items()
+                if key in hits
+            }
+            logger.debug(
+                "Found %s of %s texts in the LanguageTool cache, hit rate %.2f.",
+                len(results),
+                len(keys),
+                self.cache.stats.hit_rate,
+            )
+
+        pending = [text for text in dict.fromkeys(texts) if text not in results]
+        results |= await self._check_uncached(pending)
+        return [list(results[text]) for text in texts]
+
+    async def _check_uncached(self, texts: Sequence[str]) -> dict[str, list[Match]]:
+        """Checks unique texts in batches and caches their results.
+
+        Args:
+            texts: The texts to check, without duplicates.
+
+        Returns:
+            The matches keyed by text.
+        """
+        batches = self._split_batches(texts)
+        responses = await asyncio.gather(
+            *(
+                self.check(BATCH_SEPARATOR.join(texts[index] for index in batch))
+                for batch in batches
+            )
+        )
+
+        matches: list[list[Match]] = [[] for _ in texts]
+        entries: dict[str, str] = {}
+        for batch, response in zip(batches, responses, strict=True):
+            starts = list(
+                itertools.accumulate(
+                    (len(texts[index]) + len(BATCH_SEPARATOR) for index in batch),
+                    initial=0,
+                )
+            )
+            for match in response.matches:
+                position = bisect.bisect_right(starts, match.offset) - 1
+                index = batch[position]
+                offset = match.offset - starts[position]
+                if offset + match.length > len(texts[index]):
+                    continue
+                matches[index].append(match.model_copy(update={"offset": offset}))
+
+            version = response.software.version
+            self.pool.version = version
+            if self.cache is not None:
+                for index in batch:
+                    key = self._get_cache_key(texts[index], version)
+                    entries[key] = _MATCH_LIST.dump_json(
+                        matches[index], by_alias=True
+                    ).decode()
+
+        if self.cache is not None and entries:
+            await asyncio.to_thread(self.cache.put_many, entries)
+        return dict(zip(texts, matches, strict=True))
+
     async def provide_replacements(self, text: str) -> list[ReplacementData]:
         """Corrects the text and returns the required replacements.
 
@@ -174,41 +475,78 @@ class LanguageCorrecter:
         Returns:
             The correct replacements.
         """
-        response = await self.check(text)
-        replacements = []
-        while response.matches:
-            alterations = [
-                match
-                for match in response.matches
-                if match.rule.id in SIMULTANEOUS_RULES
-            ]
-            not_simultaneous_matches = [
-                match
-                for match in response.matches
-                if match.rule.id not in SIMULTANEOUS_RULES
-            ]
-
-            if not_simultaneous_matches:
-                alterations.append(not_simultaneous_matches[-1])
-            alterations.sort(key=lambda match: match.offset, reverse=True)
-
-            for match in alterations:
-                correction_index = self._get_correction_index(match, text)
-                replacements.append(
-                    ReplacementData(
-                        start=match.offset,
-                        end=match.offset + match.length,
-                        text=match.replacements[correction_index].value,
-                    ),
-                )
-                text = self._apply_correction(text, match, correction_index)
+        (replacements,) = await self.provide_batch_replacements([text])
+        return replacements
+
+    async def provide_batch_replacements(
+        self, texts: Sequence[str]
+    ) -> list[list[ReplacementData]]:
+        """Corrects multiple texts and returns the required replacements of each.
+
+        The local rules are applied before and after the remote rules. Each round
+        of remote corrections checks all texts that still require corrections
+        together, see check_batch. After the first round, only the sentences
+        around the last correction of a text are re-checked; the other matches
+        of the previous round are kept. Within a text, replacements may
+        interfere with each other and, as such, should always be applied in the
+        order listed.
+
+        Args:
+            texts: The texts to correct.
+
+        Returns:
+            The correct replacements of each text.
+        """
+        texts = list(texts)
+        replacements: list[list[ReplacementData]] = [[] for _ in texts]
+        self._apply_local_rules(texts, replacements)
+        if not self.remote_rules:
+            return replacements
+
+        # The (start, end) window of each text that requires a (re-)check.
+        windows = {index: (0, len(text)) for index, text in enumerate(texts) if text}
+        retained: dict[int, list[Match]] = {index: [] for index in windows}
+        while windows:
+            batch_matches = await self.check_batch(
+                [texts[index][start:end] for index, (start, end) in windows.items()]
+            )
+            next_windows = {}
+            for (index, (start, _)), window_matches in zip(
+                windows.items(), batch_matches, strict=True
+            ):
+                matches = retained[index] + [
+                    match.model_copy(update={"offset": match.offset + start})
+                    for match in window_matches
+                ]
+                matches.sort(key=lambda match: match.offset)
+                if not matches:
+                    continue
+                alterations = self._select_alterations(matches)
+                for match in alterations:
+                    correction_index = self._get_correction_index(match, texts[index])
+                    replacements[index].append(
+                        ReplacementData(
+                            start=match.offset,
+                            end=match.offset + match.length,
+                            text=match.replacements[correction_index].value,
+                        ),
+                    )
+                    texts[index] = self._apply_correction(
+                        texts[index], match, correction_index
+                    )
 
-            if len(response.matches) == len(alterations):
                 # Do not re-check if there was only one non-simultaneous correction
                 # remaining.
-                break
-            response = await self.check(text)
-
+                if len(matches) != len(alterations):
+                    next_windows[index], retained[index] = self._get_recheck_window(
+                        texts[index],
+                        alterations,
+                        replacements[index][-len(alterations) :],
+                        [match for match in matches if match not in alterations],
+                    )
+            windows = next_windows
+
+        self._apply_local_rules(texts, replacements)
         return replacements
 
     async def correct(self, text: str) -> str:
@@ -221,11 +559,139 @@ class LanguageCorrecter:
             The corrected text.
         """
         replacements = await self.provide_replacements(text)
-        for replacement in replacements:
-            text = (
-                text[: replacement.start] + replacement.text + text[replacement.end :]
+        return apply_replacements(text, merge_replacements(text, replacements))
+
+    async def correct_batch(self, texts: Sequence[str]) -> list[str]:
+        """Corrects multiple texts in as few requests as possible.
+
+        Args:
+            texts: The texts to correct.
+
+        Returns:
+            The corrected texts, in the order of the input.
+        """
+        batch_replacements = await self.provide_batch_replacements(texts)
+        return [
+            apply_replacements(text, merge_replacements(text, replacements))
+            for text, replacements in zip(texts, batch_replacements, strict=True)
+        ]
+
+    def _apply_local_rules(
+        self, texts: list[str], replacements: list[list[ReplacementData]]
+    ) -> None:
+        """Applies the local rules to texts in place.
+
+        Args:
+            texts: The texts to correct, replaced by the corrected texts.
+            replacements: The replacements of each text, extended in place.
+        """
+        for index, text in enumerate(texts):
+            local_replacements = find_local_replacements(text, self.local_rules)
+            replacements[index] += local_replacements
+            texts[index] = apply_replacements(text, local_replacements[::-1])
+
+    @staticmethod
+    def _get_recheck_window(
+        text: str,
+        alterations: Sequence[Match],
+        applied: Sequence[ReplacementData],
+        remaining: Sequence[Match],
+    ) -> tuple[tuple[int, int], list[Match]]:
+        """Gets the window of a text to re-check after applying corrections.
+
+        The window spans the sentences around the non-simultaneous correction,
+        and around remaining matches that overlap a correction. Other remaining
+        matches are kept, with offsets in the corrected text.
+
+        Args:
+            text: The corrected text.
+            alterations: The corrected matches, see _select_alterations.
+            applied: The replacements of the corrected matches.
+            remaining: The matches that were not corrected.
+
+        Returns:
+            The (start, end) window to re-check, and the matches to keep.
+        """
+
+        def to_corrected_offset(offset: int) -> int:
+            return offset + sum(
+                _length_change(replacement)
+                for replacement in applied
+                if replacement.end <= offset
             )
-        return text
+
+        anchor = next(
+            replacement
+            for match, replacement in zip(alterations, applied, strict=True)
+            if match.rule.id not in SIMULTANEOUS_RULES
+        )
+        anchor_start = to_corrected_offset(anchor.start)
+        anchor_end = anchor_start + len(anchor.text)
+        kept = []
+        for match in remaining:
+            offset = to_corrected_offset(match.offset)
+            if any(
+                replacement.start < match.offset + match.length
+                and match.offset < replacement.end
+                for replacement in applied
+            ):
+                match_end = to_corrected_offset(match.offset + match.length)
+                anchor_start = min(anchor_start, offset)
+                anchor_end = max(anchor_end, min(match_end, len(text)))
+            else:
+                kept.append(match.model_copy(update={"offset": offset}))
+
+        start, end = _get_sentence_window(text, anchor_start, anchor_end)
+        kept = [
+            match
+            for match in kept
+            if match.offset + match.length <= start or match.offset >= end
+        ]
+        return (start, end), kept
+
+    def _get_cache_key(self, text: str, version: str) -> str:
+        """Gets the key of the cached LanguageTool result of a text.
+
+        The key covers everything that determines the result: the server
+        version, the language, the remote rules, and the text itself. The text
+        is not normalized, as the offsets of the matches refer to it.
+        """
+        content = json.dumps(
+            [version, self.language_tool, sorted(self.remote_rules), text]
+        )
+        return hashlib.sha256(content.encode()).hexdigest()
+
+    def _split_batches(self, texts: Sequence[str]) -> list[list[int]]:
+        """Splits the indices of texts into batches of limited length."""
+        max_characters = config.get_settings().LANGUAGE_TOOL_MAX_REQUEST_CHARACTERS
+        batches: list[list[int]] = []
+        batch_characters = 0
+        for index, text in enumerate(texts):
+            characters = len(text) + len(BATCH_SEPARATOR)
+            if not batches or batch_characters + characters > max_characters:
+                batches.append([])
+                batch_characters = 0
+            batches[-1].append(index)
+            batch_characters += characters
+        return batches
+
+    @staticmethod
+    def _select_alterations(matches: Sequence[Match]) -> list[Match]:
+        """Selects the matches that can be corrected without re-checking.
+
+        These are all simultaneous matches and the last other match, sorted from
+        back to front such that they can be applied in order.
+        """
+        alterations = [
+            match for match in matches if match.rule.id in SIMULTANEOUS_RULES
+        ]
+        not_simultaneous_matches = [
+            match for match in matches if match.rule.id not in SIMULTANEOUS_RULES
+        ]
+        if not_simultaneous_matches:
+            alterations.append(not_simultaneous_matches[-1])
+        alterations.sort(key=lambda match: match.offset, reverse=True)
+        return alterations
 
     @staticmethod
     def _apply_correction(text: str, correction: Match, index: int) -> str:
@@ -266,6 +732,9 @@ class LanguageCorrecter:
         """Resolves personal pronoun corrections with multiple replacements.
 
         Consult https://www.nltk.org/book/ch05.html for more information on NLTK tokens.
+        The verbs are tagged with the verb form table, see verb_forms. If the
+        table cannot resolve the correction, the sentence containing it is
+        tagged with spaCy, unless LANGUAGE_TOOL_SPACY_FALLBACK is disabled.
 
         Args:
             correction: The language tool Match.
@@ -275,7 +744,61 @@ class LanguageCorrecter:
             The index of the selected replacement.
 
         """
-        verb_tense = cls._get_verb_tense(full_text, correction.offset)
+        verb = full_text[correction.offset : correction.offset + correction.length]
+        verb_tense, *candidate_tenses = (
+            verb_forms.get_tag(phrase)
+            for phrase in [verb, *(item.value for item in correction.replacements)]
+        )
+        index = cls._select_agreeing_replacement(
+            correction, verb_tense, candidate_tenses
+        )
+        if index is not None:
+            return index
+        if not config.get_settings().LANGUAGE_TOOL_SPACY_FALLBACK:
+            msg = f"Could not find a suitable replacement for {correction}."
+            raise ValueError(msg)
+
+        logger.debug("Resolving %s with spaCy.", correction.rule.id)
+        start, end = _get_sentence_window(
+            full_text, correction.offset, correction.offset + correction.length
+        )
+        sentence = full_text[start:end]
+        offset = correction.offset - start
+        candidates = [
+            sentence[:offset]
+            + replacement.value
+            + sentence[offset + correction.length :]
+            for replacement in correction.replacements
+        ]
+        verb_tense, *candidate_tenses = (
+            tags.get(offset) for tags in _tag_sentences([sentence, *candidates])
+        )
+        index = cls._select_agreeing_replacement(
+            correction, verb_tense, candidate_tenses
+        )
+        if index is None:
+            msg = f"Could not find a suitable replacement for {correction}."
+            raise ValueError(msg)
+        return index
+
+    @staticmethod
+    def _select_agreeing_replacement(
+        correction: Match,
+        verb_tense: str | None,
+        candidate_tenses: Sequence[str | None],
+    ) -> int | None:
+        """Selects the replacement whose verb agrees with the subject.
+
+        Args:
+            correction: The language tool Match.
+            verb_tense: The tag of the original verb.
+            candidate_tenses: The tags of the verbs of the replacements.
+
+        Returns:
+            The index of the first agreeing replacement, None if there is none.
+        """
+        if verb_tense is None:
+            return None
 
         # Example correction message: "Use a third-person plural verb with ‘they’.""  # noqa: E501, RUF003
 
@@ -288,22 +811,55 @@ class LanguageCorrecter:
         else:
             target_tense = verb_tense
 
-        for index, replacement in enumerate(correction.replacements):
-            new_sentence = (
-                full_text[: correction.offset]
-                + replacement.value
-                + full_text[correction.offset + correction.length :]
-            )
-            new_verb_tense = cls._get_verb_tense(new_sentence, correction.offset)
+        for index, new_verb_tense in enumerate(candidate_tenses):
             if new_verb_tense == target_tense:
                 return index
+        return None
 
-        msg = f"Could not find a suitable replacement for {correction}."
-        raise ValueError(msg)
 
-    @staticmethod
-    def _get_verb_tense(sentence: str, verb_offset: int) -> str:
-        """Gets the tense of a verb."""
-        doc = NLP(sentence)
-        verb = next(word for word in doc if word.idx == verb_offset)
-        return verb.tag_
+def _get_sentence_window(text: str, start: int, end: int) -> tuple[int, int]:
+    """Gets the window of the sentences that contain a span of text.
+
+    Args:
+        text: The full text.
+        start: The start of the span.
+        end: The end of the span.
+
+    Returns:
+        The start and end of the window.
+    """
+    boundaries = language_rules.sentence_starts(text)
+    window_start = boundaries[bisect.bisect_right(boundaries, start) - 1]
+    end_index = bisect.bisect_right(boundaries, end)
+    window_end = len(text) if end_index == len(boundaries) else boundaries[end_index]
+    return window_start, window_end
+
+
+def _tag_sentences(sentences: Sequence[str]) -> list[dict[int, str]]:
+    """Tags sentences, processing those that are not cached in one batch.
+
+    Args:
+        sentences: The sentences to tag.
+
+    Returns:
+        For each sentence, the part-of-speech tag by token offset.
+    """
+    with _tag_cache_lock:
+        tagged = {
+            sentence: _tag_cache[sentence]
+            for sentence in sentences
+            if sentence in _tag_cache
+        }
+    missing = [
+        sentence for sentence in dict.fromkeys(sentences) if sentence not in tagged
+    ]
+    for sentence, doc in zip(missing, NLP.pipe(missing), strict=True):
+        tagged[sentence] = {token.idx: token.tag_ for token in doc}
+
+    with _tag_cache_lock:
+        for sentence in dict.fromkeys(sentences):
+            _tag_cache[sentence] = tagged[sentence]
+            _tag_cache.move_to_end(sentence)
+        while len(_tag_cache) > _TAG_CACHE_SIZE:
+            _tag_cache.popitem(last=False)
+    return [tagged[sentence] for sentence in sentences]
@@ -1,26 +1,122 @@
 """Client to connect to the SQL server."""
 
 import contextlib
-from collections.abc import Generator
+import itertools
+import threading
+import time
+from collections.abc import Callable, Generator, Sequence
 
 import sqlalchemy
+from sqlalchemy import engine as sqlalchemy_engine
+from sqlalchemy import exc
 from sqlalchemy.orm import session
 
-from ctk_functions.core import config
+from ctk_functions.core import config, query_accounting
 
 settings = config.get_settings()
+logger = config.get_logger()
 
-engine = sqlalchemy.create_engine(
-    "postgresql://"
-    + settings.POSTGRES_USER
-    + ":"
-    + settings.POSTGRES_PASSWORD.get_secret_value()
-    + "@"
-    + settings.POSTGRES_HOST
-    + ":"
-    + str(settings.POSTGRES_PORT)
-    + "/"
-    + settings.POSTGRES_DATABASE
+
+def _create_engine(host: str) -> sqlalchemy_engine.Engine:
+    """Creates an instrumented engine for a host of the SQL server."""
+    new_engine = sqlalchemy.create_engine(
+        "postgresql://"
+        + settings.POSTGRES_USER
+        + ":"
+        + settings.POSTGRES_PASSWORD.get_secret_value()
+        + "@"
+        + host
+        + ":"
+        + str(settings.POSTGRES_PORT)
+        + "/"
+        + settings.POSTGRES_DATABASE
+    )
+    query_accounting.instrument(new_engine)
+    return new_engine
+
+
+class ReadReplicaRouter:
+    """Routes read-only sessions over read replicas in round-robin order.
+
+    A replica that fails to connect, or that disconnects during a query, is
+    skipped for a cooldown period. If no replica is available, the primary is
+    used instead.
+    """
+
+    def __init__(
+        self,
+        primary: sqlalchemy_engine.Engine,
+        replicas: Sequence[sqlalchemy_engine.Engine],
+        cooldown: float,
+    ) -> None:
+        """Initializes the router.
+
+        Args:
+            primary: The engine of the primary database.
+            replicas: The engines of the read replicas.
+            cooldown: The number of seconds to skip a failed replica for.
+        """
+        self.primary = primary
+        self.replicas = tuple(replicas)
+        self.cooldown = cooldown
+        self._counter = itertools.count()
+        self._lock = threading.Lock()
+        self._unavailable_until = [0.0] * len(self.replicas)
+        for index, replica in enumerate(self.replicas):
+            sqlalchemy.event.listen(
+                replica, "handle_error", self._make_disconnect_handler(index)
+            )
+
+    def connect(self) -> sqlalchemy_engine.Connection:
+        """Connects to the next available replica, or to the primary.
+
+        Returns:
+            The connection.
+        """
+        n_replicas = len(self.replicas)
+        with self._lock:
+            start = next(self._counter)
+        for offset in range(n_replicas):
+            index = (start + offset) % n_replicas
+            if self._unavailable_until[index] > time.monotonic():
+                continue
+            try:
+                return self.replicas[index].connect()
+            except exc.DBAPIError:
+                self._mark_unavailable(index)
+        return self.primary.connect()
+
+    @contextlib.contextmanager
+    def get_session(self) -> Generator[session.Session, None, None]:
+        """Gets an active session on a replica and auto-closes it."""
+        with self.connect() as connection, session.Session(bind=connection) as sess:
+            yield sess
+
+    def _mark_unavailable(self, index: int) -> None:
+        logger.warning(
+            "Read replica %s is unavailable; skipping it for %s seconds.",
+            index,
+            self.cooldown,
+        )
+        self._unavailable_until[index] = time.monotonic() + self.cooldown
+
+    def _make_disconnect_handler(
+        self, index: int
+    ) -> Callable[[sqlalchemy_engine.ExceptionContext], None]:
+        """Creates a listener that marks a replica unavailable on disconnects."""
+
+        def handle_error(context: sqlalchemy_engine.ExceptionContext) -> None:
+            if context.is_disconnect:
+                self._mark_unavailable(index)
+
+        return handle_error
+
+
+engine = _create_engine(settings.POSTGRES_HOST)
+read_router = ReadReplicaRouter(
+    engine,
+    [_create_engine(host) for host in settings.POSTGRES_READ_REPLICA_HOSTS],
+    cooldown=settings.POSTGRES_READ_REPLICA_COOLDOWN,
 )
 
 
@@ -32,3 +128,12 @@ def get_session() -> Generator[session.Session, None, None]:
         yield sess
     finally:
         sess.close()
+
+
+def get_read_session() -> contextlib.AbstractContextManager[session.Session]:
+    """Gets an active read-only session and auto-closes it.
+
+    The session uses a read replica if any are configured and available, and
+    the primary database otherwise.
+    """
+    return read_router.get_session()
@@ -0,0 +1,118 @@
+"""Part-of-speech tags of English verb forms without a tagger.
+
+LanguageTool's PERS_PRONOUN_AGREEMENT rule may suggest multiple verbs, of which
+the one that agrees with the subject is selected by its Penn Treebank tag, see
+https://www.ling.upenn.edu/courses/Fall_2003/ling001/penn_treebank_pos.html.
+Irregular verbs and auxiliaries are looked up in a table; regular verbs are
+tagged by their suffix.
+"""
+
+# Modals, including the stems of "can't" and "won't".
+_MODALS = (
+    "ca",
+    "can",
+    "could",
+    "may",
+    "might",
+    "must",
+    "shall",
+    "should",
+    "will",
+    "wo",
+    "would",
+)
+
+_IRREGULAR_TAGS: dict[str, str] = {
+    "am": "VBP",
+    "are": "VBP",
+    "be": "VB",
+    "been": "VBN",
+    "being": "VBG",
+    "did": "VBD",
+    "do": "VBP",
+    "does": "VBZ",
+    "done": "VBN",
+    "goes": "VBZ",
+    "gone": "VBN",
+    "had": "VBD",
+    "has": "VBZ",
+    "have": "VBP",
+    "is": "VBZ",
+    "said": "VBD",
+    "says": "VBZ",
+    "was": "VBD",
+    "went": "VBD",
+    "were": "VBD",
+    **dict.fromkeys(_MODALS, "MD"),
+}
+
+# Common verbs whose base form ends in a suffix of other forms.
+_SUFFIXED_BASE_FORMS = frozenset(
+    {
+        "bleed",
+        "breed",
+        "bring",
+        "cling",
+        "embed",
+        "exceed",
+        "feed",
+        "fling",
+        "heed",
+        "need",
+        "proceed",
+        "ring",
+        "seed",
+        "shed",
+        "sing",
+        "sling",
+        "speed",
+        "spring",
+        "sting",
+        "string",
+        "succeed",
+        "swing",
+        "wring",
+    }
+)
+_VOWELS = frozenset("aeiouy")
+
+
+def get_tag(phrase: str) -> str | None:
+    """Gets the Penn Treebank tag of the verb at the start of a phrase.
+
+    Args:
+        phrase: The phrase, starting with a verb, e.g. "is" or "doesn't go".
+
+    Returns:
+        The tag, e.g. VBZ for 'is', or None if the first word is not a word or
+        its form cannot be determined from its spelling.
+    """
+    words = phrase.split(maxsplit=1)
+    if not words:
+        return None
+    word = words[0].lower().replace("\u2019", "'").removesuffix("n't")
+    if word in _IRREGULAR_TAGS:
+        return _IRREGULAR_TAGS[word]
+    if word in _SUFFIXED_BASE_FORMS:
+        return "VBP"
+    if not word.isalpha():
+        return None
+    return _get_suffix_tag(word)
+
+
+def _get_suffix_tag(word: str) -> str | None:
+    """Tags a regular verb by its suffix.
+
+    Returns None if the suffix may be part of the stem, e.g. 'fled' or
+    'agreed', such that the tag is left to the caller's tagger.
+    """
+    for suffix, tag in (("ing", "VBG"), ("ed", "VBD")):
+        if word.endswith(suffix):
+            stem = word.removesuffix(suffix)
+            if word.endswith("eed") or not _VOWELS.intersection(stem):
+                return None
+            return tag
+    # Base forms such as 'discuss' and 'focus' are not third person singular.
+    if word.endswith("s") and not word.endswith(("ss", "us")):
+        return "VBZ"
+    return "VBP"
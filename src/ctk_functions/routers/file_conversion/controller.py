@@ -10,6 +10,8 @@ import pypandoc
 from docx import document, shared
 from docx.oxml import ns
 
+from ctk_functions.core import packaging
+
 
 def markdown2docx(
     markdown: str,
@@ -48,8 +50,7 @@ def markdown2docx(
             for paragraph in doc.paragraphs:
                 extend_paragraph = cmi_docx.ExtendParagraph(paragraph)
                 extend_paragraph.format(formatting)
-        doc.save(docx_file.name)
-        return docx_file.read()
+        return packaging.document_to_bytes(doc)
 
 
 def _mark_warnings_as_red(doc: document.Document) -> None:
@@ -1,12 +1,10 @@
 """Business logic for the intake endpoints."""
 
-import io
-
 import fastapi
 import pydantic
 from fastapi import status
 
-from ctk_functions.core import config, exceptions
+from ctk_functions.core import config, exceptions, packaging
 from ctk_functions.microservices import redcap
 from ctk_functions.routers.intake.intake_processing import parser, writer
 
@@ -42,6 +40,4 @@ async def get_intake_report(
     await report.transform()
 
     logger.debug("Successfully generated intake report.")
-    out = io.BytesIO()
-    report.report.document.save(out)
-    return out.getvalue()
+    return packaging.document_to_bytes(report.report.document)
@@ -1,17 +1,12 @@
 """Utilities for correcting grammar and syntax."""
 
-import asyncio
+from collections.abc import Iterable
 
-import cmi_docx
-import spacy
 from docx import document
 from docx.text import paragraph
 
-from ctk_functions.core import config
-from ctk_functions.microservices import language_tool
-
-settings = config.get_settings()
-NLP = spacy.load("en_core_web_sm", enable=["parser"])
+from ctk_functions.core import config, word
+from ctk_functions.microservices import language_servers, language_tool
 
 logger = config.get_logger()
 
@@ -50,26 +45,48 @@ class DocumentCorrections:
         self.document = doc
         self.correcter = language_tool.LanguageCorrecter(
             enabled_rules or DEFAULT_LANGUAGE_RULES,
-            settings.LANGUAGE_TOOL_URL,
+            language_servers.get_server_urls(),
         )
 
-    async def correct(self) -> None:
-        """Makes corrections based on the enabled and disabled rules."""
-        await asyncio.gather(
-            *[self._correct_paragraph(para) for para in self.document.paragraphs],
-        )
+    async def correct(
+        self, paragraphs: Iterable[paragraph.Paragraph] | None = None
+    ) -> None:
+        """Makes corrections based on the enabled and disabled rules.
 
-    async def _correct_paragraph(self, para: paragraph.Paragraph) -> None:
-        """Corrects conjugations in a single paragraph.
+        All paragraphs are checked together in as few requests as possible.
+
+        Args:
+            paragraphs: The paragraphs to correct, defaults to all paragraphs of
+                the document. Blank paragraphs are skipped.
+        """
+        if paragraphs is None:
+            paragraphs = self.document.paragraphs
+        paragraphs = [para for para in paragraphs if para.text.strip()]
+        texts = [para.text for para in paragraphs]
+        batch_replacements = await self.correcter.provide_batch_replacements(texts)
+        for para, text, replacements in zip(
+            paragraphs, texts, batch_replacements, strict=True
+        ):
+            if replacements:
+                self._correct_paragraph(para, text, replacements)
+
+    @staticmethod
+    def _correct_paragraph(
+        para: paragraph.Paragraph,
+        text: str,
+        replacements: list[language_tool.ReplacementData],
+    ) -> None:
+        """Applies the replacements to a single paragraph.
 
         Args:
             para: The paragraph to correct.
+            text: The text of the paragraph before the corrections.
+            replacements: The replacements, in the order they are to be applied.
         """
-        replacements = await self.correcter.provide_replacements(para.text)
-        extended_paragraph = cmi_docx.ExtendParagraph(para)
-        for replacement in replacements:
-            extended_paragraph.replace_between(
-                replacement.start,
-                replacement.end,
-                replacement.text,
-            )
+        word.replace_in_runs(
+            para,
+            (
+                (replacement.start, replacement.end, replacement.text)
+                for replacement in language_tool.merge_replacements(text, replacements)
+            ),
+        )
@@ -92,6 +92,14 @@ class ReportWriter:
             if "MENTAL STATUS EXAMINATION AND TESTING BEHAVIORAL OBSERVATIONS"
             in paragraph.text
         )
+        # Paragraphs with generated text, i.e. the template paragraphs with
+        # patient information and all inserted paragraphs except headings. Static
+        # template text is not sent for language corrections.
+        self.dynamic_paragraphs = [
+            paragraph
+            for paragraph in self.report.document.paragraphs
+            if "{{" in paragraph.text
+        ]
 
         self.llm = writer_llm.WriterLlm(
             intake.patient.first_name,
@@ -1225,7 +1233,7 @@ class ReportWriter:
         """Applies various grammatical and styling corrections."""
         logger.debug("Applying corrections to the report.")
         document_corrector = language_utils.DocumentCorrections(self.report.document)
-        await document_corrector.correct()
+        await document_corrector.correct(self.dynamic_paragraphs)
 
     def add_signatures(self) -> None:
         """Adds the signatures to the report.
@@ -1340,7 +1348,12 @@ class ReportWriter:
             for index in range(len(self.report.document.paragraphs))
             if self.report.document.paragraphs[index].text == self.insert_before.text
         )
-        return self.report.insert_paragraph_by_text(insertion_index, text, style.value)  # type: ignore[no-any-return] # mypy doesn't seem to recognize the return type for an unknown reason.
+        paragraph: docx_paragraph.Paragraph = self.report.insert_paragraph_by_text(
+            insertion_index, text, style.value
+        )
+        if style == word.StyleName.NORMAL:
+            self.dynamic_paragraphs.append(paragraph)
+        return paragraph
 
     def set_superscripts(self) -> None:
         """Sets ordinal suffixes to superscript."""
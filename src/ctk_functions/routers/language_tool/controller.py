@@ -1,11 +1,8 @@
 """Functions for converting files between different formats."""
 
-from ctk_functions.core import config
-from ctk_functions.microservices import language_tool
+from ctk_functions.microservices import language_servers, language_tool
 from ctk_functions.routers.language_tool import schemas
 
-settings = config.get_settings()
-
 
 async def run_language_tool(body: schemas.PostLanguageToolRequest) -> str:
     """Corrects the grammar of the input text.
@@ -18,6 +15,24 @@ async def run_language_tool(body: schemas.PostLanguageToolRequest) -> str:
     """
     correcter = language_tool.LanguageCorrecter(
         body.rules,
-        settings.LANGUAGE_TOOL_URL,
+        language_servers.get_server_urls(),
     )
     return await correcter.correct(body.text)
+
+
+async def run_language_tool_batch(
+    body: schemas.PostLanguageToolBatchRequest,
+) -> list[str]:
+    """Corrects the grammar of multiple texts with the same rules.
+
+    Args:
+        body: The request body, see schemas for full description.
+
+    Returns:
+        The corrected texts, in the order of the request.
+    """
+    correcter = language_tool.LanguageCorrecter(
+        body.rules,
+        language_servers.get_server_urls(),
+    )
+    return await correcter.correct_batch(body.texts)
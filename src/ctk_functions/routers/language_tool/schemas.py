@@ -13,3 +13,16 @@ class PostLanguageToolRequest(pydantic.BaseModel):
 
     text: str
     rules: tuple[str, ...] = pydantic.Field(..., min_length=1)
+
+
+class PostLanguageToolBatchRequest(pydantic.BaseModel):
+    """POST LanguageTool batch request definition.
+
+    Attributes:
+        texts: The texts to correct.
+        rules: The rules to enable for all texts c.f. LanguageTool for a list of
+            rules.
+    """
+
+    texts: list[str] = pydantic.Field(..., min_length=1, max_length=1000)
+    rules: tuple[str, ...] = pydantic.Field(..., min_length=1)
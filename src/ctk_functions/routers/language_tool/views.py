@@ -20,3 +20,20 @@ async def post_language_tool(body: schemas.PostLanguageToolRequest) -> str:
         A FastAPI response containing the bytes of a .docx file.
     """
     return await controller.run_language_tool(body)
+
+
+@router.post("/language-tool/batch")
+async def post_language_tool_batch(
+    body: schemas.PostLanguageToolBatchRequest,
+) -> list[str]:
+    """POST endpoint for correcting multiple texts.
+
+    The texts are checked together in as few LanguageTool requests as possible.
+
+    Args:
+        body: The request body, see schemas for full description.
+
+    Returns:
+        The corrected texts, in the order of the request.
+    """
+    return await controller.run_language_tool_batch(body)
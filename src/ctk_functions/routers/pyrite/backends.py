@@ -0,0 +1,186 @@
+"""Data backends from which Pyrite reads the NextGen tables.
+
+The SQL backend reads from the live NextGen database. The file backend reads
+a read-only, memory-mapped SQLite export of the tables used by Pyrite, such
+that batch runs and offline benchmarks do not touch the production database.
+Both backends use the same models and queries; the file stores the tables
+without the nextgen schema prefix.
+"""
+
+import abc
+import contextlib
+import functools
+import pathlib
+import sqlite3
+from collections.abc import Generator, Sequence
+
+import sqlalchemy
+from sqlalchemy import engine
+from sqlalchemy.orm import session
+
+from ctk_functions.core import config, query_accounting
+from ctk_functions.microservices.sql import client, models
+from ctk_functions.routers.pyrite import snapshot
+
+logger = config.get_logger()
+
+# Collation of the NextGen string columns: case-insensitive, accent-sensitive.
+SQL_COLLATION = "SQL_Latin1_General_CP1_CI_AS"
+_EXPORT_BATCH_SIZE = 1000
+
+
+class DataBackend(abc.ABC):
+    """Source of the NextGen tables read by Pyrite."""
+
+    @abc.abstractmethod
+    def get_session(self) -> contextlib.AbstractContextManager[session.Session]:
+        """Gets an active session and auto-closes it."""
+
+
+class SqlBackend(DataBackend):
+    """Reads from the live NextGen database, preferring its read replicas."""
+
+    def get_session(self) -> contextlib.AbstractContextManager[session.Session]:
+        """Gets an active session and auto-closes it."""
+        return client.get_read_session()
+
+
+class FileBackend(DataBackend):
+    """Reads from a read-only SQLite export of the NextGen tables."""
+
+    def __init__(self, path: pathlib.Path, mmap_size: int) -> None:
+        """Initializes the file backend.
+
+        Args:
+            path: The path to the SQLite file, see export_to_file.
+            mmap_size: The maximum number of bytes of the file to memory-map.
+        """
+        if not path.is_file():
+            msg = f"Pyrite data file {path} does not exist."
+            raise FileNotFoundError(msg)
+        self.engine = create_file_engine(path, read_only=True, mmap_size=mmap_size)
+
+    @contextlib.contextmanager
+    def get_session(self) -> Generator[session.Session, None, None]:
+        """Gets an active session and auto-closes it."""
+        with session.Session(self.engine) as sess:
+            yield sess
+
+
+@functools.cache
+def get_backend() -> DataBackend:
+    """Gets the data backend selected by the PYRITE_DATA_BACKEND setting."""
+    settings = config.get_settings()
+    if settings.PYRITE_DATA_BACKEND == "file":
+        logger.info("Reading Pyrite data from %s.", settings.PYRITE_DATA_FILE)
+        return FileBackend(
+            settings.PYRITE_DATA_FILE,  # type: ignore[arg-type] # Checked by settings.
+            settings.PYRITE_DATA_FILE_MMAP_SIZE,
+        )
+    return SqlBackend()
+
+
+def create_file_engine(
+    path: pathlib.Path, *, read_only: bool, mmap_size: int = 0
+) -> engine.Engine:
+    """Creates an engine for a SQLite file with the NextGen tables.
+
+    Args:
+        path: The path to the SQLite file.
+        read_only: Whether to open the file in read-only mode.
+        mmap_size: The maximum number of bytes of the file to memory-map.
+
+    Returns:
+        The engine; statements on the nextgen schema are mapped to the file.
+    """
+    mode = "ro" if read_only else "rwc"
+
+    def connect() -> sqlite3.Connection:
+        connection = sqlite3.connect(
+            f"{path.resolve().as_uri()}?mode={mode}",
+            uri=True,
+            check_same_thread=False,
+        )
+        connection.create_collation(SQL_COLLATION, _compare_case_insensitive)
+        connection.execute(f"PRAGMA mmap_size = {int(mmap_size)}")
+        return connection
+
+    file_engine = sqlalchemy.create_engine("sqlite://", creator=connect)
+    query_accounting.instrument(file_engine)
+    return file_engine.execution_options(schema_translate_map={"nextgen": None})
+
+
+def export_to_file(path: pathlib.Path, mrns: Sequence[str] | None = None) -> None:
+    """Exports the tables used by Pyrite from the database to a SQLite file.
+
+    Args:
+        path: The path of the SQLite file, must not exist yet.
+        mrns: The MRNs of the participants to export, all participants if None.
+    """
+    if path.exists():
+        msg = f"Pyrite data file {path} already exists."
+        raise FileExistsError(msg)
+
+    tables = [table.__table__ for _, table in snapshot.SNAPSHOT_TABLES]
+    target = create_file_engine(path, read_only=False)
+    models.Base.metadata.create_all(target, tables=tables)  # type: ignore[arg-type]
+
+    source = SqlBackend()
+    with source.get_session() as sess, target.begin() as connection:
+        id_batches = [None] if mrns is None else _fetch_id_batches(sess, mrns)
+        for id_property, table in snapshot.SNAPSHOT_TABLES:
+            n_rows = 0
+            for ids in id_batches:
+                statement = sqlalchemy.select(table.__table__)
+                if ids is not None:
+                    column = getattr(table, id_property)
+                    statement = statement.where(column.in_(ids[id_property]))
+                result = sess.execute(
+                    statement, execution_options={"yield_per": _EXPORT_BATCH_SIZE}
+                )
+                for partition in result.mappings().partitions():
+                    connection.execute(
+                        sqlalchemy.insert(table.__table__),  # type: ignore[arg-type]
+                        [dict(row) for row in partition],
+                    )
+                    n_rows += len(partition)
+            logger.debug("Exported %s rows of %s.", n_rows, table.__name__)
+    target.dispose()
+
+
+def _fetch_id_batches(
+    sess: session.Session, mrns: Sequence[str]
+) -> list[dict[str, list[object]]]:
+    """Fetches the identifiers of participants in batches.
+
+    Args:
+        sess: The session of the source database.
+        mrns: The MRNs of the participants.
+
+    Returns:
+        For each batch, the identifiers keyed by identifier property.
+    """
+    batches = []
+    for start in range(0, len(mrns), _EXPORT_BATCH_SIZE):
+        participants = sess.execute(
+            sqlalchemy.select(
+                models.CmiHbnIdTrack.MRN,
+                models.CmiHbnIdTrack.GUID,
+                models.CmiHbnIdTrack.person_id,
+            ).where(
+                models.CmiHbnIdTrack.MRN.in_(mrns[start : start + _EXPORT_BATCH_SIZE])
+            )
+        ).all()
+        batches.append(
+            {
+                "MRN": [participant.MRN for participant in participants],
+                "EID": [participant.GUID for participant in participants],
+                "person_id": [participant.person_id for participant in participants],
+            }
+        )
+    return batches
+
+
+def _compare_case_insensitive(left: str, right: str) -> int:
+    left, right = left.casefold(), right.casefold()
+    return (left > right) - (left < right)
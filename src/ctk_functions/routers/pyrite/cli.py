@@ -0,0 +1,52 @@
+"""Command line interfaces for maintaining local copies of the Pyrite data.
+
+Usage:
+    pyrite-snapshot [MRN ...]
+    pyrite-export-data PATH [MRN ...]
+
+Without MRNs, pyrite-snapshot refreshes all snapshots older than the maximum
+age, which is suitable for running the refresh on a schedule, e.g. as a cron
+job. pyrite-export-data writes the tables used by Pyrite to a SQLite file for
+the file data backend.
+"""
+
+import argparse
+import pathlib
+from collections.abc import Sequence
+
+from ctk_functions.routers.pyrite import backends, controller
+
+
+def main(argv: Sequence[str] | None = None) -> None:
+    """Refreshes the Pyrite snapshots.
+
+    Args:
+        argv: The command line arguments, defaults to sys.argv.
+    """
+    parser = argparse.ArgumentParser(description="Refreshes Pyrite snapshots.")
+    parser.add_argument(
+        "mrns",
+        nargs="*",
+        help="MRNs to refresh; refreshes all stale snapshots if omitted.",
+    )
+    args = parser.parse_args(argv)
+    controller.refresh_snapshots(tuple(args.mrns) or None)
+
+
+def export_main(argv: Sequence[str] | None = None) -> None:
+    """Exports the tables used by Pyrite to a SQLite file.
+
+    Args:
+        argv: The command line arguments, defaults to sys.argv.
+    """
+    parser = argparse.ArgumentParser(
+        description="Exports the Pyrite tables for the file data backend."
+    )
+    parser.add_argument("path", type=pathlib.Path, help="The file to create.")
+    parser.add_argument(
+        "mrns",
+        nargs="*",
+        help="MRNs to export; exports all participants if omitted.",
+    )
+    args = parser.parse_args(argv)
+    backends.export_to_file(args.path, tuple(args.mrns) or None)
@@ -1,7 +1,9 @@
 """Business logic for the Pyrite endpoints."""
 
-import io
-from typing import Any
+import dataclasses
+import datetime
+from collections.abc import Generator, Sequence
+from typing import Any, Literal
 
 import cmi_docx
 import docx
@@ -9,9 +11,9 @@ import fastapi
 from docx.text import paragraph as docx_paragraph
 from fastapi import status
 
-from ctk_functions.core import config
+from ctk_functions.core import config, packaging
 from ctk_functions.microservices.sql import models
-from ctk_functions.routers.pyrite import sql_data
+from ctk_functions.routers.pyrite import export, preview, snapshot, sql_data
 from ctk_functions.routers.pyrite.reports import reports
 from ctk_functions.routers.pyrite.tables import (
     base,
@@ -37,9 +39,86 @@ def get_pyrite_report(mrn: str) -> bytes:
     report.create(version="alabaster")
 
     logger.debug("Successfully generated Pyrite report.")
-    out = io.BytesIO()
-    report.document.save(out)
-    return out.getvalue()
+    return packaging.document_to_bytes(report.document)
+
+
+def get_pyrite_preview(
+    mrn: str, output_format: Literal["json", "html"]
+) -> preview.PreviewDocument | str:
+    """Generates a preview of a Pyrite report for a given MRN.
+
+    The preview contains the same structure and styling as the .docx report
+    but does not construct a Word document.
+
+    Args:
+        mrn: The participant's identifier.
+        output_format: Whether to return the preview as JSON or HTML.
+
+    Returns:
+        The preview document if the output format is JSON, otherwise the
+        HTML string.
+    """
+    logger.debug("Entered controller of get_pyrite_preview.")
+    with snapshot.use_record(mrn):
+        structure = reports.get_report_structure(mrn, version="alabaster")
+        document = preview.PreviewDocument(
+            nodes=[node for section in structure for node in section.to_preview()]
+        )
+        document.replace(_get_participant_replacements(mrn))
+
+    logger.debug("Successfully generated Pyrite preview.")
+    if output_format == "html":
+        return document.to_html()
+    return document
+
+
+def get_cohort_export(mrns: Sequence[str]) -> Generator[str, None, None]:
+    """Exports the Pyrite table data of a cohort of participants.
+
+    Args:
+        mrns: The MRNs of the participants.
+
+    Returns:
+        A generator of the CSV text in long format.
+    """
+    logger.debug("Entered controller of get_cohort_export.")
+    return export.iter_cohort_csv(mrns)
+
+
+def refresh_snapshots(mrns: Sequence[str] | None = None) -> tuple[str, ...]:
+    """Refreshes the Pyrite snapshots of participants.
+
+    The rows of the participants are read in batches with one query per table
+    per batch. Meant to be run on demand, or periodically without MRNs to keep
+    existing snapshots fresh.
+
+    Args:
+        mrns: The MRNs of the participants, if None then all snapshots older
+            than the maximum age are refreshed.
+
+    Returns:
+        The MRNs whose snapshots were refreshed.
+    """
+    logger.debug("Entered controller of refresh_snapshots.")
+    if not snapshot.is_enabled():
+        raise fastapi.HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Pyrite snapshots are not enabled.",
+        )
+    if mrns is None:
+        mrns = snapshot.get_stale_mrns()
+
+    refreshed: list[str] = []
+    for start in range(0, len(mrns), export.CHUNK_SIZE):
+        chunk = mrns[start : start + export.CHUNK_SIZE]
+        refreshed_at = datetime.datetime.now(datetime.UTC)
+        with sql_data.prefetch(chunk) as found_mrns:
+            records = {mrn: _read_snapshot(mrn) for mrn in found_mrns}
+        snapshot.put_records(records, refreshed_at=refreshed_at)
+        refreshed.extend(records)
+
+    logger.info("Refreshed %s Pyrite snapshots.", len(refreshed))
+    return tuple(refreshed)
 
 
 class PyriteReport:
@@ -64,54 +143,22 @@ class PyriteReport:
             version: The version of the report to generate.
             **kwargs: Version-specific keyword arguments.
         """
-        structure = reports.get_report_structure(self._mrn, version, **kwargs)
-        for section in structure:
-            section.add_to(self.document)
+        with snapshot.use_record(self._mrn):
+            structure = reports.get_report_structure(self._mrn, version, **kwargs)
+            for section in structure:
+                section.add_to(self.document)
 
-        # As an artifact from using a template file, the first paragraph is empty.
-        # Delete it.
-        self._delete_paragraph(self.document.paragraphs[0])
+            # As an artifact from using a template file, the first paragraph is
+            # empty. Delete it.
+            self._delete_paragraph(self.document.paragraphs[0])
 
-        self._replace_participant_information()
-
-    def _get_participant(self) -> models.CmiHbnIdTrack:
-        """Fetches the participant's data from the SQL database.
-
-        Returns:
-            A row from the CMI_HB_IDTrack_t table.
-        """
-        sanitized_mrn = self._mrn.replace("\r", "").replace("\n", "")
-        logger.debug("Fetching participant %s.", sanitized_mrn)
-        try:
-            return sql_data.fetch_participant_row(  # type: ignore[no-any-return, unused-ignore] # Getting errors both when no-any-return is, and is not used.
-                "MRN", self._mrn, models.CmiHbnIdTrack
-            )
-        except base.TableDataNotFoundError as exception_info:
-            raise fastapi.HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="MRN not found.",
-            ) from exception_info
+            self._replace_participant_information()
 
     def _replace_participant_information(self) -> None:
         """Replaces the patient information in the report."""
         logger.debug("Replacing patient information in the report.")
-        participant = self._get_participant()
-        first_name = participant.first_name
-        full_name = f"{first_name} {participant.last_name}"
-        first_name_possessive = (
-            f"{first_name}{"'" if first_name.endswith('s') else "'s"}"
-        )
-        replacements = {
-            "full_name": full_name,
-            "first_name_possessive": first_name_possessive,
-        }
-
-        for template, replacement in replacements.items():
-            template_formatted = "{{" + template.upper() + "}}"
-            cmi_docx.ExtendDocument(self.document).replace(
-                template_formatted,
-                replacement,
-            )
+        for needle, replacement in _get_participant_replacements(self._mrn).items():
+            cmi_docx.ExtendDocument(self.document).replace(needle, replacement)
 
     @staticmethod
     def _delete_paragraph(para: docx_paragraph.Paragraph) -> None:
@@ -123,3 +170,67 @@ class PyriteReport:
         p_elem = para._element  # noqa: SLF001
         p_elem.getparent().remove(p_elem)
         p_elem._p = p_elem._element = None  # noqa: SLF001
+
+
+def _get_participant(mrn: str) -> models.CmiHbnIdTrack:
+    """Fetches the participant's data from the SQL database.
+
+    Args:
+        mrn: The participant's unique identifier.
+
+    Returns:
+        A row from the CMI_HB_IDTrack_t table.
+    """
+    sanitized_mrn = mrn.replace("\r", "").replace("\n", "")
+    logger.debug("Fetching participant %s.", sanitized_mrn)
+    try:
+        return sql_data.fetch_participant_row(  # type: ignore[no-any-return, unused-ignore] # Getting errors both when no-any-return is, and is not used.
+            "MRN", mrn, models.CmiHbnIdTrack
+        )
+    except base.TableDataNotFoundError as exception_info:
+        raise fastapi.HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="MRN not found.",
+        ) from exception_info
+
+
+def _read_snapshot(mrn: str) -> snapshot.SnapshotRecord:
+    """Reads the snapshot of a participant from the database.
+
+    Args:
+        mrn: The participant's unique identifier.
+
+    Returns:
+        The participant's snapshot.
+    """
+    rows: dict[type[models.Base], models.Base | None] = {}
+    for id_property, table in snapshot.SNAPSHOT_TABLES:
+        try:
+            rows[table] = sql_data.fetch_participant_row(id_property, mrn, table)
+        except base.TableDataNotFoundError:
+            rows[table] = None
+    ids = dataclasses.asdict(sql_data.mrn_to_ids(mrn))
+    return snapshot.SnapshotRecord.from_rows(ids, rows)
+
+
+def _get_participant_replacements(mrn: str) -> dict[str, str]:
+    """Gets the template replacements of the participant's information.
+
+    Args:
+        mrn: The participant's unique identifier.
+
+    Returns:
+        Mapping of template strings to the participant's information.
+    """
+    participant = _get_participant(mrn)
+    first_name = participant.first_name
+    full_name = f"{first_name} {participant.last_name}"
+    first_name_possessive = f"{first_name}{"'" if first_name.endswith('s') else "'s"}"
+    replacements = {
+        "full_name": full_name,
+        "first_name_possessive": first_name_possessive,
+    }
+    return {
+        "{{" + template.upper() + "}}": replacement
+        for template, replacement in replacements.items()
+    }
@@ -0,0 +1,117 @@
+"""Export of the Pyrite table data of a cohort of participants."""
+
+import csv
+import io
+from collections.abc import Generator, Sequence
+
+from ctk_functions.core import config
+from ctk_functions.routers.pyrite import sql_data
+from ctk_functions.routers.pyrite.tables import (
+    academic_achievement,
+    base,
+    cbc,
+    celf5,
+    conners3,
+    ctopp2,
+    grooved_pegboard,
+    language,
+    mfq,
+    scared,
+    scq,
+    srs,
+    swan,
+    wisc_composite,
+    wisc_subtest,
+)
+
+logger = config.get_logger()
+
+CSV_HEADER = ("mrn", "table", "row", "column", "value")
+CHUNK_SIZE = 100
+
+
+def get_data_producers() -> dict[str, type[base.DataProducer]]:
+    """Gets the data producers of all Pyrite tables.
+
+    Returns:
+        Mapping of table names to their data producers.
+    """
+    tables: dict[str, type[base.WordTableSection]] = {
+        "academic_achievement": academic_achievement.AcademicAchievementTable,
+        "asr": cbc.AsrTable,
+        "cbcl": cbc.CbclTable,
+        "celf5": celf5.Celf5Table,
+        "conners3": conners3.Conners3Table,
+        "ctopp2": ctopp2.Ctopp2Table,
+        "grooved_pegboard": grooved_pegboard.GroovedPegboardTable,
+        "language": language.LanguageTable,
+        "mfq": mfq.MfqTable,
+        "scared": scared.ScaredTable,
+        "scq": scq.ScqTable,
+        "srs": srs.SrsTable,
+        "swan": swan.SwanTable,
+        "trf": cbc.TrfTable,
+        "wisc_composite": wisc_composite.WiscCompositeTable,
+        "wisc_subtest": wisc_subtest.WiscSubtestTable,
+        "ysr": cbc.YsrTable,
+    }
+    return {name: table.data_source for name, table in tables.items()}
+
+
+def iter_cohort_csv(
+    mrns: Sequence[str], chunk_size: int = CHUNK_SIZE
+) -> Generator[str, None, None]:
+    """Exports the Pyrite table data of a cohort as CSV in long format.
+
+    Each line holds a single cell of a table body: the participant's MRN, the
+    table name, the row index, the column header, and the cell value. The
+    participants are processed in chunks; the database is queried once per table
+    per chunk. The producers' caches are bypassed, such that no data is retained
+    between chunks.
+
+    Args:
+        mrns: The MRNs of the participants.
+        chunk_size: The number of participants to process at once.
+
+    Yields:
+        The CSV text, one chunk of participants at a time.
+    """
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(CSV_HEADER)
+    yield buffer.getvalue()
+
+    for start in range(0, len(mrns), chunk_size):
+        chunk = mrns[start : start + chunk_size]
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        with sql_data.prefetch(chunk) as found_mrns:
+            if len(found_mrns) < len(chunk):
+                logger.warning(
+                    "Skipping %s MRNs that were not found.",
+                    len(chunk) - len(found_mrns),
+                )
+            for mrn in found_mrns:
+                writer.writerows(_participant_rows(mrn))
+        yield buffer.getvalue()
+
+
+def _participant_rows(
+    mrn: str,
+) -> Generator[tuple[str, str, int, str, str], None, None]:
+    """Converts the tables of a participant to long format rows.
+
+    Args:
+        mrn: The participant's unique identifier.
+
+    Yields:
+        Rows of mrn, table name, row index, column header, and cell value.
+    """
+    for name, producer in get_data_producers().items():
+        try:
+            header, *body = producer.fetch_uncached(mrn)
+        except base.TableDataNotFoundError:
+            continue
+        for row_index, row in enumerate(body):
+            for column, value in zip(header, row, strict=True):
+                yield mrn, name, row_index, column, value
@@ -0,0 +1,353 @@
+"""Lightweight preview representation of Pyrite reports.
+
+The preview mirrors the structure and cell styling of the .docx report, but is
+built without python-docx so that it can be serialized to JSON or HTML for
+on-screen display.
+"""
+
+import base64
+import functools
+import html
+import pathlib
+from collections.abc import Iterable, Mapping
+from typing import Annotated, Literal
+
+import cmi_docx
+import pydantic
+from docx.enum import text as enum_text
+
+_ALIGNMENTS = {
+    enum_text.WD_PARAGRAPH_ALIGNMENT.LEFT: "left",
+    enum_text.WD_PARAGRAPH_ALIGNMENT.CENTER: "center",
+    enum_text.WD_PARAGRAPH_ALIGNMENT.RIGHT: "right",
+    enum_text.WD_PARAGRAPH_ALIGNMENT.JUSTIFY: "justify",
+}
+
+_HEADING_TAGS = {
+    "Title": "h1",
+    "Heading 1": "h1",
+    "Heading 1 Centered": "h1",
+    "Heading 2": "h2",
+    "Heading 3": "h3",
+}
+
+
+class PreviewStyle(pydantic.BaseModel):
+    """Resolved styling of a text element or table cell.
+
+    Attributes:
+        bold: Whether the text is bold.
+        italic: Whether the text is italic.
+        font_size: The font size in points.
+        font_rgb: The font color.
+        background_rgb: The background color, only used for table cells.
+        alignment: The horizontal alignment of the text.
+        borders: Mapping of border sides (e.g. "top") to their size in
+            eighths of a point, only used for table cells.
+    """
+
+    bold: bool | None = None
+    italic: bool | None = None
+    font_size: int | None = None
+    font_rgb: tuple[int, int, int] | None = None
+    background_rgb: tuple[int, int, int] | None = None
+    alignment: Literal["left", "center", "right", "justify"] | None = None
+    borders: dict[str, int] = pydantic.Field(default_factory=dict)
+
+    def update(
+        self,
+        style: cmi_docx.CellStyle | cmi_docx.ParagraphStyle | cmi_docx.RunStyle,
+    ) -> None:
+        """Applies a cmi-docx style on top of the current style.
+
+        Mirrors the behavior of formatting a Word element sequentially: values
+        that are None in the new style leave the current value untouched.
+
+        Args:
+            style: The style to apply.
+        """
+        if isinstance(style, cmi_docx.CellStyle):
+            if style.paragraph is not None:
+                self.update(style.paragraph)
+            if style.background_rgb is not None:
+                self.background_rgb = style.background_rgb
+            for border in style.borders or ():
+                for side in border.sides:
+                    self.borders[side] = border.sz or 0
+            return
+
+        for attribute in ("bold", "italic", "font_size", "font_rgb"):
+            value = getattr(style, attribute)
+            if value is not None:
+                setattr(self, attribute, value)
+
+        alignment = getattr(style, "alignment", None)
+        if alignment is not None:
+            self.alignment = _ALIGNMENTS.get(alignment)  # type: ignore[assignment]
+
+    def to_css(self) -> str:
+        """Converts the style to an inline CSS declaration.
+
+        Returns:
+            The CSS declaration, empty if no styling is set.
+        """
+        declarations = []
+        if self.bold is not None:
+            declarations.append(f"font-weight: {'bold' if self.bold else 'normal'}")
+        if self.italic is not None:
+            declarations.append(f"font-style: {'italic' if self.italic else 'normal'}")
+        if self.font_size is not None:
+            declarations.append(f"font-size: {self.font_size}pt")
+        if self.font_rgb is not None:
+            declarations.append(f"color: {_rgb_to_hex(self.font_rgb)}")
+        if self.background_rgb is not None:
+            declarations.append(f"background-color: {_rgb_to_hex(self.background_rgb)}")
+        if self.alignment is not None:
+            declarations.append(f"text-align: {self.alignment}")
+        declarations.extend(
+            # Word border sizes are in eighths of a point.
+            f"border-{side}: {size / 8:g}pt solid"
+            for side, size in self.borders.items()
+        )
+        return "; ".join(declarations)
+
+
+class PreviewRun(pydantic.BaseModel):
+    """A run of text within a paragraph.
+
+    Attributes:
+        text: The text of the run.
+        style_name: The name of the Word character style, if any.
+        style: The direct formatting of the run.
+    """
+
+    text: str
+    style_name: str | None = None
+    style: PreviewStyle = pydantic.Field(default_factory=PreviewStyle)
+
+
+class PreviewParagraph(pydantic.BaseModel):
+    """A paragraph of the report.
+
+    Attributes:
+        type: Discriminator of the node type.
+        style_name: The name of the Word paragraph style, if any.
+        style: The direct formatting of the paragraph.
+        runs: The runs of the paragraph.
+    """
+
+    type: Literal["paragraph"] = "paragraph"
+    style_name: str | None = None
+    style: PreviewStyle = pydantic.Field(default_factory=PreviewStyle)
+    runs: list[PreviewRun] = pydantic.Field(default_factory=list)
+
+    @property
+    def text(self) -> str:
+        """The text content of the paragraph."""
+        return "".join(run.text for run in self.runs)
+
+
+class PreviewCell(pydantic.BaseModel):
+    """A cell of a table.
+
+    Cells that are covered by a merged cell are omitted from the preview; the
+    covering cell denotes its extent with row_span and col_span.
+
+    Attributes:
+        content: The text content of the cell.
+        style: The resolved styling of the cell.
+        width_cm: The width of the cell in centimeters, if set.
+        row_span: The number of rows this cell spans.
+        col_span: The number of columns this cell spans.
+    """
+
+    content: str
+    style: PreviewStyle = pydantic.Field(default_factory=PreviewStyle)
+    width_cm: float | None = None
+    row_span: int = 1
+    col_span: int = 1
+
+
+class PreviewTable(pydantic.BaseModel):
+    """A table of the report.
+
+    Attributes:
+        type: Discriminator of the node type.
+        rows: The visible cells of each row.
+    """
+
+    type: Literal["table"] = "table"
+    rows: list[list[PreviewCell]]
+
+
+class PreviewPageBreak(pydantic.BaseModel):
+    """A page break in the report."""
+
+    type: Literal["page_break"] = "page_break"
+
+
+class PreviewImage(pydantic.BaseModel):
+    """An image in the report.
+
+    Attributes:
+        type: Discriminator of the node type.
+        name: The file name of the image.
+    """
+
+    type: Literal["image"] = "image"
+    name: str
+    _path: pathlib.Path | None = None
+
+    @classmethod
+    def from_path(cls, path: pathlib.Path) -> "PreviewImage":
+        """Creates an image node from a file on disk.
+
+        Args:
+            path: The path to the image.
+
+        Returns:
+            The image node.
+        """
+        image = cls(name=path.name)
+        image._path = path
+        return image
+
+
+PreviewNode = Annotated[
+    PreviewParagraph | PreviewTable | PreviewPageBreak | PreviewImage,
+    pydantic.Field(discriminator="type"),
+]
+
+
+class PreviewDocument(pydantic.BaseModel):
+    """The preview of a complete report.
+
+    Attributes:
+        nodes: The paragraphs, tables, page breaks, and images of the report in
+            order of appearance.
+    """
+
+    nodes: list[PreviewNode] = pydantic.Field(default_factory=list)
+
+    def replace(self, replacements: Mapping[str, str]) -> None:
+        """Replaces text throughout the document.
+
+        Args:
+            replacements: Mapping of needles to their replacements.
+        """
+        for node in self.nodes:
+            if isinstance(node, PreviewParagraph):
+                for run in node.runs:
+                    run.text = _replace_all(run.text, replacements)
+            elif isinstance(node, PreviewTable):
+                for row in node.rows:
+                    for cell in row:
+                        cell.content = _replace_all(cell.content, replacements)
+
+    def to_html(self) -> str:
+        """Renders the document as an HTML fragment.
+
+        Returns:
+            The HTML representation of the report.
+        """
+        return "\n".join(_node_to_html(node) for node in self.nodes)
+
+
+def paragraph(
+    text: str,
+    style_name: str | None = None,
+    style: cmi_docx.ParagraphStyle | None = None,
+) -> PreviewParagraph:
+    """Convenience function for creating a single-run paragraph.
+
+    Args:
+        text: The text of the paragraph.
+        style_name: The name of the Word paragraph style.
+        style: Direct formatting of the paragraph.
+
+    Returns:
+        The paragraph node.
+    """
+    preview_style = PreviewStyle()
+    if style is not None:
+        preview_style.update(style)
+    return PreviewParagraph(
+        style_name=style_name,
+        style=preview_style,
+        runs=[PreviewRun(text=text)],
+    )
+
+
+def _replace_all(text: str, replacements: Mapping[str, str]) -> str:
+    for needle, replacement in replacements.items():
+        text = text.replace(needle, replacement)
+    return text
+
+
+def _node_to_html(node: PreviewNode) -> str:
+    """Renders a single node as HTML."""
+    if isinstance(node, PreviewParagraph):
+        return _paragraph_to_html(node)
+    if isinstance(node, PreviewTable):
+        return _table_to_html(node.rows)
+    if isinstance(node, PreviewPageBreak):
+        return '<hr class="page-break">'
+    return f'<img alt="{html.escape(node.name)}" src="{_image_source(node)}">'
+
+
+def _paragraph_to_html(para: PreviewParagraph) -> str:
+    tag = _HEADING_TAGS.get(para.style_name or "", "p")
+    class_name = (para.style_name or "Normal").lower().replace(" ", "-")
+    runs = "".join(_run_to_html(run) for run in para.runs)
+    attributes = f' class="{class_name}"'
+    if css := para.style.to_css():
+        attributes += f' style="{css}"'
+    return f"<{tag}{attributes}>{runs}</{tag}>"
+
+
+def _table_to_html(rows: Iterable[Iterable[PreviewCell]]) -> str:
+    html_rows = []
+    for row in rows:
+        html_cells = []
+        for cell in row:
+            attributes = ""
+            if cell.row_span > 1:
+                attributes += f' rowspan="{cell.row_span}"'
+            if cell.col_span > 1:
+                attributes += f' colspan="{cell.col_span}"'
+            css = cell.style.to_css()
+            if cell.width_cm is not None:
+                css = "; ".join(filter(None, (css, f"width: {cell.width_cm:g}cm")))
+            if css:
+                attributes += f' style="{css}"'
+            html_cells.append(f"<td{attributes}>{_text_to_html(cell.content)}</td>")
+        html_rows.append(f"<tr>{''.join(html_cells)}</tr>")
+    return f"<table>{''.join(html_rows)}</table>"
+
+
+def _run_to_html(run: PreviewRun) -> str:
+    text = _text_to_html(run.text)
+    if css := run.style.to_css():
+        return f'<span style="{css}">{text}</span>'
+    return text
+
+
+def _text_to_html(text: str) -> str:
+    return html.escape(text).replace("\t", "&emsp;").replace("\n", "<br>")
+
+
+def _image_source(image: PreviewImage) -> str:
+    """Gets the source of an image; embeds local images as a data URI."""
+    if image._path is None:  # noqa: SLF001
+        return html.escape(image.name)
+    return _data_uri(image._path)  # noqa: SLF001
+
+
+@functools.lru_cache
+def _data_uri(path: pathlib.Path) -> str:
+    encoded = base64.b64encode(path.read_bytes()).decode("ascii")
+    return f"data:image/{path.suffix.lstrip('.')};base64,{encoded}"
+
+
+def _rgb_to_hex(rgb: tuple[int, int, int]) -> str:
+    return "#{:02X}{:02X}{:02X}".format(*rgb)
@@ -1,7 +1,7 @@
 """Contains dataclasses to build the introduction page."""
 
-from collections.abc import Generator, Iterable
-from typing import cast
+from collections.abc import Generator, Iterable, Mapping, Sequence
+from typing import Any, cast
 
 import cmi_docx
 import pydantic
@@ -47,14 +47,22 @@ class TestOverview(pydantic.BaseModel):
         Returns:
             The associated data.
         """
-        if not self.columns:
-            return None
-
-        for column in self.columns:
-            data = sql_data.fetch_participant_row(
-                "person_id", mrn, column.parent.entity
-            )
-            test_date = getattr(data, column.key, None)
+        return _fetch_test_dates(mrn, [self])[0]
+
+    def select_data(
+        self, rows: Mapping[type[models.Base], Mapping[str, Any]]
+    ) -> sqlalchemy.Date | None:
+        """Selects data from the first non-null column of prefetched rows.
+
+        Args:
+            rows: Mapping of tables to the participant's values in those tables,
+                must contain all columns of this overview.
+
+        Returns:
+            The associated data.
+        """
+        for column in self.columns or ():
+            test_date = rows[_table_of(column)].get(column.key)
             if test_date:
                 return cast("sqlalchemy.Date", test_date)
         return None
@@ -200,8 +208,10 @@ def test_ids_to_introduction(
     used_overviews = [
         overview for test_id in test_ids for overview in _fetch_overviews(test_id)
     ]
+    test_dates = _fetch_test_dates(mrn, used_overviews)
     introduction_sections = [
-        _overview_to_sections(mrn, overview) for overview in used_overviews
+        _overview_to_sections(overview, test_date)
+        for overview, test_date in zip(used_overviews, test_dates, strict=True)
     ]
 
     return (
@@ -250,17 +260,54 @@ def test_ids_to_introduction(
     )
 
 
-def _overview_to_sections(mrn: str, overview: TestOverview) -> sections.Section:
-    """Converts a test description to a section.
+def _fetch_test_dates(
+    mrn: str, overviews: Sequence[TestOverview]
+) -> list[sqlalchemy.Date | None]:
+    """Fetches the administration dates of multiple tests.
+
+    The date columns of all overviews are collected and fetched with a single
+    query per table; the priority fallbacks are resolved afterwards.
 
     Args:
         mrn: The participant's unique identifier.
+        overviews: The descriptions of the tests.
+
+    Returns:
+        The administration date of each overview, None if not available.
+    """
+    columns_by_table: dict[type[models.Base], set[str]] = {}
+    for overview in overviews:
+        for column in overview.columns or ():
+            columns_by_table.setdefault(_table_of(column), set()).add(column.key)
+
+    rows = {
+        table: sql_data.fetch_participant_columns(
+            "person_id", mrn, table, tuple(sorted(column_names))
+        )
+        for table, column_names in columns_by_table.items()
+    }
+    return [overview.select_data(rows) for overview in overviews]
+
+
+def _table_of(
+    column: orm.InstrumentedAttribute[sqlalchemy.Date],
+) -> type[models.Base]:
+    """Gets the table model that a column belongs to."""
+    return cast("type[models.Base]", column.class_)
+
+
+def _overview_to_sections(
+    overview: TestOverview, test_date: sqlalchemy.Date | None
+) -> sections.Section:
+    """Converts a test description to a section.
+
+    Args:
         overview: The description of the test.
+        test_date: The date the test was administered.
 
     Returns:
         The section for this test.
     """
-    test_date = overview.get_data(mrn)
     administer_date = str(test_date) if test_date else "FILL-IN"
     date_style = None if test_date else cmi_docx.RunStyle(font_rgb=(255, 0, 0))
 
@@ -10,6 +10,7 @@ import pydantic
 from docx import document
 from docx.enum import text as enum_text
 
+from ctk_functions.routers.pyrite import preview
 from ctk_functions.routers.pyrite.tables import base
 
 VALID_PARAGRAPH_STYLES = Literal[
@@ -50,6 +51,27 @@ class Section(pydantic.BaseModel, abc.ABC):
         Handling of the conditional and subsections is done by self.add_to()
         """
 
+    def to_preview(self) -> list[preview.PreviewNode]:
+        """Converts the section to its preview representation.
+
+        Returns:
+            The preview nodes of this section and its subsections.
+        """
+        if not self.condition():
+            return []
+
+        nodes = self._to_preview()
+        for subsection in self.subsections:
+            nodes.extend(subsection.to_preview())
+        return nodes
+
+    @abc.abstractmethod
+    def _to_preview(self) -> list[preview.PreviewNode]:
+        """Converts this section to its preview representation.
+
+        Handling of the conditional and subsections is done by self.to_preview()
+        """
+
 
 class PageBreak(Section):
     """A page break in the report."""
@@ -66,6 +88,10 @@ class PageBreak(Section):
         para = doc.paragraphs[-1] if doc.paragraphs else doc.add_paragraph()
         para.add_run().add_break(enum_text.WD_BREAK.PAGE)
 
+    def _to_preview(self) -> list[preview.PreviewNode]:
+        """Converts the page break to its preview representation."""
+        return [preview.PreviewPageBreak()]
+
 
 class RunsSection(Section):
     """Represents a text block in the report structure with sub-formatting.
@@ -107,6 +133,23 @@ class RunsSection(Section):
             extend_run = cmi_docx.ExtendRun(run)
             extend_run.format(style)
 
+    def _to_preview(self) -> list[preview.PreviewNode]:
+        """Converts the section to its preview representation."""
+        para = preview.PreviewParagraph()
+        if isinstance(self.paragraph_style, cmi_docx.ParagraphStyle):
+            para.style.update(self.paragraph_style)
+        else:
+            para.style_name = self.paragraph_style
+
+        for text, style in zip(self.content, self.run_styles, strict=True):
+            run = preview.PreviewRun(text=text)
+            if style is None or isinstance(style, str):
+                run.style_name = style
+            else:
+                run.style.update(style)
+            para.runs.append(run)
+        return [para]
+
 
 class ParagraphSection(Section):
     """Represents a text block in the report structure.
@@ -139,6 +182,12 @@ class ParagraphSection(Section):
         else:
             doc.add_paragraph(self.content, self.style)
 
+    def _to_preview(self) -> list[preview.PreviewNode]:
+        """Converts the section to its preview representation."""
+        if isinstance(self.style, cmi_docx.ParagraphStyle):
+            return [preview.paragraph(self.content, style=self.style)]
+        return [preview.paragraph(self.content, style_name=self.style)]
+
 
 class TableSection(Section):
     """Represents a table section in the report structure."""
@@ -161,6 +210,16 @@ class TableSection(Section):
             if table.is_available():
                 table.add_to(doc)
 
+    def _to_preview(self) -> list[preview.PreviewNode]:
+        """Converts the section to its preview representation."""
+        nodes: list[preview.PreviewNode] = []
+        if self.title and self.level:
+            nodes.append(preview.paragraph(self.title, f"Heading {self.level}"))
+        for table in self.tables:
+            if table.is_available():
+                nodes.extend(table.to_preview())
+        return nodes
+
 
 class ImageSection(Section):
     """Represents a image section in the report structure."""
@@ -175,3 +234,7 @@ class ImageSection(Section):
             doc: The document to add the image to.
         """
         doc.add_picture(str(self.path))
+
+    def _to_preview(self) -> list[preview.PreviewNode]:
+        """Converts the image to its preview representation."""
+        return [preview.PreviewImage.from_path(self.path)]
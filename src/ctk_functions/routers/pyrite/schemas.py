@@ -0,0 +1,29 @@
+"""Schemas for the Pyrite endpoints."""
+
+import pydantic
+
+
+class PostCohortExportRequest(pydantic.BaseModel):
+    """POST schema for cohort exports of Pyrite table data."""
+
+    model_config = pydantic.ConfigDict(frozen=True)
+
+    mrns: tuple[str, ...] = pydantic.Field(..., min_length=1)
+
+
+class PostSnapshotRefreshRequest(pydantic.BaseModel):
+    """POST schema for refreshing Pyrite snapshots.
+
+    If no MRNs are provided, all snapshots that are older than the maximum age
+    are refreshed.
+    """
+
+    model_config = pydantic.ConfigDict(frozen=True)
+
+    mrns: tuple[str, ...] | None = None
+
+
+class PostSnapshotRefreshResponse(pydantic.BaseModel):
+    """Response schema for refreshing Pyrite snapshots."""
+
+    mrns: tuple[str, ...]
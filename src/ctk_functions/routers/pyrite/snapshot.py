@@ -0,0 +1,314 @@
+"""Materialized per-participant snapshots of the Pyrite data.
+
+A Pyrite report reads rows from over a dozen wide NextGen tables. A snapshot
+stores the non-null values of all these rows for a single participant as one
+JSON record in a local SQLite file, so that report data is served by a single
+primary key lookup; within use_record, that lookup is done once per report.
+Snapshots are written by the refresh job, see
+controller.refresh_snapshots, and are ignored once they are older than the
+PYRITE_SNAPSHOT_MAX_AGE setting.
+"""
+
+import contextlib
+import contextvars
+import dataclasses
+import datetime
+import decimal
+import functools
+import json
+import uuid
+from collections.abc import Callable, Generator, Mapping
+from typing import Any, Literal, TypeVar
+
+import sqlalchemy
+from sqlalchemy import engine
+from sqlalchemy.dialects import sqlite
+
+from ctk_functions.core import config, query_accounting
+from ctk_functions.microservices.sql import models
+from ctk_functions.routers.pyrite.tables import base
+
+logger = config.get_logger()
+
+T = TypeVar("T", bound=models.Base)
+
+# The tables read by Pyrite, and the identifier used to look them up.
+SNAPSHOT_TABLES: tuple[
+    tuple[Literal["person_id", "EID", "MRN"], type[models.Base]], ...
+] = (
+    ("MRN", models.CmiHbnIdTrack),
+    ("person_id", models.SummaryScores),
+    ("EID", models.Asr),
+    ("EID", models.Cbcl),
+    ("EID", models.Celf5),
+    ("EID", models.Conners3),
+    ("EID", models.GroovedPegboard),
+    ("EID", models.MfqParent),
+    ("EID", models.MfqSelf),
+    ("EID", models.ScaredParent),
+    ("EID", models.ScaredSelf),
+    ("EID", models.Scq),
+    ("EID", models.Srs),
+    ("EID", models.Swan),
+    ("EID", models.Trf),
+    ("EID", models.Wisc5),
+    ("EID", models.Ysr),
+)
+
+_metadata = sqlalchemy.MetaData()
+_snapshots = sqlalchemy.Table(
+    "pyrite_snapshots",
+    _metadata,
+    sqlalchemy.Column("mrn", sqlalchemy.String, primary_key=True),
+    # ISO 8601 in UTC, such that timestamps compare lexicographically.
+    sqlalchemy.Column("refreshed_at", sqlalchemy.String, nullable=False, index=True),
+    sqlalchemy.Column("record", sqlalchemy.Text, nullable=False),
+)
+
+# JSON cannot represent these column types; they are stored as tagged strings.
+_ENCODED_TYPES: tuple[tuple[str, type, Callable[[str], Any]], ...] = (
+    ("__decimal__", decimal.Decimal, decimal.Decimal),
+    ("__datetime__", datetime.datetime, datetime.datetime.fromisoformat),
+    ("__date__", datetime.date, datetime.date.fromisoformat),
+    ("__uuid__", uuid.UUID, uuid.UUID),
+)
+
+
+@dataclasses.dataclass(frozen=True)
+class SnapshotRecord:
+    """The Pyrite data of a single participant.
+
+    Attributes:
+        ids: The participant's MRN, EID, and person_id.
+        tables: Mapping of table model names to the participant's non-null
+            values in that table, None if the participant has no row.
+    """
+
+    ids: dict[str, Any]
+    tables: dict[str, dict[str, Any] | None]
+
+    @classmethod
+    def from_rows(
+        cls,
+        ids: Mapping[str, Any],
+        rows: Mapping[type[models.Base], models.Base | None],
+    ) -> "SnapshotRecord":
+        """Creates a snapshot from the participant's rows.
+
+        Args:
+            ids: The participant's identifiers.
+            rows: Mapping of table models to the participant's row in that
+                table, None if the participant has no row.
+
+        Returns:
+            The snapshot record.
+        """
+        tables: dict[str, dict[str, Any] | None] = {}
+        for table, row in rows.items():
+            if row is None:
+                tables[table.__name__] = None
+                continue
+            values = (
+                (attribute.key, getattr(row, attribute.key))
+                for attribute in sqlalchemy.inspect(table).column_attrs
+            )
+            tables[table.__name__] = {
+                key: value for key, value in values if value is not None
+            }
+        return cls(ids=dict(ids), tables=tables)
+
+    def covers(self, table: type[models.Base]) -> bool:
+        """Whether the snapshot contains the given table."""
+        return table.__name__ in self.tables
+
+    def get_row(self, table: type[T]) -> T:
+        """Gets the participant's row in the given table.
+
+        Args:
+            table: The table model, must be covered by the snapshot.
+
+        Returns:
+            A transient instance of the table model.
+        """
+        values = self.tables[table.__name__]
+        if values is None:
+            msg = "Table data not found in snapshot."
+            raise base.TableDataNotFoundError(msg)
+        return table(**values)
+
+    def to_json(self) -> str:
+        """Serializes the snapshot to JSON."""
+        return json.dumps(dataclasses.asdict(self), default=_encode_value)
+
+    @classmethod
+    def from_json(cls, text: str) -> "SnapshotRecord":
+        """Deserializes a snapshot from JSON."""
+        return cls(**json.loads(text, object_hook=_decode_value))
+
+
+# The MRN and snapshot of the participant whose report is being built.
+_active_record: contextvars.ContextVar[tuple[str, SnapshotRecord | None] | None] = (
+    contextvars.ContextVar("_active_record", default=None)
+)
+
+
+def is_enabled() -> bool:
+    """Whether a snapshot store is configured."""
+    return config.get_settings().PYRITE_SNAPSHOT_PATH is not None
+
+
+def get_record(mrn: str) -> SnapshotRecord | None:
+    """Gets the snapshot of a participant.
+
+    Args:
+        mrn: The participant's unique identifier.
+
+    Returns:
+        The snapshot, None if the store is disabled, or if there is no
+        snapshot that is newer than the maximum age.
+    """
+    active = _active_record.get()
+    if active is not None and active[0] == mrn:
+        return active[1]
+    return _read_record(mrn)
+
+
+@contextlib.contextmanager
+def use_record(mrn: str) -> Generator[SnapshotRecord | None, None, None]:
+    """Looks up the snapshot of a participant once for a whole report.
+
+    Within this context, get_record serves the participant's snapshot, or its
+    absence, from memory rather than querying the store on every call.
+
+    Args:
+        mrn: The participant's unique identifier.
+
+    Yields:
+        The snapshot, see get_record.
+    """
+    record = _read_record(mrn)
+    token = _active_record.set((mrn, record))
+    try:
+        yield record
+    finally:
+        _active_record.reset(token)
+
+
+def _read_record(mrn: str) -> SnapshotRecord | None:
+    """Reads the snapshot of a participant from the store, see get_record."""
+    snapshot_engine = _get_engine()
+    if snapshot_engine is None:
+        return None
+
+    cutoff = _now() - config.get_settings().PYRITE_SNAPSHOT_MAX_AGE
+    statement = sqlalchemy.select(_snapshots.c.record).where(
+        _snapshots.c.mrn == mrn,
+        _snapshots.c.refreshed_at >= _to_timestamp(cutoff),
+    )
+    with snapshot_engine.connect() as connection:
+        text = connection.execute(statement).scalar_one_or_none()
+    if text is None:
+        return None
+    return _decode_record(text)
+
+
+def put_records(
+    records: Mapping[str, SnapshotRecord],
+    refreshed_at: datetime.datetime | None = None,
+) -> None:
+    """Inserts or replaces snapshots.
+
+    Args:
+        records: Mapping of MRNs to their snapshots.
+        refreshed_at: The time the data was read from the database, defaults
+            to now.
+    """
+    snapshot_engine = _get_engine()
+    if snapshot_engine is None:
+        msg = "Pyrite snapshots are not enabled."
+        raise RuntimeError(msg)
+    if not records:
+        return
+
+    timestamp = _to_timestamp(refreshed_at or _now())
+    statement = sqlite.insert(_snapshots)
+    statement = statement.on_conflict_do_update(
+        index_elements=[_snapshots.c.mrn],
+        set_={
+            "refreshed_at": statement.excluded.refreshed_at,
+            "record": statement.excluded.record,
+        },
+    )
+    with snapshot_engine.begin() as connection:
+        connection.execute(
+            statement,
+            [
+                {"mrn": mrn, "refreshed_at": timestamp, "record": record.to_json()}
+                for mrn, record in records.items()
+            ],
+        )
+    logger.debug("Stored %s Pyrite snapshots.", len(records))
+
+
+def get_stale_mrns() -> tuple[str, ...]:
+    """Gets the MRNs of snapshots older than the maximum age.
+
+    Returns:
+        The MRNs, empty if the store is disabled.
+    """
+    snapshot_engine = _get_engine()
+    if snapshot_engine is None:
+        return ()
+
+    cutoff = _now() - config.get_settings().PYRITE_SNAPSHOT_MAX_AGE
+    statement = sqlalchemy.select(_snapshots.c.mrn).where(
+        _snapshots.c.refreshed_at < _to_timestamp(cutoff)
+    )
+    with snapshot_engine.connect() as connection:
+        return tuple(connection.execute(statement).scalars())
+
+
+@functools.cache
+def _get_engine() -> engine.Engine | None:
+    """Gets the engine of the snapshot store, creating the table if needed."""
+    path = config.get_settings().PYRITE_SNAPSHOT_PATH
+    if path is None:
+        return None
+    snapshot_engine = sqlalchemy.create_engine(f"sqlite:///{path}")
+    query_accounting.instrument(snapshot_engine)
+    _metadata.create_all(snapshot_engine)
+    return snapshot_engine
+
+
+@functools.lru_cache(maxsize=64)
+def _decode_record(text: str) -> SnapshotRecord:
+    """Decodes a snapshot, cached for participants that are looked up often."""
+    return SnapshotRecord.from_json(text)
+
+
+def _now() -> datetime.datetime:
+    return datetime.datetime.now(datetime.UTC)
+
+
+def _to_timestamp(moment: datetime.datetime) -> str:
+    return moment.astimezone(datetime.UTC).isoformat(timespec="microseconds")
+
+
+def _encode_value(value: object) -> dict[str, str]:
+    """Encodes values that JSON cannot represent."""
+    for tag, value_type, _ in _ENCODED_TYPES:
+        if isinstance(value, value_type):
+            text = value.isoformat() if hasattr(value, "isoformat") else str(value)
+            return {tag: text}
+    msg = f"Cannot store values of type {type(value).__name__} in a snapshot."
+    raise TypeError(msg)
+
+
+def _decode_value(obj: dict[str, Any]) -> Any:  # noqa: ANN401
+    """Decodes values encoded by _encode_value."""
+    if len(obj) == 1:
+        ((key, value),) = obj.items()
+        for tag, _, decoder in _ENCODED_TYPES:
+            if key == tag:
+                return decoder(value)
+    return obj
@@ -1,15 +1,19 @@
 """Utility functions for fetching data from the SQL database."""
 
+import contextlib
+import contextvars
 import dataclasses
 import functools
-from typing import Literal, TypeVar
+from collections.abc import Generator, Sequence
+from typing import Any, Literal, TypeVar
 
 import fastapi
 import sqlalchemy
 from starlette import status
 
 from ctk_functions.core import config
-from ctk_functions.microservices.sql import client, models
+from ctk_functions.microservices.sql import models
+from ctk_functions.routers.pyrite import backends, snapshot
 from ctk_functions.routers.pyrite.tables import base
 
 logger = config.get_logger()
@@ -26,13 +30,142 @@ class UniqueIdentifiers:
     person_id: str
 
 
-@functools.lru_cache
+@dataclasses.dataclass
+class _Prefetch:
+    """Rows of a batch of participants, loaded one table at a time.
+
+    Attributes:
+        ids: The identifiers of the participants in the batch, keyed by MRN.
+        rows: The loaded rows, keyed by the identifier property and table, and
+            then by the identifier of the participant.
+    """
+
+    ids: dict[str, UniqueIdentifiers]
+    rows: dict[tuple[str, type[Any]], dict[str, Any]] = dataclasses.field(
+        default_factory=dict
+    )
+
+    def get_ids(self, mrn: str) -> UniqueIdentifiers:
+        """Gets the identifiers of a participant in the batch."""
+        if mrn not in self.ids:
+            raise fastapi.HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="MRN could not be converted to EID.",
+            )
+        return self.ids[mrn]
+
+    def get_row(
+        self,
+        id_property: Literal["person_id", "EID", "MRN"],
+        mrn: str,
+        table: type[T],
+    ) -> T:
+        """Gets the row of a participant, loading the table for all participants."""
+        key = (id_property, table)
+        if key not in self.rows:
+            identifiers = [getattr(ids, id_property) for ids in self.ids.values()]
+            column = getattr(table, id_property)
+            with backends.get_backend().get_session() as session:
+                data = session.execute(
+                    sqlalchemy.select(table).where(column.in_(identifiers))
+                ).scalars()
+                # Keyed by string as identifiers, such as MRNs, are not always
+                # stored with the type they are passed around with.
+                self.rows[key] = {str(getattr(row, id_property)): row for row in data}
+
+        identifier = str(getattr(self.get_ids(mrn), id_property))
+        if identifier in self.rows[key]:
+            return self.rows[key][identifier]  # type: ignore[no-any-return]
+        msg = "Table data not found for participant in batch."
+        raise base.TableDataNotFoundError(msg)
+
+
+_prefetch: contextvars.ContextVar[_Prefetch | None] = contextvars.ContextVar(
+    "_prefetch", default=None
+)
+
+
+@contextlib.contextmanager
+def prefetch(mrns: Sequence[str]) -> Generator[tuple[str, ...], None, None]:
+    """Batches the participant queries of multiple participants.
+
+    Within this context, mrn_to_ids and fetch_participant_row use set-based
+    queries: the first request for a table loads the rows of all participants in
+    the batch. The batch is not cached beyond the context, so memory use is
+    bounded by the batch size.
+
+    Args:
+        mrns: The MRNs of the participants.
+
+    Yields:
+        The MRNs that were found in the database.
+    """
+    logger.debug("Prefetching identifiers of %s participants.", len(mrns))
+    with backends.get_backend().get_session() as session:
+        participants = session.execute(
+            sqlalchemy.select(models.CmiHbnIdTrack).where(
+                models.CmiHbnIdTrack.MRN.in_(mrns),
+            ),
+        ).scalars()
+        # MRNs are stored as integers, but are passed around as strings.
+        ids = {
+            str(participant.MRN): UniqueIdentifiers(
+                MRN=str(participant.MRN),
+                EID=participant.GUID,
+                person_id=participant.person_id,
+            )
+            for participant in participants
+        }
+
+    token = _prefetch.set(_Prefetch(ids=ids))
+    try:
+        yield tuple(mrn for mrn in mrns if mrn in ids)
+    finally:
+        _prefetch.reset(token)
+
+
+def is_prefetching() -> bool:
+    """Whether the current context is within a prefetch batch."""
+    return _prefetch.get() is not None
+
+
+def serves_rows_locally(mrn: str) -> bool:
+    """Whether a participant's rows are served without querying the database.
+
+    This is the case within a prefetch batch, or if the participant has a fresh
+    snapshot. Joins should then be replaced by lookups of the individual tables.
+
+    Args:
+        mrn: The participant's unique identifier.
+    """
+    return is_prefetching() or snapshot.get_record(mrn) is not None
+
+
 def mrn_to_ids(mrn: str) -> UniqueIdentifiers:
     """Fetches a participant's EID from their MRN.
 
     EID (also known as GUID) and MRN are separate unique identifiers used
     in the NextGen database.
 
+    Args:
+        mrn: The MRN of the participant.
+
+    Returns:
+        The EID of the participant.
+    """
+    batch = _prefetch.get()
+    if batch is not None:
+        return batch.get_ids(mrn)
+    record = snapshot.get_record(mrn)
+    if record is not None:
+        return UniqueIdentifiers(**record.ids)
+    return _mrn_to_ids(mrn)
+
+
+@functools.lru_cache
+def _mrn_to_ids(mrn: str) -> UniqueIdentifiers:
+    """Fetches a participant's EID from their MRN from the database.
+
     Args:
         mrn: The MRN of the participant.
 
@@ -41,7 +174,7 @@ def mrn_to_ids(mrn: str) -> UniqueIdentifiers:
     """
     sanitized_mrn = mrn.replace("\r", "").replace("\n", "")
     logger.debug("Fetching participant %s.", sanitized_mrn)
-    with client.get_session() as session:
+    with backends.get_backend().get_session() as session:
         participant = session.execute(
             sqlalchemy.select(models.CmiHbnIdTrack).where(
                 models.CmiHbnIdTrack.MRN == mrn,
@@ -62,7 +195,6 @@ def mrn_to_ids(mrn: str) -> UniqueIdentifiers:
     )
 
 
-@functools.lru_cache
 def fetch_participant_row(
     id_property: Literal["person_id", "EID", "MRN"],
     mrn: str,
@@ -80,6 +212,22 @@ def fetch_participant_row(
     Returns:
         The participant's row in the given table.
     """
+    batch = _prefetch.get()
+    if batch is not None:
+        return batch.get_row(id_property, mrn, table)
+    record = snapshot.get_record(mrn)
+    if record is not None and record.covers(table):  # type: ignore[arg-type]
+        return record.get_row(table)  # type: ignore[type-var]
+    return _fetch_participant_row(id_property, mrn, table)  # type: ignore[arg-type, no-any-return]
+
+
+@functools.lru_cache
+def _fetch_participant_row(
+    id_property: Literal["person_id", "EID", "MRN"],
+    mrn: str,
+    table: type[T],
+) -> T:
+    """Fetches a participant's row in the given table from the database."""
     sanitized_mrn = mrn.replace("\r", "").replace("\n", "")
     logger.debug("Fetching table %s, participant %s.", table.__name__, sanitized_mrn)
     identifier = getattr(mrn_to_ids(mrn), id_property)
@@ -87,7 +235,7 @@ def fetch_participant_row(
         getattr(table, id_property) == identifier,
     )
 
-    with client.get_session() as session:
+    with backends.get_backend().get_session() as session:
         data = session.execute(statement).scalar_one_or_none()
 
     logger.debug("Fetched table %s, participant %s.", table.__name__, sanitized_mrn)
@@ -96,3 +244,64 @@ def fetch_participant_row(
 
     msg = f"Table data not found for {sanitized_mrn}."
     raise base.TableDataNotFoundError(msg)
+
+
+def fetch_participant_columns(
+    id_property: Literal["person_id", "EID", "MRN"],
+    mrn: str,
+    table: type[models.Base],
+    column_names: tuple[str, ...],
+) -> dict[str, Any]:
+    """Fetches a subset of the columns of a participant's row in the given table.
+
+    Only the requested columns are selected, which avoids loading wide tables
+    such as SummaryScores in their entirety.
+
+    Args:
+        id_property: The identifier to use to select the row from the table.
+        mrn: The participant's unique identifier.
+        table: The table to fetch the row from.
+        column_names: The names of the columns to fetch.
+
+    Returns:
+        Mapping of the column names to the participant's values.
+    """
+    record = snapshot.get_record(mrn)
+    if record is not None and record.covers(table):
+        row = record.get_row(table)
+        return {name: getattr(row, name) for name in column_names}
+    return _fetch_participant_columns(id_property, mrn, table, column_names)
+
+
+@functools.lru_cache
+def _fetch_participant_columns(
+    id_property: Literal["person_id", "EID", "MRN"],
+    mrn: str,
+    table: type[models.Base],
+    column_names: tuple[str, ...],
+) -> dict[str, Any]:
+    """Fetches a subset of the columns of a participant's row from the database."""
+    sanitized_mrn = mrn.replace("\r", "").replace("\n", "")
+    logger.debug(
+        "Fetching columns of table %s, participant %s.",
+        table.__name__,
+        sanitized_mrn,
+    )
+    identifier = getattr(mrn_to_ids(mrn), id_property)
+    statement = sqlalchemy.select(
+        *(getattr(table, name) for name in column_names)
+    ).where(
+        getattr(table, id_property) == identifier,
+    )
+
+    with backends.get_backend().get_session() as session:
+        data = session.execute(statement).one_or_none()
+
+    logger.debug(
+        "Fetched columns of table %s, participant %s.", table.__name__, sanitized_mrn
+    )
+    if data:
+        return dict(zip(column_names, data, strict=True))
+
+    msg = f"Table data not found for {sanitized_mrn}."
+    raise base.TableDataNotFoundError(msg)
@@ -4,11 +4,12 @@ import dataclasses
 import functools
 
 import cmi_docx
+import numpy as np
 from docx import shared
 
 from ctk_functions.microservices.sql import models
 from ctk_functions.routers.pyrite import sql_data, types
-from ctk_functions.routers.pyrite.tables import base, utils
+from ctk_functions.routers.pyrite.tables import base, norms
 
 COLUMN_WIDTHS = (
     shared.Cm(1.76),
@@ -159,23 +160,28 @@ class _AcademicAchievementDataSource(base.DataProducer):
         """
         data = sql_data.fetch_participant_row("person_id", mrn, models.SummaryScores)
         header = ("Domain", "Subtest", "Standard Score", "Percentile", "Range")
-        body = []
-        for label in ACADEMIC_ROW_LABELS:
-            score = getattr(data, label.score_column)
-            if score is None:
-                continue
-
-            percentile = utils.normal_score_to_percentile(score, mean=100, std=15)
-            qualifier = utils.standard_score_to_qualifier(score)
-            body.append(
-                (
-                    label.domain,
-                    label.subtest,
-                    f"{score:.0f}",
-                    f"{percentile:.0f}",
-                    qualifier,
-                ),
+        labels = [
+            label
+            for label in ACADEMIC_ROW_LABELS
+            if getattr(data, label.score_column) is not None
+        ]
+        scores = np.array(
+            [getattr(data, label.score_column) for label in labels], dtype=np.float64
+        )
+        percentiles = norms.standard_score_percentile(scores)
+        qualifiers = norms.standard_score_qualifier(scores)
+        body = [
+            (
+                label.domain,
+                label.subtest,
+                f"{score:.0f}",
+                f"{percentile:.0f}",
+                qualifier,
             )
+            for label, score, percentile, qualifier in zip(
+                labels, scores, percentiles, qualifiers, strict=True
+            )
+        ]
 
         return header, *body
 
@@ -186,6 +192,8 @@ class AcademicAchievementTable(
 ):
     """Renderer for the Academic Achievement composite table."""
 
+    data_source = _AcademicAchievementDataSource
+
     def __init__(self, mrn: str) -> None:
         """Initializes the Academic Achievement renderer.
 
@@ -196,7 +204,6 @@ class AcademicAchievementTable(
         self.preamble = [
             base.ParagraphBlock(content="Age Norms:"),
         ]
-        self.data_source = _AcademicAchievementDataSource
 
         bold_subtests = [
             label.subtest
@@ -206,7 +213,7 @@ class AcademicAchievementTable(
 
         bold_rows = (
             base.ConditionalTableStyle(
-                condition=lambda table, row, _: table.rows[row].cells[1].text
+                condition=lambda markup, row: markup.rows[row][1].content
                 in bold_subtests,
                 style=base.Styles.BOLD.style,
             ),
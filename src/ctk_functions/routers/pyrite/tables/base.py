@@ -6,7 +6,7 @@ import copy
 import dataclasses
 import functools
 from collections.abc import Callable, Generator, Iterable, Mapping, Sequence
-from typing import Literal, Protocol, Self, TypeVar, cast, runtime_checkable
+from typing import Any, Literal, Protocol, Self, TypeVar, cast, runtime_checkable
 
 import cmi_docx
 import pydantic
@@ -16,7 +16,8 @@ from docx.text import paragraph
 
 from ctk_functions.core import config
 from ctk_functions.microservices.sql import models
-from ctk_functions.routers.pyrite import types
+from ctk_functions.routers.pyrite import preview, types
+from ctk_functions.routers.pyrite.tables import norms
 
 logger = config.get_logger()
 
@@ -56,39 +57,23 @@ class ConditionalCellStyle(pydantic.BaseModel):
 
 
 class ConditionalTableStyle(pydantic.BaseModel):
-    """Applies a style conditional upon a table's contents.
+    """Applies a style to a row conditional upon a table's contents.
 
     Used for styling of a cell that is conditional upon contents of
-    another cell.
+    another cell in its row.
 
     Args:
         condition: The condition, if it evaluates to True then the style
             will be applied. The input arguments to this callable are
-            the table, the row index of the cell, and the column index
-            of the cell.
+            the table markup and the row index. It is evaluated once per row.
         style: The style to apply.
     """
 
-    condition: Callable[[table.Table, int, int], bool] = (
-        lambda tbl, row_index, col_index: True  # noqa: ARG005
+    condition: Callable[["WordTableMarkup", int], bool] = (
+        lambda markup, row_index: True  # noqa: ARG005
     )
     style: cmi_docx.CellStyle
 
-    def apply(self, tbl: table.Table, row_index: int, col_index: int) -> None:
-        """Applies the style to the cell of the table if the condition is met.
-
-        Used to handle cross-cell dependencies.
-
-        Args:
-            tbl: The table to apply the style to.
-            row_index: The row index.
-            col_index: The column index.
-
-        """
-        cell = tbl.rows[row_index].cells[col_index]
-        if self.condition(tbl, row_index, col_index):
-            cmi_docx.ExtendCell(cell).format(self.style)
-
 
 @dataclasses.dataclass(frozen=True)
 class Styles:
@@ -127,6 +112,11 @@ class Styles:
     )
 
 
+def _no_bound(_score: float) -> bool:
+    """The check of an undefined bound of a clinical relevance range."""
+    return True
+
+
 class ClinicalRelevance(pydantic.BaseModel):
     """Stores the score ranges for clinical relevance.
 
@@ -145,30 +135,21 @@ class ClinicalRelevance(pydantic.BaseModel):
     style: cmi_docx.CellStyle
     low_inclusive: bool = False
     high_inclusive: bool = True
+    _low_check: Callable[[float], bool] = pydantic.PrivateAttr()
+    _high_check: Callable[[float], bool] = pydantic.PrivateAttr()
 
     def in_range(self, value: float | str) -> bool:
         """Checks if value is within the valid range.
 
         Excludes low value, includes high value.
         """
-        try:
-            value = float(value)
-        except (ValueError, TypeError):
+        score = norms.parse_score(value)
+        if score is None:
             # Escape hatch as some tables will mix numeric types with
             # strings to represent missing data.
             logger.debug("Could not check value %s", value)
             return False
-
-        if self.low is not None:
-            low_check = self.low.__le__ if self.low_inclusive else self.low.__lt__
-        if self.high is not None:
-            high_check = self.high.__ge__ if self.high_inclusive else self.high.__gt__
-
-        if self.high is None:
-            return low_check(value)
-        if self.low is None:
-            return high_check(value)
-        return low_check(value) and high_check(value)
+        return self._low_check(score) and self._high_check(score)
 
     def __str__(self) -> str:
         """String representation of the clinical relevance.
@@ -203,6 +184,17 @@ class ClinicalRelevance(pydantic.BaseModel):
             raise ValueError(msg)
         return self
 
+    def model_post_init(self, _context: Any, /) -> None:  # noqa: ANN401
+        """Builds the bound checks once rather than on every check."""
+        self._low_check = _no_bound
+        self._high_check = _no_bound
+        if self.low is not None:
+            self._low_check = self.low.__le__ if self.low_inclusive else self.low.__lt__
+        if self.high is not None:
+            self._high_check = (
+                self.high.__ge__ if self.high_inclusive else self.high.__gt__
+            )
+
 
 class ParagraphBlock(pydantic.BaseModel):
     """A text block in a Word document.
@@ -232,6 +224,15 @@ class ParagraphBlock(pydantic.BaseModel):
             cmi_docx.ExtendParagraph(para).format(self.style)
         return para  # type: ignore[no-any-return]
 
+    def to_preview(self) -> preview.PreviewParagraph:
+        """Converts the paragraph to its preview representation.
+
+        Returns:
+            The preview of the paragraph.
+        """
+        style_name = f"Heading {self.level}" if self.level else None
+        return preview.paragraph(self.content, style_name, self.style)
+
 
 def default_cell_style_factory() -> list[ConditionalCellStyle]:
     """Creates a list of default table styles.
@@ -260,7 +261,8 @@ class Formatter(pydantic.BaseModel):
     Attributes:
         conditional_cell_styles: A list of styles to apply, conditional on cell
             contents.
-        merge_top: If True, merges cells with identical cells above them.
+        merge_top: If True, merges cells with identical cells above them. Merges
+            are planned from the table markup by the renderer.
         merge_right: If True, merges cells with identical cells right of them.
         width: The width of the cell. If None, does not adjust from Word's default.
     """
@@ -277,46 +279,34 @@ class Formatter(pydantic.BaseModel):
     merge_right: bool = pydantic.Field(default=False)
     width: None | shared.Cm | shared.Inches | shared.Pt = None
 
-    def format(self, tbl: table.Table, row_index: int, col_index: int) -> None:
+    def format(
+        self,
+        tbl: table.Table,
+        row_index: int,
+        col_index: int,
+        table_style: cmi_docx.CellStyle | None = None,
+    ) -> None:
         """Formats the cell content for a table.
 
+        Merging is not handled here; see WordDocumentTableRenderer.
+
         Args:
             tbl: The table to format.
             row_index: The row index of the target cell.
             col_index: The column index of the target cell.
+            table_style: The style resolved from the conditional table styles
+                for the cell's row, see WordTableMarkup.resolve_table_styles.
         """
-        if row_index == 0 and self.merge_top:
-            msg = "Cannot merge top row upwards."
-            raise ValueError(msg)
-        if col_index == len(tbl.rows[0].cells) and self.merge_right:
-            msg = "Cannot merge right row rightwards."
-            raise ValueError(msg)
-
         cell = tbl.columns[col_index].cells[row_index]
         for cell_style in self.conditional_cell_styles:
             cell_style.apply(cell)
 
-        for table_style in self.conditional_table_styles:
-            table_style.apply(tbl, row_index, col_index)
+        if table_style is not None:
+            cmi_docx.ExtendCell(cell).format(table_style)
 
         if self.width:
             cell.width = self.width
 
-        if self.merge_top:
-            prev_cell = tbl.rows[row_index - 1].cells[col_index]
-            current_text = cell.text
-
-            if prev_cell.text == cell.text:
-                prev_cell.merge(cell)
-                prev_cell.text = current_text
-
-        if self.merge_right:
-            next_cell = tbl.rows[row_index].cells[col_index + 1]
-            current_text = cell.text
-            if next_cell.text == cell.text:
-                next_cell.merge(cell)
-                cell.text = current_text
-
 
 class FormatProducer:
     """Producer for table formatting."""
@@ -480,6 +470,32 @@ class WordTableMarkup(pydantic.BaseModel):
             raise ValueError(msg)
         return rows
 
+    def resolve_table_styles(
+        self, row_index: int
+    ) -> tuple[cmi_docx.CellStyle | None, ...]:
+        """Resolves the conditional table styles of a row.
+
+        Each condition is evaluated once for the row; the styles that hold are
+        folded into a single style per cell.
+
+        Args:
+            row_index: The index of the row.
+
+        Returns:
+            The resolved style of each cell in the row, None if no style holds.
+        """
+        holds: dict[int, bool] = {}
+        resolved = []
+        for cell in self.rows[row_index]:
+            styles = []
+            for table_style in cell.formatter.conditional_table_styles:
+                if id(table_style) not in holds:
+                    holds[id(table_style)] = table_style.condition(self, row_index)
+                if holds[id(table_style)]:
+                    styles.append(table_style.style)
+            resolved.append(_fold_cell_styles(styles))
+        return tuple(resolved)
+
 
 class DataProducer(abc.ABC):
     """Abstract data producer for Word tables."""
@@ -490,6 +506,21 @@ class DataProducer(abc.ABC):
     def fetch(cls, mrn: str) -> tuple[tuple[str, ...], ...]:
         """Abstract data fetcher."""
 
+    @classmethod
+    def fetch_uncached(cls, mrn: str) -> tuple[tuple[str, ...], ...]:
+        """Fetches the data without reading or filling the cache of fetch.
+
+        Used for batches of participants, whose data should not be retained
+        beyond the batch.
+
+        Args:
+            mrn: The participant's unique identifier.
+
+        Returns:
+            The text contents of the Word table.
+        """
+        return cls.fetch.__wrapped__(cls, mrn)
+
     @classmethod
     def is_available(cls, mrn: str) -> bool:
         """Tests whether the required data is available."""
@@ -538,13 +569,60 @@ class WordDocumentTableRenderer(pydantic.BaseModel):
 
                 document_cell.text = template_cell.content
 
+        table_styles = [
+            self.markup.resolve_table_styles(row_index) for row_index in range(n_rows)
+        ]
         for col_index in range(n_cols):
             for row_index in range(n_rows):
                 # Formatting must be done after all content is added as
                 # adding more content may conflict with previously set
                 # cell widths.
                 template_cell = self.markup.rows[row_index][col_index]
-                template_cell.formatter.format(tbl, row_index, col_index)
+                template_cell.formatter.format(
+                    tbl, row_index, col_index, table_styles[row_index][col_index]
+                )
+
+        # Merging is done last as merged cells can no longer be addressed
+        # by their grid indices.
+        _merge_cells(tbl, _plan_merges(self.markup))
+
+    def to_preview(self) -> preview.PreviewTable:
+        """Converts the table to its preview representation.
+
+        Resolves the same conditional styles and merges as the Word renderer,
+        without constructing a Word table.
+
+        Returns:
+            The preview of the table.
+        """
+        spans = _plan_merges(self.markup)
+
+        rows = []
+        for row_index, row in enumerate(self.markup.rows):
+            table_styles = self.markup.resolve_table_styles(row_index)
+            preview_row = []
+            for col_index, cell in enumerate(row):
+                if (row_index, col_index) not in spans:
+                    continue
+                formatter = cell.formatter
+                style = preview.PreviewStyle()
+                for cell_style in formatter.conditional_cell_styles:
+                    if cell_style.condition(cell.content):
+                        style.update(cell_style.style)
+                if (table_style := table_styles[col_index]) is not None:
+                    style.update(table_style)
+                row_span, col_span = spans[row_index, col_index]
+                preview_row.append(
+                    preview.PreviewCell(
+                        content=cell.content,
+                        style=style,
+                        width_cm=formatter.width.cm if formatter.width else None,
+                        row_span=row_span,
+                        col_span=col_span,
+                    )
+                )
+            rows.append(preview_row)
+        return preview.PreviewTable(rows=rows)
 
 
 class WordDocumentTableSectionRenderer(pydantic.BaseModel):
@@ -578,6 +656,18 @@ class WordDocumentTableSectionRenderer(pydantic.BaseModel):
         for post in self.postamble:
             post.add_to(doc)
 
+    def to_preview(self) -> list[preview.PreviewNode]:
+        """Converts the section to its preview representation.
+
+        Returns:
+            The preview nodes of the section.
+        """
+        return [
+            *(pre.to_preview() for pre in self.preamble),
+            self.table_renderer.to_preview(),
+            *(post.to_preview() for post in self.postamble),
+        ]
+
 
 class WordTableSection(abc.ABC):
     """Abstract class for adding table sections."""
@@ -601,6 +691,10 @@ class WordTableSection(abc.ABC):
             doc: The document to add the section to.
         """
 
+    @abc.abstractmethod
+    def to_preview(self) -> list[preview.PreviewNode]:
+        """Converts the section to its preview representation."""
+
     def is_available(self) -> bool:
         """Convenience method for the data source's availability."""
         return self.data_source.is_available(self.mrn)
@@ -636,6 +730,22 @@ class WordTableSectionAddToMixin:
         Args:
             doc: The document to add the section to.
         """
+        self._get_renderer().add_to(doc)
+
+    def to_preview(self) -> list[preview.PreviewNode]:
+        """Converts the data source to its preview representation.
+
+        Returns:
+            The preview nodes of the section.
+        """
+        return self._get_renderer().to_preview()
+
+    def _get_renderer(self) -> WordDocumentTableSectionRenderer:
+        """Creates the renderer of the section.
+
+        Returns:
+            The renderer containing the section's markup.
+        """
         if not isinstance(self, _AddToProtocol):
             msg = (
                 "Classes using the AddToMixin must be a valid implementation of "
@@ -660,5 +770,133 @@ class WordTableSectionAddToMixin:
         }
         args = {key: val for key, val in args.items() if val}
 
-        renderer = WordDocumentTableSectionRenderer(**args)
-        renderer.add_to(doc)
+        return WordDocumentTableSectionRenderer(**args)
+
+
+def _fold_cell_styles(
+    styles: Sequence[cmi_docx.CellStyle],
+) -> cmi_docx.CellStyle | None:
+    """Folds cell styles into one with the effect of applying them in order.
+
+    Args:
+        styles: The styles to fold.
+
+    Returns:
+        The folded style, None if there are no styles.
+    """
+    if len(styles) <= 1:
+        return styles[0] if styles else None
+
+    folded = cmi_docx.CellStyle()
+    for style in styles:
+        if style.paragraph is not None:
+            updates = {
+                field.name: value
+                for field in dataclasses.fields(style.paragraph)
+                if (value := getattr(style.paragraph, field.name)) is not None
+            }
+            folded.paragraph = dataclasses.replace(
+                folded.paragraph or cmi_docx.ParagraphStyle(), **updates
+            )
+        if style.background_rgb is not None:
+            folded.background_rgb = style.background_rgb
+        if style.borders:
+            folded.borders = [*(folded.borders or ()), *style.borders]
+    return folded
+
+
+def _plan_merges(
+    markup: WordTableMarkup,
+) -> dict[tuple[int, int], tuple[int, int]]:
+    """Plans the merged cells of a table from its markup.
+
+    A cell with merge_top merges into the cell above it if their contents are
+    equal; consecutive equal cells are grouped into a single vertical span. A
+    cell with merge_right merges with the cell to its right if their contents
+    are equal and neither is part of another merge.
+
+    Args:
+        markup: The table markup.
+
+    Returns:
+        Mapping of the (row, column) indices of each visible cell to its
+        (row_span, column_span). Cells covered by a merge are omitted.
+
+    Raises:
+        ValueError: If a cell in the top row merges upwards or a cell in the
+            rightmost column merges rightwards.
+    """
+    n_cols = len(markup.rows[0])
+    if any(cell.formatter.merge_top for cell in markup.rows[0]):
+        msg = "Cannot merge top row upwards."
+        raise ValueError(msg)
+    if any(row[-1].formatter.merge_right for row in markup.rows):
+        msg = "Cannot merge right row rightwards."
+        raise ValueError(msg)
+
+    spans = {
+        (row_index, col_index): (1, 1)
+        for row_index in range(len(markup.rows))
+        for col_index in range(n_cols)
+    }
+    for col_index in range(n_cols):
+        anchor = 0
+        for row_index in range(1, len(markup.rows)):
+            cell = markup.rows[row_index][col_index]
+            anchor_cell = markup.rows[anchor][col_index]
+            if cell.formatter.merge_top and cell.content == anchor_cell.content:
+                row_span, col_span = spans[anchor, col_index]
+                spans[anchor, col_index] = (row_span + 1, col_span)
+                del spans[row_index, col_index]
+            else:
+                anchor = row_index
+
+    for row_index, row in enumerate(markup.rows):
+        anchor = 0
+        for col_index in range(1, n_cols):
+            if (
+                spans.get((row_index, anchor)) is not None
+                and spans[row_index, anchor][0] == 1
+                and spans.get((row_index, col_index)) == (1, 1)
+                and row[col_index - 1].formatter.merge_right
+                and row[col_index].content == row[anchor].content
+            ):
+                spans[row_index, anchor] = (1, spans[row_index, anchor][1] + 1)
+                del spans[row_index, col_index]
+            else:
+                anchor = col_index
+    return spans
+
+
+def _merge_cells(
+    tbl: table.Table, spans: Mapping[tuple[int, int], tuple[int, int]]
+) -> None:
+    """Merges cells by writing the vMerge and gridSpan properties directly.
+
+    The top-left cell of a merge keeps its content; covered cells in the same
+    row are removed and covered cells in rows below are emptied.
+
+    Args:
+        tbl: The table to merge cells of. Must not contain merged cells yet.
+        spans: The merge plan, see _plan_merges.
+    """
+    tcs = [list(row._tr.tc_lst) for row in tbl.rows]  # noqa: SLF001
+    for (row_index, col_index), (row_span, col_span) in spans.items():
+        if row_span == 1 and col_span == 1:
+            continue
+        for offset in range(row_span):
+            tc = tcs[row_index + offset][col_index]
+            tc_properties = tc.get_or_add_tcPr()
+            if col_span > 1:
+                covered = tcs[row_index + offset][col_index + 1 : col_index + col_span]
+                widths = [tc.width, *(other.width for other in covered)]
+                if all(widths):
+                    tc.width = shared.Length(sum(cast("list[int]", widths)))
+                for other in covered:
+                    tc.getparent().remove(other)
+                tc_properties.grid_span = col_span
+            if row_span > 1:
+                tc.vMerge = "restart" if offset == 0 else "continue"
+                if offset > 0:
+                    tc.clear_content()
+                    tc.add_p()
@@ -142,7 +142,7 @@ def get_row_labels(test: CbcTests) -> tuple[tscore.TScoreRowLabel, ...]:
     )
 
 
-def _create_data_table(test: CbcTests) -> type:
+def _create_data_table(test: CbcTests) -> type[base.WordTableSection]:
     """Factory for a CBC table.
 
     Note that the return type hint cannot be more specific as mypy does not
@@ -159,6 +159,12 @@ def _create_data_table(test: CbcTests) -> type:
     class CbcTable(base.WordTableSectionAddToMixin, base.WordTableSection):
         """Renderer for a CBC table."""
 
+        data_source = tscore.create_data_producer(
+            test_ids=test.value.test_ids,
+            model=test.value.model,
+            labels=labels,
+        )
+
         def __init__(self, mrn: str) -> None:
             """Initializes the table renderer.
 
@@ -166,11 +172,6 @@ def _create_data_table(test: CbcTests) -> type:
                 mrn: The participant's unique identifier.'
             """
             self.mrn = mrn
-            self.data_source = tscore.create_data_producer(
-                test_ids=test.value.test_ids,
-                model=test.value.model,
-                labels=labels,
-            )
             border_index = (
                 next(
                     index
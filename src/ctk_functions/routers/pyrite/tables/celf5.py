@@ -45,6 +45,8 @@ class _Celf5DataSource(base.DataProducer):
 class Celf5Table(base.WordTableSectionAddToMixin, base.WordTableSection):
     """Renderer for the CELF5 table."""
 
+    data_source = _Celf5DataSource
+
     def __init__(self, mrn: str) -> None:
         """Initializes the CELF5 renderer.
 
@@ -52,7 +54,6 @@ class Celf5Table(base.WordTableSectionAddToMixin, base.WordTableSection):
             mrn: The participant's unique identifier.'
         """
         self.mrn = mrn
-        self.data_source = _Celf5DataSource
         self.formatters = base.FormatProducer.produce(
             n_rows=2, column_widths=[None] * 4
         )
@@ -81,6 +81,12 @@ class Conners3Table(
 ):
     """Renderer for the Conners3 table."""
 
+    data_source = tscore.create_data_producer(
+        test_ids=("conners_3",),
+        model=models.Conners3,
+        labels=CONNERS3_ROW_LABELS,
+    )
+
     def __init__(self, mrn: str) -> None:
         """Initializes the Conners3 renderer.
 
@@ -88,9 +94,4 @@ class Conners3Table(
             mrn: The participant's unique identifier.'
         """
         self.mrn = mrn
-        self.data_source = tscore.create_data_producer(
-            test_ids=("conners_3",),
-            model=models.Conners3,
-            labels=CONNERS3_ROW_LABELS,
-        )
         self.formatters = tscore.fetch_tscore_formatters(row_labels=CONNERS3_ROW_LABELS)
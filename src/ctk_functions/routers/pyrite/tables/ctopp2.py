@@ -61,6 +61,8 @@ class _Ctopp2DataSource(base.DataProducer):
 class Ctopp2Table(base.WordTableSectionAddToMixin, base.WordTableSection):
     """Renderer for the CTOPP2 table."""
 
+    data_source = _Ctopp2DataSource
+
     def __init__(self, mrn: str) -> None:
         """Initializes the CTOPP2 renderer.
 
@@ -68,7 +70,6 @@ class Ctopp2Table(base.WordTableSectionAddToMixin, base.WordTableSection):
             mrn: The participant's unique identifier.'
         """
         self.mrn = mrn
-        self.data_source = _Ctopp2DataSource
         self.formatters = base.FormatProducer.produce(
             n_rows=len(self.data_source.fetch(mrn)), column_widths=(None, None)
         )
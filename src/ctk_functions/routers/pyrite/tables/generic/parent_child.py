@@ -7,8 +7,8 @@ import pydantic
 import sqlalchemy
 from docx import shared
 
-from ctk_functions.microservices.sql import client, models
-from ctk_functions.routers.pyrite import sql_data
+from ctk_functions.microservices.sql import models
+from ctk_functions.routers.pyrite import backends, sql_data
 from ctk_functions.routers.pyrite.tables import base
 
 COLUMN_WIDTHS = (
@@ -94,7 +94,16 @@ def fetch_parent_child_formatting(
 
 def _parent_child_sql_request(
     mrn: str, parent_table: type[T_parent], child_table: type[T_child]
-) -> sqlalchemy.Row[tuple[T_parent, T_child]]:
+) -> sqlalchemy.Row[tuple[T_parent, T_child]] | tuple[T_parent, T_child | None]:
+    if sql_data.serves_rows_locally(mrn):
+        # Two local lookups instead of one join per participant.
+        parent = sql_data.fetch_participant_row("EID", mrn, parent_table)
+        try:
+            child = sql_data.fetch_participant_row("EID", mrn, child_table)
+        except base.TableDataNotFoundError:
+            return parent, None
+        return parent, child
+
     eid = sql_data.mrn_to_ids(mrn).EID
     statement = (
         sqlalchemy.select(
@@ -109,7 +118,7 @@ def _parent_child_sql_request(
             parent_table.EID == child_table.EID,  # type: ignore[attr-defined]
         )
     )
-    with client.get_session() as session:
+    with backends.get_backend().get_session() as session:
         data = session.execute(statement).fetchone()
     if not data:
         msg = f"Could not find MFQ data for {mrn}."
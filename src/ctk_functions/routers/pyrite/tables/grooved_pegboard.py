@@ -3,9 +3,11 @@
 import dataclasses
 import functools
 
+import numpy as np
+
 from ctk_functions.microservices.sql import models
 from ctk_functions.routers.pyrite import sql_data, types
-from ctk_functions.routers.pyrite.tables import base, utils
+from ctk_functions.routers.pyrite.tables import base, norms
 
 
 @dataclasses.dataclass
@@ -48,8 +50,17 @@ class _GroovedPegboardDataSource(base.DataProducer):
         """
         data = sql_data.fetch_participant_row("EID", mrn, models.GroovedPegboard)
         header = ("Hand", "Z-Score", "Percentile", "Range")
+        scores = np.array(
+            [getattr(data, label.score_column) for label in PEGBOARD_ROW_LABELS],
+            dtype=np.float64,
+        )
+        percentiles = norms.normal_percentile(scores, mean=0, std=1)
+        qualifiers = norms.grooved_pegboard_qualifier(percentiles)
         content_rows = [
-            _create_pegboard_content_row(label, data) for label in PEGBOARD_ROW_LABELS
+            (label.name, f"{score:.2f}", f"{percentile:.0f}", qualifier)
+            for label, score, percentile, qualifier in zip(
+                PEGBOARD_ROW_LABELS, scores, percentiles, qualifiers, strict=True
+            )
         ]
         return header, *content_rows
 
@@ -60,6 +71,8 @@ class GroovedPegboardTable(
 ):
     """Renderer for the grooved pegboard table."""
 
+    data_source = _GroovedPegboardDataSource
+
     def __init__(self, mrn: str) -> None:
         """Initializes the grooved pegboard renderer.
 
@@ -67,48 +80,6 @@ class GroovedPegboardTable(
             mrn: The participant's unique identifier.'
         """
         self.mrn = mrn
-        self.data_source = _GroovedPegboardDataSource
         self.formatters = base.FormatProducer.produce(
             n_rows=len(PEGBOARD_ROW_LABELS) + 1, column_widths=[None] * 4
         )
-
-
-def _create_pegboard_content_row(
-    label: _PegBoardRowLabels,
-    data: models.GroovedPegboard,
-) -> tuple[str, str, str, str]:
-    """Creates a row for the pegboard table.
-
-    Args:
-        label: A row label.
-        data: The SQL data to extract the score from.
-
-    Returns:
-        List of WordTableCell objects forming a table row
-    """
-    score = float(getattr(data, label.score_column))
-    percentile = utils.normal_score_to_percentile(score, mean=0, std=1)
-    qualifier = _grooved_pegboard_percentile_to_qualifier(percentile)
-
-    return label.name, f"{score:.2f}", f"{percentile:.0f}", qualifier
-
-
-def _grooved_pegboard_percentile_to_qualifier(percentile: float) -> str:  # noqa: PLR0911
-    """Converts the pegboard z-score to a qualifier."""
-    if percentile < 0.01:  # noqa: PLR2004  # noqa: PLR0911
-        return "extremely low"
-    if percentile <= 3:  # noqa: PLR2004
-        return "very low"
-    if percentile <= 10:  # noqa: PLR2004
-        return "low"
-    if percentile <= 24:  # noqa: PLR2004
-        return "low average"
-    if percentile <= 75:  # noqa: PLR2004
-        return "average"
-    if percentile <= 90:  # noqa: PLR2004
-        return "high average"
-    if percentile <= 97:  # noqa: PLR2004
-        return "high"
-    if percentile <= 98:  # noqa: PLR2004
-        return "very high"
-    return "extremely high"
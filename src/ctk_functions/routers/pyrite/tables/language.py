@@ -8,7 +8,7 @@ from docx import shared
 
 from ctk_functions.microservices.sql import models
 from ctk_functions.routers.pyrite import sql_data, types
-from ctk_functions.routers.pyrite.tables import base, utils
+from ctk_functions.routers.pyrite.tables import base, norms, utils
 
 COLUMN_WIDTHS = (
     shared.Cm(2.09),
@@ -166,9 +166,7 @@ class _LanguageDataSource(base.DataProducer):
             return label.test, label.subtest, "", "", ""
 
         score = getattr(data, label.score_column)
-        percentile = (
-            f"{utils.normal_score_to_percentile(float(score), mean=100, std=15):.0f}"
-        )
+        percentile = f"{float(norms.standard_score_percentile(float(score))):.0f}"
         qualifier = utils.standard_score_to_qualifier(float(score))
         return label.test, label.subtest, f"{score:.0f}", percentile, qualifier
 
@@ -188,9 +186,9 @@ def _get_formatters(n_rows: int) -> tuple[tuple[base.Formatter, ...], ...]:
     """
     bold_rows = (
         base.ConditionalTableStyle(
-            condition=lambda table, row, _: not table.rows[row]
-            .cells[1]
-            .text.startswith("\t"),
+            condition=lambda markup, row: not markup.rows[row][1].content.startswith(
+                "\t"
+            ),
             style=base.Styles.BOLD.style,
         ),
     )
@@ -212,6 +210,8 @@ class LanguageTable(
 ):
     """Renderer for the language table."""
 
+    data_source = _LanguageDataSource
+
     def __init__(self, mrn: str) -> None:
         """Initializes the langauge renderer.
 
@@ -219,5 +219,4 @@ class LanguageTable(
             mrn: The participant's unique identifier.'
         """
         self.mrn = mrn
-        self.data_source = _LanguageDataSource
         self.formatters = _get_formatters(n_rows=len(self.data_source.fetch(mrn)))
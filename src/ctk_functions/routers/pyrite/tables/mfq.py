@@ -57,6 +57,8 @@ class _MfqDataSource(base.DataProducer):
 class MfqTable(base.WordTableSectionAddToMixin, base.WordTableSection):
     """Renderer for the Mfq table."""
 
+    data_source = _MfqDataSource
+
     def __init__(self, mrn: str) -> None:
         """Initializes the Mfq renderer.
 
@@ -64,7 +66,6 @@ class MfqTable(base.WordTableSectionAddToMixin, base.WordTableSection):
             mrn: The participant's unique identifier.'
         """
         self.mrn = mrn
-        self.data_source = _MfqDataSource
         self.formatters = parent_child.fetch_parent_child_formatting(
             row_labels=MFQ_ROW_LABELS
         )
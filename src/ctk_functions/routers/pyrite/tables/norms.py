@@ -0,0 +1,297 @@
+"""Table-driven conversion of scores to percentiles and qualifiers.
+
+All lookup arrays and breakpoints are built once at import. The conversions
+accept whole arrays of scores, so that a single report and a cohort export go
+through the same code path.
+"""
+
+import functools
+import statistics
+from collections.abc import Sequence
+
+import numpy as np
+import numpy.typing as npt
+
+QUALIFIERS = (
+    "extremely low",
+    "very low",
+    "low",
+    "low average",
+    "average",
+    "high average",
+    "high",
+    "very high",
+    "extremely high",
+)
+
+_STANDARD_NORMAL = statistics.NormalDist()
+
+# Standard scores have a mean of 100 and a standard deviation of 15.
+_STANDARD_SCORE_MEAN = 100
+_STANDARD_SCORE_STD = 15
+# Indexed by whole standard score minus the minimum.
+_MIN_STANDARD_SCORE = 0
+_MAX_STANDARD_SCORE = 200
+_STANDARD_SCORE_PERCENTILES = np.asarray(
+    [
+        statistics.NormalDist(_STANDARD_SCORE_MEAN, _STANDARD_SCORE_STD).cdf(score)
+        * 100
+        for score in range(_MIN_STANDARD_SCORE, _MAX_STANDARD_SCORE + 1)
+    ],
+    dtype=np.float64,
+)
+
+
+class BreakpointScale:
+    """Maps scores to labels by sorted, inclusive upper bounds.
+
+    A score receives the label of the first bound it does not exceed; scores
+    above the last bound receive the last label.
+    """
+
+    def __init__(self, upper_bounds: Sequence[float], labels: Sequence[str]) -> None:
+        """Initializes the scale.
+
+        Args:
+            upper_bounds: The inclusive upper bound of each label but the last,
+                in ascending order.
+            labels: The labels, one more than there are bounds.
+        """
+        if len(labels) != len(upper_bounds) + 1:
+            msg = "There must be exactly one more label than upper bounds."
+            raise ValueError(msg)
+        bounds = np.asarray(upper_bounds, dtype=np.float64)
+        if np.any(np.diff(bounds) <= 0):
+            msg = "Upper bounds must be strictly ascending."
+            raise ValueError(msg)
+        self._bounds = bounds
+        self._labels = np.asarray(labels, dtype=object)
+
+    def classify(self, scores: npt.ArrayLike) -> npt.NDArray[np.object_]:
+        """Converts scores to their labels.
+
+        Args:
+            scores: The scores to convert.
+
+        Returns:
+            The labels, in the shape of the scores.
+
+        Raises:
+            ValueError: If any score is missing or not finite.
+        """
+        indices = np.searchsorted(self._bounds, _as_finite(scores), side="left")
+        return np.asarray(self._labels[indices], dtype=object)
+
+
+# Built with a mean of 100 and a standard deviation of 15.
+STANDARD_SCORE_SCALE = BreakpointScale(
+    upper_bounds=(59, 69, 79, 89, 109, 119, 129, 139),
+    labels=QUALIFIERS,
+)
+
+GROOVED_PEGBOARD_PERCENTILE_SCALE = BreakpointScale(
+    # Percentiles strictly below 0.01 are extremely low.
+    upper_bounds=(float(np.nextafter(0.01, 0)), 3, 10, 24, 75, 90, 97, 98),
+    labels=QUALIFIERS,
+)
+
+# Indexed by scaled score; scores outside the array's range are clipped.
+_WISC_SUBTEST_QUALIFIERS = np.asarray(
+    (
+        "extremely low",
+        "extremely low",
+        "very low",
+        "very low",
+        "low",
+        "low",
+        "low average",
+        "low average",
+        "average",
+        "average",
+        "average",
+        "average",
+        "high average",
+        "high average",
+        "high",
+        "high",
+        "very high",
+        "very high",
+        "extremely high",
+    ),
+    dtype=object,
+)
+# Indexed by scaled score minus one; scores above 16 are in the 99th percentile.
+_WISC_SUBTEST_PERCENTILES = np.asarray(
+    (1, 1, 1, 2, 5, 9, 16, 25, 37, 50, 63, 75, 84, 91, 95, 98, 99),
+    dtype=np.int64,
+)
+
+
+def normal_percentile(
+    scores: npt.ArrayLike, mean: float, std: float
+) -> npt.NDArray[np.float64]:
+    """Converts scores in a normal distribution to percentiles.
+
+    The percentiles are computed per score; use standard_score_percentile for
+    standard scores, which are looked up.
+
+    Args:
+        scores: The scores to convert.
+        mean: The mean of the normal distribution.
+        std: The standard deviation of the normal distribution.
+
+    Returns:
+        The percentiles, in the shape of the scores.
+
+    Raises:
+        ValueError: If any score is missing or not finite.
+    """
+    z_scores = (_as_finite(scores) - mean) / std
+    cdf = np.fromiter(
+        map(_STANDARD_NORMAL.cdf, z_scores.ravel()),
+        dtype=np.float64,
+        count=z_scores.size,
+    )
+    return cdf.reshape(z_scores.shape) * 100
+
+
+def standard_score_percentile(scores: npt.ArrayLike) -> npt.NDArray[np.float64]:
+    """Converts standard scores to percentiles.
+
+    Whole scores are looked up in a table built at import; other scores are
+    computed by normal_percentile.
+
+    Args:
+        scores: The standard scores to convert.
+
+    Returns:
+        The percentiles, in the shape of the scores.
+
+    Raises:
+        ValueError: If any score is missing or not finite.
+    """
+    floats = _as_finite(scores)
+    tabled = (
+        (floats == np.round(floats))
+        & (floats >= _MIN_STANDARD_SCORE)
+        & (floats <= _MAX_STANDARD_SCORE)
+    )
+    percentiles = np.empty_like(floats)
+    percentiles[tabled] = _STANDARD_SCORE_PERCENTILES[
+        floats[tabled].astype(np.int64) - _MIN_STANDARD_SCORE
+    ]
+    if not np.all(tabled):
+        percentiles[~tabled] = normal_percentile(
+            floats[~tabled], _STANDARD_SCORE_MEAN, _STANDARD_SCORE_STD
+        )
+    return percentiles
+
+
+def standard_score_qualifier(scores: npt.ArrayLike) -> npt.NDArray[np.object_]:
+    """Converts standard scores to qualifiers.
+
+    Args:
+        scores: The standard scores to convert.
+
+    Returns:
+        The qualifiers, in the shape of the scores.
+
+    Raises:
+        ValueError: If any score is missing or not finite.
+    """
+    return STANDARD_SCORE_SCALE.classify(scores)
+
+
+def grooved_pegboard_qualifier(
+    percentiles: npt.ArrayLike,
+) -> npt.NDArray[np.object_]:
+    """Converts grooved pegboard percentiles to qualifiers.
+
+    Args:
+        percentiles: The percentiles to convert.
+
+    Returns:
+        The qualifiers, in the shape of the percentiles.
+
+    Raises:
+        ValueError: If any percentile is missing or not finite.
+    """
+    return GROOVED_PEGBOARD_PERCENTILE_SCALE.classify(percentiles)
+
+
+def wisc_subtest_qualifier(scaled: npt.ArrayLike) -> npt.NDArray[np.object_]:
+    """Converts WISC subtest scaled scores to qualifiers.
+
+    Args:
+        scaled: The scaled scores to convert.
+
+    Returns:
+        The qualifiers, in the shape of the scores.
+
+    Raises:
+        ValueError: If any score is not a whole number.
+    """
+    scores = _as_whole_numbers(scaled)
+    indices = np.clip(scores, 0, len(_WISC_SUBTEST_QUALIFIERS) - 1)
+    return np.asarray(_WISC_SUBTEST_QUALIFIERS[indices], dtype=object)
+
+
+def wisc_subtest_percentile(scaled: npt.ArrayLike) -> npt.NDArray[np.int64]:
+    """Converts WISC subtest scaled scores to percentiles.
+
+    Args:
+        scaled: The scaled scores to convert.
+
+    Returns:
+        The percentiles, in the shape of the scores.
+
+    Raises:
+        ValueError: If any score is not a whole number, or is below one.
+    """
+    scores = _as_whole_numbers(scaled)
+    if np.any(scores < 1):
+        msg = "WISC subtest scaled scores must be at least one."
+        raise ValueError(msg)
+    indices = np.minimum(scores, len(_WISC_SUBTEST_PERCENTILES)) - 1
+    return np.asarray(_WISC_SUBTEST_PERCENTILES[indices], dtype=np.int64)
+
+
+@functools.lru_cache(maxsize=4096)
+def parse_score(value: float | str) -> float | None:
+    """Parses a table value to a score.
+
+    Cells are checked against several relevance tiers each, and many cell
+    texts recur, so parsed values are cached.
+
+    Args:
+        value: The value to parse. Tables mix numbers with strings that
+            represent missing data.
+
+    Returns:
+        The score, None if the value is not numeric.
+    """
+    try:
+        return float(value)
+    except (ValueError, TypeError):
+        return None
+
+
+def _as_finite(values: npt.ArrayLike) -> npt.NDArray[np.float64]:
+    """Converts values to floats, rejecting missing and infinite values.
+
+    A missing score must never be converted to a percentile or qualifier.
+    """
+    floats = np.asarray(values, dtype=np.float64)
+    if not np.all(np.isfinite(floats)):
+        msg = "Scores must be finite numbers."
+        raise ValueError(msg)
+    return floats
+
+
+def _as_whole_numbers(values: npt.ArrayLike) -> npt.NDArray[np.int64]:
+    """Converts values to integers, rejecting fractional values."""
+    floats = np.asarray(values, dtype=np.float64)
+    if not np.all(np.isfinite(floats) & (floats == np.round(floats))):
+        msg = "Scores must be whole numbers."
+        raise ValueError(msg)
+    return floats.astype(np.int64)
@@ -132,6 +132,8 @@ class _ScaredDataSource(base.DataProducer):
 class ScaredTable(base.WordTableSectionAddToMixin, base.WordTableSection):
     """Renderer for the Scared table."""
 
+    data_source = _ScaredDataSource
+
     def __init__(self, mrn: str) -> None:
         """Initializes the Scared renderer.
 
@@ -139,7 +141,6 @@ class ScaredTable(base.WordTableSectionAddToMixin, base.WordTableSection):
             mrn: The participant's unique identifier.'
         """
         self.mrn = mrn
-        self.data_source = _ScaredDataSource
         self.formatters = parent_child.fetch_parent_child_formatting(
             row_labels=SCARED_ROW_LABELS, top_border_rows=(-1,)
         )
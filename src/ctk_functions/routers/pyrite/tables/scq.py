@@ -55,6 +55,8 @@ class _ScqDataSource(base.DataProducer):
 class ScqTable(base.WordTableSectionAddToMixin, base.WordTableSection):
     """Renderer for the Scq table."""
 
+    data_source = _ScqDataSource
+
     def __init__(self, mrn: str) -> None:
         """Initializes the Scq renderer.
 
@@ -62,7 +64,6 @@ class ScqTable(base.WordTableSectionAddToMixin, base.WordTableSection):
             mrn: The participant's unique identifier.'
         """
         self.mrn = mrn
-        self.data_source = _ScqDataSource
         self.formatters = base.FormatProducer.produce(
             n_rows=2,
             column_widths=COLUMN_WIDTHS,
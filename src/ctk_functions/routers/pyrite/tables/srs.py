@@ -68,6 +68,10 @@ SRS_ROW_LABELS = (
 class SrsTable(base.WordTableSectionAddToMixin, base.WordTableSection):
     """Renderer for the Srs table."""
 
+    data_source = tscore.create_data_producer(
+        test_ids=("srs",), model=models.Srs, labels=SRS_ROW_LABELS
+    )
+
     def __init__(self, mrn: str) -> None:
         """Initializes the Srs renderer.
 
@@ -75,9 +79,6 @@ class SrsTable(base.WordTableSectionAddToMixin, base.WordTableSection):
             mrn: The participant's unique identifier.'
         """
         self.mrn = mrn
-        self.data_source = tscore.create_data_producer(
-            test_ids=("srs",), model=models.Srs, labels=SRS_ROW_LABELS
-        )
         self.formatters = tscore.fetch_tscore_formatters(
             row_labels=SRS_ROW_LABELS, top_border_rows=(-1,)
         )
@@ -97,6 +97,8 @@ class _SwanDataSource(base.DataProducer):
 class SwanTable(base.WordTableSectionAddToMixin, base.WordTableSection):
     """Renderer for the Swan table."""
 
+    data_source = _SwanDataSource
+
     def __init__(self, mrn: str) -> None:
         """Initializes the Swan renderer.
 
@@ -104,7 +106,6 @@ class SwanTable(base.WordTableSectionAddToMixin, base.WordTableSection):
             mrn: The participant's unique identifier.'
         """
         self.mrn = mrn
-        self.data_source = _SwanDataSource
 
         relevance_styles = {
             (index + 1, 1): (
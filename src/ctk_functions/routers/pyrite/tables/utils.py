@@ -1,13 +1,12 @@
 """Utility data fetching functions for all tables."""
 
-import statistics
 from typing import TypeVar
 
 import cmi_docx
 
 from ctk_functions.core.config import get_logger
 from ctk_functions.microservices.sql import models
-from ctk_functions.routers.pyrite.tables import base
+from ctk_functions.routers.pyrite.tables import base, norms
 
 logger = get_logger()
 
@@ -41,7 +40,7 @@ def add_thick_top_border(
     return markup
 
 
-def standard_score_to_qualifier(score: float) -> str:  # noqa: PLR0911
+def standard_score_to_qualifier(score: float) -> str:
     """Converts standard score to a qualifier.
 
     This was built with a mean of 100, and std of 15 as the underlying
@@ -53,23 +52,7 @@ def standard_score_to_qualifier(score: float) -> str:  # noqa: PLR0911
     Returns:
         The corresponding qualifier.
     """
-    if score <= 59:  # noqa: PLR2004
-        return "extremely low"
-    if score <= 69:  # noqa: PLR2004
-        return "very low"
-    if score <= 79:  # noqa: PLR2004
-        return "low"
-    if score <= 89:  # noqa: PLR2004
-        return "low average"
-    if score <= 109:  # noqa: PLR2004
-        return "average"
-    if score <= 119:  # noqa: PLR2004
-        return "high average"
-    if score <= 129:  # noqa: PLR2004
-        return "high"
-    if score <= 139:  # noqa: PLR2004
-        return "very high"
-    return "extremely high"
+    return str(norms.standard_score_qualifier(score))
 
 
 def normal_score_to_percentile(score: float, mean: float, std: float) -> float:
@@ -83,4 +66,4 @@ def normal_score_to_percentile(score: float, mean: float, std: float) -> float:
     Returns:
         The percentile of the normal distribution.
     """
-    return statistics.NormalDist(mean, std).cdf(float(score)) * 100
+    return float(norms.normal_percentile(score, mean, std))
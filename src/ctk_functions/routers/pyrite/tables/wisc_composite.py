@@ -7,7 +7,7 @@ from docx import shared
 
 from ctk_functions.microservices.sql import models
 from ctk_functions.routers.pyrite import sql_data, types
-from ctk_functions.routers.pyrite.tables import base, utils
+from ctk_functions.routers.pyrite.tables import base, norms
 
 COLUMN_WIDTHS = (
     shared.Cm(5.49),
@@ -61,27 +61,25 @@ class _WiscCompositeDataSource(base.DataProducer):
         """
         data = sql_data.fetch_participant_row("EID", mrn, models.Wisc5)
         header = ("Composite", "Standard Score", "Percentile", "Range")
+        scores = [
+            getattr(data, label.score_column) for label in WISC_COMPOSITE_ROW_LABELS
+        ]
+        percentiles = norms.standard_score_percentile(scores)
+        qualifiers = norms.standard_score_qualifier(scores)
         content_rows = [
-            cls._create_wisc_composite_row(data, label)
-            for label in WISC_COMPOSITE_ROW_LABELS
+            (label.name, score, f"{percentile:.0f}", qualifier)
+            for label, score, percentile, qualifier in zip(
+                WISC_COMPOSITE_ROW_LABELS, scores, percentiles, qualifiers, strict=True
+            )
         ]
         return header, *content_rows
 
-    @staticmethod
-    def _create_wisc_composite_row(
-        data: models.Wisc5,
-        label: WiscCompositeRowLabels,
-    ) -> tuple[str, str, str, str]:
-        score = getattr(data, label.score_column)
-        percentile = utils.normal_score_to_percentile(score, mean=100, std=15)
-        qualifier = utils.standard_score_to_qualifier(score)
-
-        return label.name, score, f"{percentile:.0f}", qualifier
-
 
 class WiscCompositeTable(base.WordTableSectionAddToMixin, base.WordTableSection):
     """Renderer for the WISC composite table."""
 
+    data_source = _WiscCompositeDataSource
+
     def __init__(self, mrn: str) -> None:
         """Initializes the WISC renderer.
 
@@ -89,7 +87,6 @@ class WiscCompositeTable(base.WordTableSectionAddToMixin, base.WordTableSection)
             mrn: The participant's unique identifier.'
         """
         self.mrn = mrn
-        self.data_source = _WiscCompositeDataSource
         self.formatters = base.FormatProducer.produce(
             n_rows=len(WISC_COMPOSITE_ROW_LABELS) + 1,
             column_widths=COLUMN_WIDTHS,
@@ -2,6 +2,8 @@
 
 import dataclasses
 import functools
+from collections.abc import Sequence
+from typing import overload
 
 import cmi_docx
 import fastapi
@@ -10,7 +12,7 @@ from starlette import status
 
 from ctk_functions.microservices.sql import models
 from ctk_functions.routers.pyrite import sql_data, types
-from ctk_functions.routers.pyrite.tables import base
+from ctk_functions.routers.pyrite.tables import base, norms
 
 COLUMN_WIDTHS = (
     shared.Cm(4.42),
@@ -110,23 +112,16 @@ class _WiscSubtestDataSource(base.DataProducer):
         """
         data = sql_data.fetch_participant_row("EID", mrn, models.Wisc5)
         header = ("Index", "Subtest", "Scaled Score", "Percentile", "Range")
+        scores = [
+            getattr(data, label.score_column) for label in WISC_SUBTEST_ROW_LABELS
+        ]
+        percentiles = _wisc_subtest_scaled_score_to_percentile(scores)
+        qualifiers = _wisc_subtest_scaled_score_to_qualifier(scores)
         content_rows = [
-            (
-                label.scale,
-                label.subtest,
-                getattr(data, label.score_column),
-                str(
-                    _wisc_subtest_scaled_score_to_percentile(
-                        getattr(data, label.score_column),
-                    ),
-                ),
-                str(
-                    _wisc_subtest_scaled_score_to_qualifier(
-                        getattr(data, label.score_column),
-                    ),
-                ),
+            (label.scale, label.subtest, score, str(percentile), qualifier)
+            for label, score, percentile, qualifier in zip(
+                WISC_SUBTEST_ROW_LABELS, scores, percentiles, qualifiers, strict=True
             )
-            for label in WISC_SUBTEST_ROW_LABELS
         ]
         return header, *content_rows
 
@@ -134,6 +129,8 @@ class _WiscSubtestDataSource(base.DataProducer):
 class WiscSubtestTable(base.WordTableSectionAddToMixin, base.WordTableSection):
     """Renderer for the WISC subtest table."""
 
+    data_source = _WiscSubtestDataSource
+
     def __init__(self, mrn: str) -> None:
         """Initializes the WISC subtest renderer.
 
@@ -147,7 +144,6 @@ class WiscSubtestTable(base.WordTableSectionAddToMixin, base.WordTableSection):
                 style=cmi_docx.ParagraphStyle(italic=True),
             ),
         ]
-        self.data_source = _WiscSubtestDataSource
         self.formatters = base.FormatProducer.produce(
             n_rows=len(WISC_SUBTEST_ROW_LABELS) + 1,
             column_widths=COLUMN_WIDTHS,
@@ -155,66 +151,43 @@ class WiscSubtestTable(base.WordTableSectionAddToMixin, base.WordTableSection):
         )
 
 
-def _wisc_subtest_scaled_score_to_qualifier(scaled: int) -> str:
-    if scaled <= 1:
-        return "extremely low"
-    if scaled >= 18:  # noqa: PLR2004
-        return "extremely high"
-
-    mapping = {
-        1: "extremely low",
-        2: "very low",
-        3: "very low",
-        4: "low",
-        5: "low",
-        6: "low average",
-        7: "low average",
-        8: "average",
-        9: "average",
-        10: "average",
-        11: "average",
-        12: "high average",
-        13: "high average",
-        14: "high",
-        15: "high",
-        16: "very high",
-        17: "very high",
-    }
-
-    if scaled in mapping:
-        return mapping[scaled]
-    raise fastapi.HTTPException(
-        status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-        detail="Unknown WISC subtest score.",
-    )
-
-
-def _wisc_subtest_scaled_score_to_percentile(scale: int) -> int:
+@overload
+def _wisc_subtest_scaled_score_to_qualifier(scaled: int) -> str: ...
+
+
+@overload
+def _wisc_subtest_scaled_score_to_qualifier(scaled: Sequence[int]) -> list[str]: ...
+
+
+def _wisc_subtest_scaled_score_to_qualifier(
+    scaled: int | Sequence[int],
+) -> str | list[str]:
+    """Converts WISC subtest scores to qualifiers."""
+    try:
+        return norms.wisc_subtest_qualifier(scaled).tolist()  # type: ignore[no-any-return]
+    except ValueError as exc_info:
+        raise fastapi.HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Unknown WISC subtest score.",
+        ) from exc_info
+
+
+@overload
+def _wisc_subtest_scaled_score_to_percentile(scale: int) -> int: ...
+
+
+@overload
+def _wisc_subtest_scaled_score_to_percentile(scale: Sequence[int]) -> list[int]: ...
+
+
+def _wisc_subtest_scaled_score_to_percentile(
+    scale: int | Sequence[int],
+) -> int | list[int]:
     """Converts WISC subtest scores to percentiles."""
-    if scale > 16:  # noqa: PLR2004
-        return 99
-    mapping = {
-        1: 1,
-        2: 1,
-        3: 1,
-        4: 2,
-        5: 5,
-        6: 9,
-        7: 16,
-        8: 25,
-        9: 37,
-        10: 50,
-        11: 63,
-        12: 75,
-        13: 84,
-        14: 91,
-        15: 95,
-        16: 98,
-    }
-    if scale in mapping:
-        return mapping[scale]
-
-    raise fastapi.HTTPException(
-        status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-        detail="Unknown WISC subtest score.",
-    )
+    try:
+        return norms.wisc_subtest_percentile(scale).tolist()  # type: ignore[no-any-return]
+    except ValueError as exc_info:
+        raise fastapi.HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Unknown WISC subtest score.",
+        ) from exc_info
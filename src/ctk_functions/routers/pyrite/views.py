@@ -1,9 +1,11 @@
 """Endpoints for the file conversion router."""
 
+from typing import Literal
+
 import fastapi
 
 from ctk_functions.core import config
-from ctk_functions.routers.pyrite import controller
+from ctk_functions.routers.pyrite import controller, schemas
 
 logger = config.get_logger()
 router = fastapi.APIRouter(prefix="")
@@ -26,3 +28,63 @@ def post_pyrite_report(
         content=docx_bytes,
         media_type="application/vnd.openxmlformats-officedocument.wordprocessingml.document",
     )
+
+
+@router.get("/pyrite/{mrn}/preview")
+def get_pyrite_preview(
+    mrn: str,
+    output_format: Literal["json", "html"] = "json",
+) -> fastapi.Response:
+    """GET endpoint for a preview of a Pyrite report.
+
+    Args:
+        mrn: The identifier of the participant.
+        output_format: Whether to return the preview as JSON or HTML.
+
+    Returns:
+        A FastAPI response containing the JSON or HTML preview.
+    """
+    report_preview = controller.get_pyrite_preview(mrn, output_format)
+    if isinstance(report_preview, str):
+        return fastapi.responses.HTMLResponse(content=report_preview)
+    return fastapi.Response(
+        content=report_preview.model_dump_json(),
+        media_type="application/json",
+    )
+
+
+@router.post("/pyrite/export")
+def post_cohort_export(
+    request: schemas.PostCohortExportRequest,
+) -> fastapi.responses.StreamingResponse:
+    """POST endpoint for exporting the Pyrite table data of a cohort.
+
+    Args:
+        request: The MRNs of the participants.
+
+    Returns:
+        A streaming response of a CSV file with the columns mrn, table, row,
+        column, and value.
+    """
+    return fastapi.responses.StreamingResponse(
+        controller.get_cohort_export(request.mrns),
+        media_type="text/csv",
+        headers={"Content-Disposition": 'attachment; filename="pyrite_export.csv"'},
+    )
+
+
+@router.post("/pyrite/snapshots")
+def post_snapshot_refresh(
+    request: schemas.PostSnapshotRefreshRequest,
+) -> schemas.PostSnapshotRefreshResponse:
+    """POST endpoint for refreshing the Pyrite snapshots of participants.
+
+    Args:
+        request: The MRNs of the participants, if omitted all stale snapshots
+            are refreshed.
+
+    Returns:
+        The MRNs whose snapshots were refreshed.
+    """
+    mrns = controller.refresh_snapshots(request.mrns)
+    return schemas.PostSnapshotRefreshResponse(mrns=mrns)
@@ -1,10 +1,8 @@
 """Business logic for the Pyrite endpoints."""
 
-import io
-
 import docx
 
-from ctk_functions.core import config
+from ctk_functions.core import config, packaging
 from ctk_functions.routers.pyrite.tables import base
 from ctk_functions.routers.referral import schemas
 
@@ -31,9 +29,7 @@ def post_referral(request: schemas.PostReferralRequest) -> bytes:
         base.ParagraphBlock(content=title, level=2).add_to(doc)
         renderer.add_to(doc)
 
-    out = io.BytesIO()
-    doc.save(out)
-    return out.getvalue()
+    return packaging.document_to_bytes(doc)
 
 
 def _table_to_renderer(
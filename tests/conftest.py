@@ -125,6 +125,17 @@ def _mock_fetch_participant_row(  # noqa: C901, PLR0912
     return _mock_from_column_names(columns, default_value)
 
 
+def _mock_fetch_participant_columns(
+    id_property: Literal["person_id", "EID", "mrn"],
+    mrn: str,
+    table: Any,  # noqa: ANN401
+    column_names: tuple[str, ...],
+) -> dict[str, Any]:
+    """Redirects requests of fetch_participant_columns to the correct mock."""
+    row = _mock_fetch_participant_row(id_property, mrn, table)
+    return {name: getattr(row, name, None) for name in column_names}
+
+
 def _mock_parent_child_sql_request(
     mrn: str, parent_table: type[models.Base], child_table: type[models.Base]
 ) -> tuple[object, object]:
@@ -150,6 +161,10 @@ def mock_sql_calls(mocker: pytest_mock.MockerFixture) -> None:
         "ctk_functions.routers.pyrite.sql_data.fetch_participant_row",
         side_effect=_mock_fetch_participant_row,
     )
+    mocker.patch(
+        "ctk_functions.routers.pyrite.sql_data.fetch_participant_columns",
+        side_effect=_mock_fetch_participant_columns,
+    )
     mocker.patch(
         "ctk_functions.routers.pyrite.tables.generic.parent_child._parent_child_sql_request",
         side_effect=_mock_parent_child_sql_request,
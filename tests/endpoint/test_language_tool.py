@@ -15,3 +15,17 @@ def test_language_tool_post(client: testclient.TestClient) -> None:
 
     assert response.status_code == status.HTTP_200_OK
     assert response.json() == expected
+
+
+def test_language_tool_batch_post(client: testclient.TestClient) -> None:
+    """Tests the POST language tool batch endpoint."""
+    texts = ["Hello , world!", "", "Goodbye , world!"]
+    expected = ["Hello, world!", "", "Goodbye, world!"]
+
+    response = client.post(
+        "/language-tool/batch",
+        json={"texts": texts, "rules": ("COMMA_PARENTHESIS_WHITESPACE",)},
+    )
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json() == expected
@@ -16,3 +16,25 @@ def test_get_pyrite(
 
     assert response.status_code == status.HTTP_200_OK
     docx.Document(str(tmp_path / "file.docx"))  # Test that it's a valid .docx file.
+
+
+def test_get_pyrite_preview_json(
+    client: testclient.TestClient, mock_sql_calls: None
+) -> None:
+    """Test the Pyrite preview endpoint with JSON output."""
+    response = client.get("/pyrite/12345/preview")
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.headers["content-type"] == "application/json"
+    assert response.json()["nodes"]
+
+
+def test_get_pyrite_preview_html(
+    client: testclient.TestClient, mock_sql_calls: None
+) -> None:
+    """Test the Pyrite preview endpoint with HTML output."""
+    response = client.get("/pyrite/12345/preview", params={"output_format": "html"})
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.headers["content-type"].startswith("text/html")
+    assert "<table>" in response.text
@@ -0,0 +1,55 @@
+"""Parity tests (with LanguageTool) for the local implementations of rules."""
+
+import pytest
+
+from ctk_functions.microservices import language_rules, language_tool
+
+# Sentences with and without matches of the local rules, modelled on intake reports.
+PARITY_TEXTS = (
+    "she was born at 38 weeks of gestation with a vaginal delivery.",
+    "Lea  attended a 2 week summer camp.  she enjoyed it.",
+    "He attended a three week program in US before moving to the US.",
+    "They moved from U.S. to Canada. they returned in 2020.",
+    "At the sessions, Lea presented as a (e.g. cooperative, friendly, etc.) girl.",
+    "he was seen by Dr. smith at 3 p.m. on Monday.",
+    "Lea uses an iPad daily. it helps with homework!  does it? yes.",
+    "He stayed 1 week in the hospital and returned 2 weeks later.",
+    # Paragraphs still hold the UUIDs of LLM placeholders during corrections.
+    "c2b1e7d4-5717-4562-b3fc-2c963f66afa6",
+    "Lea was evaluated in 2020. c2b1e7d4-5717-4562-b3fc-2c963f66afa6",
+    "Her mother reported that a3f9e2b1-0c4d-4e8a-9b7f-6d5c4b3a2f10. she agreed.",
+    "",
+)
+
+
+@pytest.fixture(scope="module")
+def correcter() -> language_tool.LanguageCorrecter:
+    """Fixture for the LanguageCorrecter class."""
+    return language_tool.LanguageCorrecter(
+        url="http://0.0.0.0:8010/v2",
+        enabled_rules=[],
+    )
+
+
+@pytest.mark.parametrize("rule_id", sorted(language_rules.LOCAL_RULES))
+@pytest.mark.parametrize("text", PARITY_TEXTS)
+@pytest.mark.asyncio
+async def test_local_rule_parity(
+    correcter: language_tool.LanguageCorrecter,
+    rule_id: str,
+    text: str,
+) -> None:
+    """Tests that local rules find the same replacements as LanguageTool."""
+    correcter.remote_rules = {rule_id}
+    response = await correcter.check(text)
+    expected = sorted(
+        (
+            (match.offset, match.offset + match.length, match.replacements[0].value)
+            for match in response.matches
+        ),
+        reverse=True,
+    )
+
+    actual = language_rules.find_matches(text, [rule_id])
+
+    assert actual == expected
@@ -0,0 +1,101 @@
+"""Fixtures for unit tests that run against an in-memory database."""
+
+import contextlib
+import datetime
+import uuid
+from collections.abc import Callable, Generator
+
+import pytest
+import pytest_mock
+import sqlalchemy
+from sqlalchemy import engine, pool
+from sqlalchemy.orm import session
+
+from ctk_functions.microservices.sql import models
+
+SQL_COLLATION = "SQL_Latin1_General_CP1_CI_AS"
+
+
+def create_sqlite_engine() -> engine.Engine:
+    """Creates an in-memory SQLite database with the NextGen schema."""
+    sqlite_engine = sqlalchemy.create_engine("sqlite://", poolclass=pool.StaticPool)
+
+    @sqlalchemy.event.listens_for(sqlite_engine, "connect")
+    def _on_connect(dbapi_connection: object, _: object) -> None:
+        dbapi_connection.execute("ATTACH DATABASE ':memory:' AS nextgen")  # type: ignore[attr-defined]
+        dbapi_connection.create_collation(  # type: ignore[attr-defined]
+            SQL_COLLATION, lambda a, b: (a > b) - (a < b)
+        )
+
+    models.Base.metadata.create_all(sqlite_engine)
+    return sqlite_engine
+
+
+@pytest.fixture
+def sqlite_engine(mocker: pytest_mock.MockerFixture) -> engine.Engine:
+    """Replaces the SQL database by an in-memory SQLite database."""
+    sqlite_engine = create_sqlite_engine()
+
+    @contextlib.contextmanager
+    def get_session() -> Generator[session.Session, None, None]:
+        with session.Session(sqlite_engine) as sess:
+            yield sess
+
+    for name in ("get_session", "get_read_session"):
+        mocker.patch(
+            f"ctk_functions.microservices.sql.client.{name}",
+            side_effect=get_session,
+        )
+    return sqlite_engine
+
+
+@pytest.fixture
+def add_participant(
+    sqlite_engine: engine.Engine,
+) -> Callable[[str, int | None], None]:
+    """Returns a function that adds a participant to the SQLite database.
+
+    The function takes the participant's MRN and their SCQ total score; if the
+    score is None, then no SCQ row is added.
+    """
+
+    def _add_participant(mrn: str, scq_total: int | None) -> None:
+        eid = f"EID{mrn}"
+        with session.Session(sqlite_engine) as sess:
+            sess.add(
+                models.CmiHbnIdTrack(
+                    person_nbr=mrn,
+                    person_id=uuid.uuid4(),
+                    create_timestamp=datetime.datetime(2024, 1, 1),  # noqa: DTZ001
+                    last_name="Doe",
+                    first_name="Jane",
+                    MRN=mrn,
+                    GUID=eid,
+                )
+            )
+            if scq_total is not None:
+                sess.add(
+                    models.Scq(
+                        EID=eid,
+                        START_DATE=mrn,
+                        Season="Fall",
+                        SCQ_Total=scq_total,
+                    )
+                )
+            sess.commit()
+
+    return _add_participant
+
+
+@pytest.fixture
+def select_statements(sqlite_engine: engine.Engine) -> list[str]:
+    """Records the SELECT statements executed on the SQLite database."""
+    statements: list[str] = []
+
+    @sqlalchemy.event.listens_for(sqlite_engine, "before_cursor_execute")
+    def _on_execute(*args: object) -> None:
+        statement = str(args[2])
+        if statement.startswith("SELECT"):
+            statements.append(statement)
+
+    return statements
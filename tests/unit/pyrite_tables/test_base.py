@@ -6,6 +6,7 @@ import cmi_docx
 import docx
 import pytest
 from docx import document, table
+from docx.enum import text
 
 from ctk_functions.routers.pyrite import types
 from ctk_functions.routers.pyrite.tables import base
@@ -46,19 +47,62 @@ def test_conditional_cell_style(tbl: table.Table) -> None:
 
 
 def test_conditional_table_style(tbl: table.Table) -> None:
-    """Tests the conditional table style happy path."""
-    style = base.ConditionalTableStyle(
-        condition=lambda _, row, __: row == 0,
-        style=BOLD_TABLE_STYLE,
+    """Tests that table styles are resolved once per row and applied."""
+    calls = []
+
+    def condition(markup: base.WordTableMarkup, row: int) -> bool:
+        calls.append(row)
+        return markup.rows[row][1].content == "0,1"
+
+    style = base.ConditionalTableStyle(condition=condition, style=BOLD_TABLE_STYLE)
+    markup = base.WordTableMarkup(
+        rows=[
+            [
+                base.WordTableCell(
+                    content=cell.text,
+                    formatter=base.Formatter(conditional_table_styles=[style]),
+                )
+                for cell in row.cells
+            ]
+            for row in tbl.rows
+        ]
     )
 
-    style.apply(tbl, 0, 0)
-    style.apply(tbl, 1, 0)
+    table_styles = [markup.resolve_table_styles(row) for row in range(2)]
+    for row in range(2):
+        for col in range(2):
+            markup.rows[row][col].formatter.format(
+                tbl, row, col, table_styles[row][col]
+            )
 
+    assert calls == [0, 1]
+    assert table_styles == [(BOLD_TABLE_STYLE, BOLD_TABLE_STYLE), (None, None)]
     assert tbl.rows[0].cells[0].paragraphs[0].runs[0].bold
     assert not tbl.rows[1].cells[0].paragraphs[0].runs[0].bold
 
 
+def test_conditional_table_styles_are_folded() -> None:
+    """Tests that the table styles that hold are folded into one style."""
+    left_align = cmi_docx.CellStyle(
+        cmi_docx.ParagraphStyle(alignment=text.WD_PARAGRAPH_ALIGNMENT.LEFT)
+    )
+    formatter = base.Formatter(
+        conditional_table_styles=[
+            base.ConditionalTableStyle(style=BOLD_TABLE_STYLE),
+            base.ConditionalTableStyle(style=left_align),
+        ]
+    )
+    markup = base.WordTableMarkup(
+        rows=[[base.WordTableCell(content="a", formatter=formatter)]]
+    )
+
+    (folded,) = markup.resolve_table_styles(0)
+
+    assert folded == cmi_docx.CellStyle(
+        cmi_docx.ParagraphStyle(bold=True, alignment=text.WD_PARAGRAPH_ALIGNMENT.LEFT)
+    )
+
+
 @pytest.mark.parametrize(
     ("value", "low", "high", "low_inclusive", "high_inclusive", "expected"),
     [
@@ -221,3 +265,53 @@ def test_add_to_procotol() -> None:
 
     assert not isinstance(NotValid, base._AddToProtocol)
     assert isinstance(Valid, base._AddToProtocol)
+
+
+def test_word_document_table_renderer_merges(doc: document.Document) -> None:
+    """Tests that the renderer merges identical cells from the markup."""
+    merge_top = base.Formatter(merge_top=True)
+    merge_right = base.Formatter(merge_right=True)
+    markup = base.WordTableMarkup(
+        rows=[
+            [
+                base.WordTableCell(content="a"),
+                base.WordTableCell(content="b", formatter=merge_right),
+                base.WordTableCell(content="b"),
+            ],
+            [
+                base.WordTableCell(content="a", formatter=merge_top),
+                base.WordTableCell(content="c"),
+                base.WordTableCell(content="d"),
+            ],
+            [
+                base.WordTableCell(content="a", formatter=merge_top),
+                base.WordTableCell(content="c", formatter=merge_right),
+                base.WordTableCell(content="e"),
+            ],
+        ]
+    )
+
+    base.WordDocumentTableRenderer(markup=markup, table_style="Table Grid").add_to(doc)
+
+    tbl = doc.tables[0]
+    column = tbl.columns[0].cells
+    assert column[0]._tc is column[1]._tc is column[2]._tc
+    assert column[0].text == "a"
+    assert tbl.rows[0].cells[1]._tc is tbl.rows[0].cells[2]._tc
+    assert tbl.rows[0].cells[1].text == "b"
+    assert tbl.rows[2].cells[1].text == "c"
+    assert tbl.rows[2].cells[2].text == "e"
+
+
+def test_word_document_table_renderer_merge_top_row(doc: document.Document) -> None:
+    """Tests that merging the top row upwards raises."""
+    markup = base.WordTableMarkup(
+        rows=[
+            [base.WordTableCell(content="a", formatter=base.Formatter(merge_top=True))]
+        ]
+    )
+
+    with pytest.raises(ValueError, match="Cannot merge top row upwards."):
+        base.WordDocumentTableRenderer(markup=markup, table_style="Table Grid").add_to(
+            doc
+        )
@@ -0,0 +1,115 @@
+"""Tests for the vectorized norms engine."""
+
+import statistics
+from collections.abc import Callable
+
+import numpy as np
+import pytest
+
+from ctk_functions.routers.pyrite.tables import norms
+
+
+def test_normal_percentile_matches_normal_distribution() -> None:
+    """Tests the vectorized percentiles against the standard library."""
+    scores = np.arange(40, 161)
+    expected = [
+        statistics.NormalDist(100, 15).cdf(float(score)) * 100 for score in scores
+    ]
+
+    actual = norms.normal_percentile(scores, mean=100, std=15)
+
+    assert actual.shape == scores.shape
+    np.testing.assert_allclose(actual, expected, rtol=1e-12)
+
+
+def test_normal_percentile_at_mean_is_exact() -> None:
+    """Tests that the percentile of the mean is exactly the median."""
+    assert norms.normal_percentile([100], mean=100, std=15).tolist() == [50.0]
+
+
+def test_standard_score_percentile_is_exact() -> None:
+    """Tests that looked up percentiles equal the normal distribution's."""
+    scores = np.array([[40, 85, 100], [115, 160, 100.5]])
+    expected = [
+        [statistics.NormalDist(100, 15).cdf(float(score)) * 100 for score in row]
+        for row in scores
+    ]
+
+    actual = norms.standard_score_percentile(scores)
+
+    assert actual.shape == scores.shape
+    np.testing.assert_allclose(actual[0], expected[0], rtol=0)
+    np.testing.assert_allclose(actual[1], expected[1], rtol=1e-12)
+
+
+@pytest.mark.parametrize(
+    ("value", "expected"), [("65", 65.0), (70, 70.0), ("N/A", None), (None, None)]
+)
+def test_parse_score(value: float | str | None, expected: float | None) -> None:
+    """Tests parsing of table values to scores."""
+    assert norms.parse_score(value) == expected
+
+
+def test_standard_score_qualifier_array() -> None:
+    """Tests converting an array of standard scores, including boundaries."""
+    scores = [59, 59.5, 69, 70, 109, 110, 139, 140]
+
+    actual = norms.standard_score_qualifier(scores)
+
+    assert actual.tolist() == [
+        "extremely low",
+        "very low",
+        "very low",
+        "low",
+        "average",
+        "high average",
+        "very high",
+        "extremely high",
+    ]
+
+
+@pytest.mark.parametrize(
+    ("percentile", "expected"),
+    [
+        (0.009, "extremely low"),
+        (0.01, "very low"),
+        (3, "very low"),
+        (75, "average"),
+        (98, "very high"),
+        (98.5, "extremely high"),
+    ],
+)
+def test_grooved_pegboard_qualifier(percentile: float, expected: str) -> None:
+    """Tests the exclusive lowest and inclusive other pegboard bounds."""
+    assert norms.grooved_pegboard_qualifier(percentile) == expected
+
+
+def test_wisc_subtest_rejects_fractional_scores() -> None:
+    """Tests that fractional scaled scores are rejected."""
+    with pytest.raises(ValueError, match="whole numbers"):
+        norms.wisc_subtest_qualifier([10, 10.5])
+
+
+@pytest.mark.parametrize(
+    "convert",
+    [
+        norms.standard_score_qualifier,
+        norms.grooved_pegboard_qualifier,
+        norms.standard_score_percentile,
+        lambda scores: norms.normal_percentile(scores, mean=100, std=15),
+    ],
+)
+def test_missing_scores_are_rejected(
+    convert: Callable[[list[float | None]], object],
+) -> None:
+    """Tests that NULL scores never become a percentile or qualifier."""
+    with pytest.raises(ValueError, match="finite"):
+        convert([100, None])
+    with pytest.raises(ValueError, match="finite"):
+        convert([np.nan])
+
+
+def test_breakpoint_scale_validates_labels() -> None:
+    """Tests that the number of labels must match the bounds."""
+    with pytest.raises(ValueError, match="one more label"):
+        norms.BreakpointScale(upper_bounds=(1, 2), labels=("a", "b"))
@@ -0,0 +1,91 @@
+"""Tests for the cloai-service client."""
+
+from collections.abc import AsyncGenerator
+
+import aiohttp
+import fastapi
+import pydantic
+import pytest
+import pytest_asyncio
+from aiohttp import test_utils, web
+
+from ctk_functions.microservices import cloai_service
+
+
+class _Answer(pydantic.BaseModel):
+    answer: str
+
+
+@pytest_asyncio.fixture
+async def client() -> AsyncGenerator[tuple[cloai_service.Client, set[object]], None]:
+    """Starts a local cloai-service stand-in and returns a client for it."""
+    peers: set[object] = set()
+
+    async def llm(request: web.Request) -> web.Response:
+        assert request.transport is not None
+        peers.add(request.transport.get_extra_info("peername"))
+        body = await request.json()
+        if request.match_info["endpoint"] == "instructor":
+            return web.json_response({"result": {"answer": body["user_prompt"]}})
+        if body["user_prompt"] == "fail":
+            return web.Response(status=500, text="Model unavailable.")
+        return web.json_response({"result": body["user_prompt"].upper()})
+
+    app = web.Application()
+    app.router.add_post("/llm/{endpoint}", llm)
+    async with test_utils.TestServer(app) as server:
+        llm_client = cloai_service.Client()
+        llm_client.url = str(server.make_url("")).rstrip("/")
+        cloai_service.LATENCY_STATS.clear()
+        yield llm_client, peers
+    await cloai_service.close_session()
+
+
+@pytest.mark.asyncio
+async def test_calls_share_connections(
+    client: tuple[cloai_service.Client, set[object]],
+) -> None:
+    """Test that calls reuse the connection of the shared session."""
+    llm_client, peers = client
+
+    results = [await llm_client.run(f"prompt {index}", "") for index in range(5)]
+    verified = await llm_client.chain_of_verification("prompt", "")
+    answer = await llm_client.call_instructor(_Answer, "prompt", "")
+
+    assert results == [f"PROMPT {index}" for index in range(5)]
+    assert verified == "PROMPT"
+    assert answer == _Answer(answer="prompt")
+    assert len(peers) == 1
+    assert cloai_service.LATENCY_STATS["run"].calls == 5  # noqa: PLR2004
+    assert cloai_service.LATENCY_STATS["cov"].calls == 1
+    assert cloai_service.LATENCY_STATS["instructor"].mean > 0
+
+
+@pytest.mark.asyncio
+async def test_error_response(
+    client: tuple[cloai_service.Client, set[object]],
+) -> None:
+    """Test that error responses raise a bad gateway error."""
+    llm_client, _ = client
+
+    with pytest.raises(fastapi.HTTPException) as exc_info:
+        await llm_client.run("fail", "")
+
+    assert exc_info.value.status_code == fastapi.status.HTTP_502_BAD_GATEWAY
+    assert exc_info.value.detail == "Model unavailable."
+    assert cloai_service.LATENCY_STATS["run"].failures == 1
+
+
+@pytest.mark.asyncio
+async def test_connection_error_is_recorded(unused_tcp_port: int) -> None:
+    """Test that calls without a response are recorded as failures."""
+    llm_client = cloai_service.Client()
+    llm_client.url = f"http://127.0.0.1:{unused_tcp_port}"
+    cloai_service.LATENCY_STATS.clear()
+
+    with pytest.raises(aiohttp.ClientConnectionError):
+        await llm_client.run("prompt", "")
+    await cloai_service.close_session()
+
+    assert cloai_service.LATENCY_STATS["run"].calls == 1
+    assert cloai_service.LATENCY_STATS["run"].failures == 1
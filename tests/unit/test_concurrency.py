@@ -0,0 +1,104 @@
+"""Tests for the fair concurrency limiter."""
+
+import asyncio
+
+import pytest
+import pytest_mock
+
+from ctk_functions.core import concurrency
+
+
+async def _run_calls(
+    limiter: concurrency.FairLimiter,
+    clients: list[str],
+    order: list[str],
+) -> None:
+    """Runs a call per client, recording the order in which they are admitted."""
+    release = asyncio.Event()
+
+    async def call(client: str) -> None:
+        async with limiter.acquire(client):
+            order.append(client)
+            await release.wait()
+
+    tasks = [asyncio.create_task(call(client)) for client in clients]
+    await asyncio.sleep(0)
+    release.set()
+    await asyncio.gather(*tasks)
+
+
+@pytest.mark.asyncio
+async def test_queued_calls_alternate_between_clients() -> None:
+    """Test that a client with many calls does not starve other clients."""
+    limiter = concurrency.FairLimiter(limit=1)
+    order: list[str] = []
+
+    await _run_calls(limiter, ["a", "a", "a", "a", "b", "c"], order)
+
+    assert order == ["a", "a", "b", "c", "a", "a"]
+    assert limiter.in_flight == 0
+    assert limiter.queue_depth == 0
+    assert limiter.stats.admitted == 6  # noqa: PLR2004
+    assert limiter.stats.queued == 5  # noqa: PLR2004
+    assert limiter.stats.max_queue_depth == 5  # noqa: PLR2004
+    assert limiter.stats.max_wait >= limiter.stats.mean_wait > 0
+
+
+@pytest.mark.asyncio
+async def test_limit_is_respected() -> None:
+    """Test that no more calls than the limit run at once."""
+    limiter = concurrency.FairLimiter(limit=3)
+    running = 0
+    max_running = 0
+
+    async def call(client: int) -> None:
+        nonlocal running, max_running
+        async with limiter.acquire(client % 2):
+            running += 1
+            max_running = max(max_running, running)
+            await asyncio.sleep(0)
+            running -= 1
+
+    await asyncio.gather(*(call(client) for client in range(20)))
+
+    assert max_running == 3  # noqa: PLR2004
+    assert limiter.in_flight == 0
+
+
+@pytest.mark.asyncio
+async def test_cancelled_calls_leave_the_queue() -> None:
+    """Test that cancelled waiting calls neither run nor hold a slot."""
+    limiter = concurrency.FairLimiter(limit=1)
+    admitted: list[str] = []
+    release = asyncio.Event()
+
+    async def call(client: str) -> None:
+        async with limiter.acquire(client):
+            admitted.append(client)
+            await release.wait()
+
+    first = asyncio.create_task(call("a"))
+    cancelled = asyncio.create_task(call("b"))
+    last = asyncio.create_task(call("c"))
+    await asyncio.sleep(0)
+    cancelled.cancel()
+    await asyncio.sleep(0)
+    release.set()
+    await asyncio.gather(first, last)
+
+    assert admitted == ["a", "c"]
+    assert limiter.in_flight == 0
+    assert limiter.queue_depth == 0
+
+
+@pytest.mark.asyncio
+async def test_admissions_are_logged(mocker: pytest_mock.MockerFixture) -> None:
+    """Test that every admission logs the limiter's statistics."""
+    logger = mocker.patch.object(concurrency, "logger")
+    limiter = concurrency.FairLimiter(limit=1)
+
+    await _run_calls(limiter, ["a", "b"], [])
+
+    assert logger.debug.call_count == 2  # noqa: PLR2004
+    *_, queued, admitted, _, _, max_queue_depth = logger.debug.call_args.args
+    assert (queued, admitted, max_queue_depth) == (1, 2, 1)
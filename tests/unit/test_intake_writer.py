@@ -8,7 +8,9 @@ import docx
 import pytest
 import pytest_mock
 
+from ctk_functions.core import word
 from ctk_functions.routers.intake.intake_processing import parser_models, writer
+from ctk_functions.routers.intake.intake_processing.utils import language_utils
 
 
 @dataclasses.dataclass
@@ -140,6 +142,30 @@ def test_set_superscript() -> None:
     assert document.paragraphs[0].runs[1].font.superscript
 
 
+@pytest.mark.asyncio
+async def test_apply_corrections_dynamic_paragraphs(
+    mocker: pytest_mock.MockerFixture,
+) -> None:
+    """Test that only generated paragraphs are sent for corrections."""
+    intake = MockIntake()
+    report = writer.ReportWriter(intake, "gpt-4o")  # type: ignore[arg-type]
+    template_paragraphs = list(report.dynamic_paragraphs)
+    report._insert("Heading", word.StyleName.HEADING_2)
+    inserted = report._insert("she go home.")
+    report._insert("")
+    correct = mocker.patch.object(
+        language_utils.DocumentCorrections, "correct", autospec=True
+    )
+
+    await report.apply_corrections()
+
+    (paragraphs,) = correct.call_args.args[1:]
+    assert template_paragraphs
+    assert all("{{" in paragraph.text for paragraph in template_paragraphs)
+    assert [paragraph.text for paragraph in paragraphs[-2:]] == [inserted.text, ""]
+    assert "Heading" not in [paragraph.text for paragraph in paragraphs]
+
+
 def test__family_psychiatric_history_get_endorsed_diagnoses_no_diagnoses() -> None:
     """Test that the method returns nothing for no diagnoses."""
     history = writer._FamilyPsychiatricHistory(patient=None, llm=None)  # type: ignore[arg-type]
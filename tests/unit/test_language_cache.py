@@ -0,0 +1,50 @@
+"""Tests for the LanguageTool result cache."""
+
+import pathlib
+
+import pytest
+
+from ctk_functions.core import config
+from ctk_functions.microservices import language_cache
+
+
+def test_memory_tier_evicts_least_recently_used() -> None:
+    """Test that the memory tier is bounded and tracks hits and misses."""
+    cache = language_cache.ResultCache(max_size=2)
+
+    cache.put_many({"a": "1", "b": "2"})
+    cache.get_many(["a"])
+    cache.put_many({"c": "3"})
+    found = cache.get_many(["a", "b", "c"])
+
+    assert found == {"a": "1", "c": "3"}
+    assert cache.stats == language_cache.CacheStats(memory_hits=3, misses=1)
+    assert cache.stats.hit_rate == 0.75  # noqa: PLR2004
+
+
+def test_disk_tier_persists(tmp_path: pathlib.Path) -> None:
+    """Test that results on disk are shared and promoted to memory."""
+    path = tmp_path / "language_tool.db"
+    language_cache.ResultCache(max_size=1, path=path).put_many({"a": "1", "b": "2"})
+    cache = language_cache.ResultCache(max_size=1, path=path)
+
+    first = cache.get_many(["a", "b", "missing"])
+    second = cache.get_many(["b"])
+    cache.clear()
+
+    assert first == {"a": "1", "b": "2"}
+    assert second == {"b": "2"}
+    assert cache.stats == language_cache.CacheStats()
+    assert cache.get_many(["a"]) == {}
+    assert cache.stats.misses == 1
+
+
+def test_get_cache_disabled(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that no cache is used if its size is 0."""
+    monkeypatch.setattr(config.get_settings(), "LANGUAGE_TOOL_CACHE_SIZE", 0)
+    language_cache.get_cache.cache_clear()
+
+    cache = language_cache.get_cache()
+    language_cache.get_cache.cache_clear()
+
+    assert cache is None
@@ -0,0 +1,77 @@
+"""Tests for the local implementations of LanguageTool rules."""
+
+import pytest
+
+from ctk_functions.microservices import language_rules
+
+
+def _apply(text: str, matches: list[language_rules.Match]) -> str:
+    for start, end, replacement in matches:
+        text = text[:start] + replacement + text[end:]
+    return text
+
+
+@pytest.mark.parametrize(
+    ("rule_id", "text", "expected"),
+    [
+        ("CONSECUTIVE_SPACES", "She  went   home.", "She went home."),
+        ("CONSECUTIVE_SPACES", "  Indented text.", "  Indented text."),
+        ("THE_US", "They moved to US in 2020.", "They moved to the US in 2020."),
+        ("THE_US", "She lives in the US.", "She lives in the US."),
+        (
+            "THE_US",
+            "He came From U.S.A. last year.",
+            "He came From the U.S.A. last year.",
+        ),
+        ("THE_US", "They told us to wait.", "They told us to wait."),
+        ("WEEK_HYPHEN", "She had a 2 week stay.", "She had a 2-week stay."),
+        ("WEEK_HYPHEN", "A three week course.", "A three-week course."),
+        ("WEEK_HYPHEN", "He stayed 1 week in May.", "He stayed 1 week in May."),
+        (
+            "WEEK_HYPHEN",
+            "Born at 38 weeks of gestation.",
+            "Born at 38 weeks of gestation.",
+        ),
+        (
+            "UPPERCASE_SENTENCE_START",
+            'he is here. she is there! is it? "yes." ok.',
+            'He is here. She is there! Is it? "Yes." Ok.',
+        ),
+        (
+            "UPPERCASE_SENTENCE_START",
+            "He likes toys (e.g. cars, etc. and more) and Dr. smith.",
+            "He likes toys (e.g. cars, etc. and more) and Dr. smith.",
+        ),
+        (
+            "UPPERCASE_SENTENCE_START",
+            "She has an iPad. iPads are fun.",
+            "She has an iPad. iPads are fun.",
+        ),
+        ("UPPERCASE_SENTENCE_START", "First.\n\nsecond", "First.\n\nSecond"),
+        ("UPPERCASE_SENTENCE_START", "It costs 3.5 dollars.", "It costs 3.5 dollars."),
+        (
+            "UPPERCASE_SENTENCE_START",
+            "c2b1e7d4-5717-4562-b3fc-2c963f66afa6",
+            "c2b1e7d4-5717-4562-b3fc-2c963f66afa6",
+        ),
+        (
+            "UPPERCASE_SENTENCE_START",
+            "He was evaluated. e5f0a1c2-7d3b-4c9e-8a6f-1b2c3d4e5f60 she was not.",
+            "He was evaluated. e5f0a1c2-7d3b-4c9e-8a6f-1b2c3d4e5f60 she was not.",
+        ),
+    ],
+)
+def test_local_rules(rule_id: str, text: str, expected: str) -> None:
+    """Test the corrections of each local rule."""
+    matches = language_rules.find_matches(text, [rule_id])
+
+    assert _apply(text, matches) == expected
+
+
+def test_find_matches_skips_overlaps() -> None:
+    """Test that overlapping matches of different rules are not returned."""
+    text = "three week course.  done"
+
+    matches = language_rules.find_matches(text, language_rules.LOCAL_RULES)
+
+    assert matches == [(20, 24, "Done"), (18, 20, " "), (0, 10, "three-week")]
@@ -0,0 +1,85 @@
+"""Tests for the load balancing over LanguageTool servers."""
+
+import contextlib
+
+import aiohttp
+import pytest
+import pytest_mock
+
+from ctk_functions.microservices import language_servers
+
+
+def _pool(n_servers: int) -> language_servers.ServerPool:
+    return language_servers.ServerPool(
+        [f"http://server-{index}" for index in range(n_servers)],
+        cooldown=60,
+        slow_response=10,
+    )
+
+
+def test_selects_least_outstanding() -> None:
+    """Test that requests go to the server with the fewest outstanding requests."""
+    pool = _pool(3)
+
+    with contextlib.ExitStack() as stack:
+        urls = [stack.enter_context(pool.select()) for _ in range(6)]
+        outstanding = list(pool.outstanding)
+
+    assert sorted(urls) == sorted(pool.urls * 2)
+    assert outstanding == [2, 2, 2]
+    assert pool.outstanding == [0, 0, 0]
+
+
+def test_ejects_failing_server() -> None:
+    """Test that a failing server is skipped during its cooldown."""
+    pool = _pool(2)
+
+    with pytest.raises(aiohttp.ClientConnectionError), pool.select() as failed_url:
+        raise aiohttp.ClientConnectionError
+    urls = set()
+    for _ in range(4):
+        with pool.select() as url:
+            urls.add(url)
+
+    assert urls == set(pool.urls) - {failed_url}
+    assert not pool.is_available(pool.urls.index(failed_url))
+
+
+def test_ignores_client_errors() -> None:
+    """Test that a server is not ejected for rejecting a request."""
+    pool = _pool(2)
+    error = aiohttp.ClientResponseError(
+        request_info=None,  # type: ignore[arg-type]
+        history=(),
+        status=400,
+    )
+
+    with pytest.raises(aiohttp.ClientResponseError), pool.select():
+        raise error
+
+    assert all(pool.is_available(index) for index in range(2))
+
+
+def test_ejects_slow_server(mocker: pytest_mock.MockerFixture) -> None:
+    """Test that a server that responds slowly is ejected."""
+    pool = _pool(2)
+    now = [0.0]
+    mocker.patch("time.monotonic", side_effect=lambda: now[0])
+
+    with pool.select() as slow_url:
+        now[0] = 11
+
+    assert not pool.is_available(pool.urls.index(slow_url))
+
+
+def test_uses_ejected_server_if_none_available() -> None:
+    """Test that requests are still sent if all servers are ejected."""
+    pool = _pool(2)
+    for index in range(2):
+        pool._eject(index, "failed")
+    pool._ejected_until[1] = 0.5
+
+    with pool.select() as url:
+        pass
+
+    assert url == pool.urls[1]
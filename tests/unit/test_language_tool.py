@@ -0,0 +1,475 @@
+"""Tests for the LanguageTool replacement utilities."""
+
+import dataclasses
+import itertools
+import json
+import operator
+import random
+import re
+import time
+from collections.abc import AsyncGenerator, Awaitable, Callable, Iterable
+from typing import Any
+
+import aiohttp
+import pytest
+import pytest_asyncio
+import pytest_mock
+import spacy
+from aiohttp import test_utils, web
+
+from ctk_functions.core import config, nlp
+from ctk_functions.microservices import language_cache, language_tool
+
+_EMPTY_RESPONSE = {
+    "software": {
+        "name": "LanguageTool",
+        "version": "6.5",
+        "buildDate": "2024-09-25",
+        "apiVersion": 1,
+        "status": "",
+        "premium": False,
+    },
+    "language": {
+        "name": "English (US)",
+        "code": "en-US",
+        "detectedLanguage": {"name": "English (US)", "code": "en-US"},
+    },
+    "matches": [],
+}
+
+
+def _apply_sequentially(
+    text: str, replacements: list[language_tool.ReplacementData]
+) -> str:
+    for replacement in replacements:
+        text = text[: replacement.start] + replacement.text + text[replacement.end :]
+    return text
+
+
+def test_merge_replacements_combines_overlaps() -> None:
+    """Test that replacements of altered text are mapped to the original."""
+    text = "abc def"
+    replacements = [
+        language_tool.ReplacementData(start=1, end=2, text="XY"),
+        language_tool.ReplacementData(start=2, end=3, text="Z"),
+        language_tool.ReplacementData(start=5, end=6, text=""),
+    ]
+
+    merged = language_tool.merge_replacements(text, replacements)
+
+    assert merged == [
+        language_tool.ReplacementData(start=1, end=2, text="XZ"),
+        language_tool.ReplacementData(start=4, end=5, text=""),
+    ]
+    assert language_tool.apply_replacements(text, merged) == "aXZc ef"
+
+
+def test_merge_replacements_matches_sequential_application() -> None:
+    """Test single-pass application against applying replacements one by one."""
+    rng = random.Random(0)  # noqa: S311
+    for _ in range(500):
+        text = "".join(rng.choices("abc ", k=rng.randint(0, 12)))
+        original = text
+        replacements = []
+        for _ in range(rng.randint(0, 5)):
+            start = rng.randint(0, len(text))
+            end = rng.randint(start, min(len(text), start + 3))
+            replacement = language_tool.ReplacementData(
+                start=start,
+                end=end,
+                text="".join(rng.choices("XY", k=rng.randint(0, 3))),
+            )
+            replacements.append(replacement)
+            text = _apply_sequentially(text, [replacement])
+
+        merged = language_tool.merge_replacements(original, replacements)
+
+        assert language_tool.apply_replacements(original, merged) == text
+        assert all(
+            previous.end <= current.start
+            for previous, current in itertools.pairwise(merged)
+        )
+
+
+@dataclasses.dataclass
+class _LanguageToolStandIn:
+    """A local LanguageTool stand-in with regex-based rules."""
+
+    url: str
+    peers: set[object] = dataclasses.field(default_factory=set)
+    texts: list[str] = dataclasses.field(default_factory=list)
+
+
+# Rule identifiers mapped to the pattern and replacement of their matches.
+_STAND_IN_RULES = {
+    "CONSECUTIVE_SPACES": (re.compile(r" {2,}"), " "),
+    "NON3PRS_VERB": (re.compile(r"(?<=\bshe )go\b"), "goes"),
+}
+
+
+def _stand_in_match(
+    rule_id: str, offset: int, length: int, replacement: str
+) -> dict[str, Any]:
+    return {
+        "message": rule_id,
+        "shortMessage": "",
+        "offset": offset,
+        "length": length,
+        "replacements": [{"value": replacement}],
+        "context": {"text": "", "offset": 0, "length": 0},
+        "sentence": "",
+        "rule": {
+            "id": rule_id,
+            "description": "",
+            "issueType": "grammar",
+            "category": {"id": "GRAMMAR", "name": "Grammar"},
+        },
+    }
+
+
+@pytest_asyncio.fixture
+async def language_tool_server() -> AsyncGenerator[_LanguageToolStandIn, None]:
+    """Starts a local LanguageTool stand-in."""
+    stand_in = _LanguageToolStandIn(url="")
+    language_cache.get_cache.cache_clear()
+
+    async def check(request: web.Request) -> web.Response:
+        assert request.transport is not None
+        stand_in.peers.add(request.transport.get_extra_info("peername"))
+        data = await request.post()
+        text = str(data["text"])
+        stand_in.texts.append(text)
+        enabled_rules = str(data["enabledRules"]).split(",")
+        matches = [
+            _stand_in_match(
+                rule_id, match.start(), match.end() - match.start(), replacement
+            )
+            for rule_id, (pattern, replacement) in _STAND_IN_RULES.items()
+            if rule_id in enabled_rules
+            for match in pattern.finditer(text)
+        ]
+        matches.sort(key=operator.itemgetter("offset"))
+        return web.Response(text=json.dumps({**_EMPTY_RESPONSE, "matches": matches}))
+
+    app = web.Application()
+    app.router.add_post("/check", check)
+    async with test_utils.TestServer(app) as server:
+        stand_in.url = str(server.make_url("")).rstrip("/")
+        yield stand_in
+    await language_tool.close_session()
+    language_cache.get_cache.cache_clear()
+
+
+async def _time_checks(n_checks: int, check: Callable[[], Awaitable[object]]) -> float:
+    start = time.perf_counter()
+    for _ in range(n_checks):
+        await check()
+    return time.perf_counter() - start
+
+
+@pytest.mark.asyncio
+async def test_check_reuses_connections(
+    language_tool_server: _LanguageToolStandIn,
+    record_property: Callable[[str, object], None],
+) -> None:
+    """Benchmark the shared session against a new session per request."""
+    url, peers = language_tool_server.url, language_tool_server.peers
+    n_checks = 50
+    correcter = language_tool.LanguageCorrecter(["NON3PRS_VERB"], url)
+
+    async def check_with_new_session() -> None:
+        async with aiohttp.ClientSession() as session:
+            response = await session.post(url + "/check", data={"text": "text"})
+            await response.text()
+
+    new_session_time = await _time_checks(n_checks, check_with_new_session)
+    new_session_peers = len(peers)
+    peers.clear()
+    shared_session_time = await _time_checks(n_checks, lambda: correcter.check("text"))
+
+    record_property("new_session_seconds", new_session_time)
+    record_property("shared_session_seconds", shared_session_time)
+    assert new_session_peers == n_checks
+    assert len(peers) == 1
+    assert language_tool.get_limiter().stats.admitted == n_checks
+
+
+@pytest.mark.asyncio
+async def test_batch_replacements_match_single_texts(
+    language_tool_server: _LanguageToolStandIn,
+    mocker: pytest_mock.MockerFixture,
+) -> None:
+    """Test that batched texts are corrected as if checked one by one."""
+    mocker.patch.object(
+        config.get_settings(), "LANGUAGE_TOOL_MAX_REQUEST_CHARACTERS", 40
+    )
+    texts = [
+        "she go  home and she go out.",
+        "",
+        "Nothing to do.",
+        "Two  spaces.",
+        "she go",
+    ]
+    correcter = language_tool.LanguageCorrecter(
+        _STAND_IN_RULES, language_tool_server.url
+    )
+
+    batch_replacements = await correcter.provide_batch_replacements(texts)
+    n_batch_requests = len(language_tool_server.texts)
+    single_replacements = [await correcter.provide_replacements(text) for text in texts]
+
+    assert batch_replacements == single_replacements
+    assert [
+        _apply_sequentially(text, replacements)
+        for text, replacements in zip(texts, batch_replacements, strict=True)
+    ] == [
+        "she goes home and she goes out.",
+        "",
+        "Nothing to do.",
+        "Two spaces.",
+        "she goes",
+    ]
+    # Two batches in the first round, and one re-check of the first text.
+    assert n_batch_requests == 3  # noqa: PLR2004
+
+
+@pytest.mark.asyncio
+async def test_correct_batch(language_tool_server: _LanguageToolStandIn) -> None:
+    """Test that texts are corrected in order in a single request."""
+    correcter = language_tool.LanguageCorrecter(
+        ["NON3PRS_VERB"], language_tool_server.url
+    )
+
+    corrected = await correcter.correct_batch(["she go", "", "Fine.", "and she go"])
+
+    assert corrected == ["she goes", "", "Fine.", "and she goes"]
+    assert language_tool_server.texts == ["she go\n\nFine.\n\nand she go"]
+
+
+@pytest.mark.asyncio
+async def test_check_skips_unreachable_server(
+    language_tool_server: _LanguageToolStandIn,
+    unused_tcp_port: int,
+) -> None:
+    """Test that requests are balanced away from an unreachable server."""
+    unreachable_url = f"http://127.0.0.1:{unused_tcp_port}"
+    correcter = language_tool.LanguageCorrecter(
+        ["NON3PRS_VERB"], [unreachable_url, language_tool_server.url]
+    )
+
+    texts = [await correcter.correct(f"she go {index}") for index in range(4)]
+
+    assert texts == [f"she goes {index}" for index in range(4)]
+    assert len(language_tool_server.texts) == 4  # noqa: PLR2004
+    assert not correcter.pool.is_available(0)
+
+
+@pytest.mark.asyncio
+async def test_local_rules_are_not_sent(
+    language_tool_server: _LanguageToolStandIn,
+) -> None:
+    """Test that local rules are applied without requests to LanguageTool."""
+    local_correcter = language_tool.LanguageCorrecter(
+        ["CONSECUTIVE_SPACES", "UPPERCASE_SENTENCE_START"], language_tool_server.url
+    )
+    correcter = language_tool.LanguageCorrecter(
+        ["CONSECUTIVE_SPACES", "NON3PRS_VERB"], language_tool_server.url
+    )
+
+    local_text = await local_correcter.correct("she  is here.")
+    n_local_requests = len(language_tool_server.texts)
+    text = await correcter.correct("she  go home.")
+
+    assert local_text == "She is here."
+    assert n_local_requests == 0
+    assert text == "she goes home."
+    assert language_tool_server.texts == ["she go home."]
+
+
+@pytest.mark.asyncio
+async def test_recheck_sentence_window(
+    language_tool_server: _LanguageToolStandIn,
+) -> None:
+    """Test that only the sentence around the last correction is re-checked."""
+    correcter = language_tool.LanguageCorrecter(
+        ["NON3PRS_VERB"], language_tool_server.url
+    )
+    text = "she go home. He is fine. Then she go out and she go in."
+
+    corrected = await correcter.correct(text)
+
+    assert corrected == "she goes home. He is fine. Then she goes out and she goes in."
+    assert language_tool_server.texts == [
+        text,
+        "Then she go out and she goes in.",
+        "Then she goes out and she goes in.",
+    ]
+
+
+def test_recheck_window_covers_overlapping_match() -> None:
+    """Test that the window covers a dropped match up to its end."""
+    # Corrected from "Then she go out. And she runs."
+    text = "Then she goes out. And she runs."
+    alteration = language_tool.Match.model_validate(
+        _stand_in_match("NON3PRS_VERB", 9, 2, "goes")
+    )
+    applied = [language_tool.ReplacementData(start=9, end=11, text="goes")]
+    overlapping = language_tool.Match.model_validate(
+        _stand_in_match("OTHER_RULE", 9, 12, "")
+    )
+
+    window, kept = language_tool.LanguageCorrecter._get_recheck_window(
+        text, [alteration], applied, [overlapping]
+    )
+
+    assert window == (0, len(text))
+    assert kept == []
+
+
+@pytest.mark.asyncio
+async def test_check_batch_caches_results(
+    language_tool_server: _LanguageToolStandIn,
+) -> None:
+    """Test that repeated texts are checked once and then served from cache."""
+    correcter = language_tool.LanguageCorrecter(
+        ["NON3PRS_VERB"], language_tool_server.url
+    )
+    local_correcter = language_tool.LanguageCorrecter(
+        ["CONSECUTIVE_SPACES", "NON3PRS_VERB"], language_tool_server.url
+    )
+    other_correcter = language_tool.LanguageCorrecter(
+        ["NON3PRS_VERB", "OTHER_RULE"], language_tool_server.url
+    )
+    texts = ["she go home.", "Fine.", "she go home."]
+
+    first = await correcter.check_batch(texts)
+    n_first_requests = len(language_tool_server.texts)
+    second = await correcter.check_batch(texts)
+    n_second_requests = len(language_tool_server.texts)
+    await local_correcter.check_batch(texts[:1])
+    await other_correcter.check_batch(texts[:1])
+
+    assert first == second
+    assert [len(matches) for matches in first] == [1, 0, 1]
+    assert language_tool_server.texts == [
+        "she go home.\n\nFine.",
+        "she go home.",
+    ]
+    assert n_first_requests == n_second_requests
+    assert correcter.cache is not None
+    assert correcter.cache.stats.memory_hits == 3  # noqa: PLR2004
+
+
+_TAGS = {"is": "VBZ", "are": "VBP", "be": "VB"}
+
+
+@spacy.language.Language.component("test_tagger")
+def _test_tagger(doc: spacy.tokens.Doc) -> spacy.tokens.Doc:
+    doc.user_data["tagged"] = True
+    for token in doc:
+        token.tag_ = _TAGS.get(token.text, "XX")
+    return doc
+
+
+@pytest.fixture
+def tagged_texts(mocker: pytest_mock.MockerFixture) -> list[str]:
+    """Replaces the spaCy model by a tagger of a few verbs.
+
+    Returns:
+        The texts that were tagged.
+    """
+    pipeline = spacy.blank("en")
+    pipeline.add_pipe("test_tagger", name="tagger")
+    texts: list[str] = []
+    original_pipe = pipeline.pipe
+
+    def pipe(
+        docs: Iterable[str],
+        *,
+        batch_size: int | None = None,
+        disable: Iterable[str] = (),
+    ) -> Iterable[spacy.tokens.Doc]:
+        docs = list(docs)
+        texts.extend(docs)
+        return original_pipe(docs, batch_size=batch_size, disable=disable)
+
+    mocker.patch.object(pipeline, "pipe", side_effect=pipe)
+    mocker.patch.object(nlp, "get_pipeline", return_value=pipeline)
+    language_tool._tag_cache.clear()
+    return texts
+
+
+def _pronoun_match() -> language_tool.Match:
+    return language_tool.Match.model_validate(
+        {
+            **_stand_in_match("PERS_PRONOUN_AGREEMENT", 18, 2, ""),
+            "message": "Use a third-person plural verb with ‘they’.",  # noqa: RUF001
+            "replacements": [{"value": "be"}, {"value": "are"}],
+        }
+    )
+
+
+def test_resolve_pers_pronoun_agreement(tagged_texts: list[str]) -> None:
+    """Test that the verb form table resolves corrections without spaCy."""
+    text = "Lea is here. They is going home. She is happy."
+
+    index = language_tool.LanguageCorrecter._get_correction_index(
+        _pronoun_match(), text
+    )
+
+    assert index == 1
+    assert tagged_texts == []
+
+
+@pytest.mark.parametrize(
+    ("text", "replacements", "expected"),
+    [
+        ("She need help.", ["needs", "needed"], "needs"),
+        ("She proceed now.", ["proceeded", "proceeds"], "proceeds"),
+        ("She bring food.", ["brings", "bringing"], "brings"),
+    ],
+)
+def test_resolve_pers_pronoun_agreement_keeps_tense(
+    tagged_texts: list[str], text: str, replacements: list[str], expected: str
+) -> None:
+    """Test that base forms with past or gerund suffixes keep their tense."""
+    verb = text.split()[1]
+    match = language_tool.Match.model_validate(
+        {
+            **_stand_in_match("PERS_PRONOUN_AGREEMENT", 4, len(verb), ""),
+            "message": "Use a third-person singular verb with ‘she’.",  # noqa: RUF001
+            "replacements": [{"value": value} for value in replacements],
+        }
+    )
+
+    index = language_tool.LanguageCorrecter._get_correction_index(match, text)
+
+    assert replacements[index] == expected
+    assert tagged_texts == []
+
+
+def test_resolve_pers_pronoun_agreement_spacy(
+    tagged_texts: list[str], mocker: pytest_mock.MockerFixture
+) -> None:
+    """Test that only the sentence is tagged, in a single cached batch."""
+    mocker.patch("ctk_functions.microservices.verb_forms.get_tag", return_value=None)
+    text = "Lea is here. They is going home. She is happy."
+    match = _pronoun_match()
+
+    index = language_tool.LanguageCorrecter._get_correction_index(match, text)
+    n_tagged = len(tagged_texts)
+    language_tool.LanguageCorrecter._get_correction_index(match, text)
+
+    assert index == 1
+    assert tagged_texts == [
+        "They is going home. ",
+        "They be going home. ",
+        "They are going home. ",
+    ]
+    assert n_tagged == len(tagged_texts)
+
+    mocker.patch.object(
+        config.get_settings(), "LANGUAGE_TOOL_SPACY_FALLBACK", new=False
+    )
+    with pytest.raises(ValueError, match="suitable replacement"):
+        language_tool.LanguageCorrecter._get_correction_index(match, text)
@@ -0,0 +1,62 @@
+"""Tests for the shared spaCy pipeline."""
+
+import concurrent.futures
+from collections.abc import Generator
+from unittest import mock
+
+import pytest
+import pytest_mock
+import spacy
+from spacy import language, tokens
+
+from ctk_functions.core import nlp
+
+
+@language.Language.component("mark_processed")
+def _mark_processed(doc: tokens.Doc) -> tokens.Doc:
+    doc.user_data["processed"] = True
+    return doc
+
+
+@pytest.fixture
+def load(mocker: pytest_mock.MockerFixture) -> Generator[mock.MagicMock, None, None]:
+    """Replaces the spaCy model with a blank pipeline with two components."""
+    pipeline = spacy.blank("en")
+    pipeline.add_pipe("sentencizer")
+    pipeline.add_pipe("mark_processed")
+    nlp._load_pipeline.cache_clear()
+    yield mocker.patch("spacy.load", return_value=pipeline)
+    nlp._load_pipeline.cache_clear()
+
+
+def test_pipeline_is_loaded_once(load: mock.MagicMock) -> None:
+    """Test that the pipeline is loaded once, on first use."""
+    view = nlp.PipelineView("sentencizer")
+    assert not load.called
+
+    with concurrent.futures.ThreadPoolExecutor(4) as executor:
+        docs = list(executor.map(view, ["One. Two."] * 8))
+
+    load.assert_called_once_with(nlp.MODEL_NAME, exclude=("ner",))
+    assert all(len(list(doc.sents)) == 2 for doc in docs)  # noqa: PLR2004
+
+
+@pytest.mark.usefixtures("load")
+def test_view_disables_other_components() -> None:
+    """Test that a view only runs its own components."""
+    sentencizer = nlp.PipelineView("sentencizer")
+    marker = nlp.PipelineView("mark_processed")
+
+    (sentencized,) = sentencizer.pipe(["One. Two."])
+    marked = marker("One. Two.")
+
+    assert "processed" not in sentencized.user_data
+    assert marked.user_data["processed"]
+    assert not marked.has_annotation("SENT_START")
+
+
+@pytest.mark.usefixtures("load")
+def test_view_unknown_component() -> None:
+    """Test that views of missing components are rejected."""
+    with pytest.raises(ValueError, match="parser"):
+        nlp.PipelineView("parser")("Text.")
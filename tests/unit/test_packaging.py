@@ -0,0 +1,48 @@
+"""Tests for the .docx packaging module."""
+
+import io
+import zipfile
+
+import docx
+import pytest_mock
+
+from ctk_functions.core import config, packaging
+
+settings = config.get_settings()
+
+
+def test_document_to_bytes_roundtrip() -> None:
+    """Tests that the packaged document is a valid .docx file."""
+    doc = docx.Document(str(settings.DATA_DIR / "pyrite_template.docx"))
+    doc.add_paragraph("Hello world!")
+
+    data = packaging.document_to_bytes(doc)
+
+    with zipfile.ZipFile(io.BytesIO(data)) as archive:
+        assert archive.testzip() is None
+    reloaded = docx.Document(io.BytesIO(data))
+    assert reloaded.paragraphs[-1].text == "Hello world!"
+
+
+def test_document_to_bytes_reuses_template_parts(
+    mocker: pytest_mock.MockerFixture,
+) -> None:
+    """Tests that only template parts are cached, and only compressed once."""
+    packaging._template_cache.clear()
+    compress = mocker.spy(packaging, "_compress")
+    first = docx.Document()
+    first.add_paragraph("First")
+    second = docx.Document()
+    second.add_paragraph("Second")
+
+    packaging.document_to_bytes(first)
+    n_first = compress.call_count
+    n_templates = len(packaging._template_cache)
+    packaging.document_to_bytes(second)
+    cached_names = {name for name, _, _ in packaging._template_cache}
+
+    assert n_templates > 0
+    assert compress.call_count - n_first == n_first - n_templates
+    assert len(packaging._template_cache) == n_templates
+    assert "word/document.xml" not in cached_names
+    assert "word/styles.xml" in cached_names
@@ -0,0 +1,71 @@
+"""Tests for the Pyrite data backends."""
+
+import pathlib
+from collections.abc import Callable, Generator
+
+import pytest
+import sqlalchemy
+from sqlalchemy import exc
+
+from ctk_functions.core import config
+from ctk_functions.microservices.sql import models
+from ctk_functions.routers.pyrite import backends, sql_data
+
+
+@pytest.fixture
+def data_file(
+    tmp_path: pathlib.Path,
+    add_participant: Callable[[str, int | None], None],
+) -> pathlib.Path:
+    """Exports two of three participants in the database to a data file."""
+    add_participant("11", 5)
+    add_participant("12", None)
+    add_participant("13", 15)
+    path = tmp_path / "nextgen.db"
+    backends.export_to_file(path, ["11", "12"])
+    return path
+
+
+@pytest.fixture
+def file_backend(
+    data_file: pathlib.Path, monkeypatch: pytest.MonkeyPatch
+) -> Generator[None, None, None]:
+    """Selects the file backend."""
+    settings = config.get_settings()
+    monkeypatch.setattr(settings, "PYRITE_DATA_BACKEND", "file")
+    monkeypatch.setattr(settings, "PYRITE_DATA_FILE", data_file)
+    backends.get_backend.cache_clear()
+    yield
+    backends.get_backend.cache_clear()
+
+
+def test_export_to_file(data_file: pathlib.Path) -> None:
+    """Test that only the rows of the requested participants are exported."""
+    backend = backends.FileBackend(data_file, mmap_size=2**20)
+
+    with backend.get_session() as session:
+        mrns = session.execute(sqlalchemy.select(models.CmiHbnIdTrack.MRN)).scalars()
+        scq_totals = session.execute(sqlalchemy.select(models.Scq.SCQ_Total)).scalars()
+
+        assert sorted(mrns) == [11, 12]
+        assert list(scq_totals) == [5]
+
+
+def test_file_backend_is_read_only(data_file: pathlib.Path) -> None:
+    """Test that the file backend cannot modify the data file."""
+    backend = backends.FileBackend(data_file, mmap_size=0)
+
+    with backend.get_session() as session, pytest.raises(exc.OperationalError):
+        session.execute(sqlalchemy.delete(models.Scq))
+
+
+def test_sql_data_reads_from_file_backend(
+    file_backend: None, sqlite_engine: sqlalchemy.Engine
+) -> None:
+    """Test that Pyrite fetches rows through the selected backend."""
+    models.Base.metadata.drop_all(sqlite_engine)
+
+    row = sql_data.fetch_participant_row("EID", "11", models.Scq)
+
+    assert isinstance(backends.get_backend(), backends.FileBackend)
+    assert row.SCQ_Total == 5  # noqa: PLR2004
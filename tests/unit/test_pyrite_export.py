@@ -0,0 +1,55 @@
+"""Tests for the set-based cohort export of Pyrite table data."""
+
+from collections.abc import Callable
+
+import pytest
+
+from ctk_functions.microservices.sql import models
+from ctk_functions.routers.pyrite import export, sql_data
+from ctk_functions.routers.pyrite.tables import base
+
+
+def test_prefetch_queries_each_table_once(
+    add_participant: Callable[[str, int | None], None],
+    select_statements: list[str],
+) -> None:
+    """Test that a prefetch batch loads each table once for all participants."""
+    add_participant("1", 5)
+    add_participant("2", 15)
+    add_participant("3", None)
+
+    with sql_data.prefetch(["1", "2", "3", "4"]) as found:
+        rows = [sql_data.fetch_participant_row("EID", mrn, models.Scq) for mrn in "12"]
+        with pytest.raises(base.TableDataNotFoundError):
+            sql_data.fetch_participant_row("EID", "3", models.Scq)
+
+    assert found == ("1", "2", "3")
+    assert [row.SCQ_Total for row in rows] == [5, 15]
+    assert len(select_statements) == 2  # noqa: PLR2004
+    assert not sql_data.is_prefetching()
+
+
+def test_iter_cohort_csv(add_participant: Callable[[str, int | None], None]) -> None:
+    """Test the long format export of a cohort."""
+    add_participant("1", 5)
+    add_participant("2", None)
+
+    lines = "".join(export.iter_cohort_csv(["1", "2"], chunk_size=1)).splitlines()
+
+    assert lines[0] == "mrn,table,row,column,value"
+    assert "1,scq,0,Score,5" in lines
+    assert not any(line.startswith("2,") for line in lines)
+
+
+def test_iter_cohort_csv_bypasses_producer_caches(
+    add_participant: Callable[[str, int | None], None],
+) -> None:
+    """Test that the export neither reads nor fills the producers' caches."""
+    add_participant("1", 5)
+    producer = export.get_data_producers()["scq"]
+    cache_info = producer.fetch.cache_info()
+
+    lines = "".join(export.iter_cohort_csv(["1"])).splitlines()
+
+    assert "1,scq,0,Score,5" in lines
+    assert producer.fetch.cache_info() == cache_info
@@ -0,0 +1,56 @@
+"""Tests for the introduction of the Pyrite report."""
+
+import datetime
+from typing import Any
+
+import pytest_mock
+
+from ctk_functions.microservices.sql import models
+from ctk_functions.routers.pyrite.reports import introduction, sections
+
+
+def test_introduction_fetches_dates_once_per_table(
+    mocker: pytest_mock.MockerFixture,
+) -> None:
+    """Test that all date columns are fetched in a single query per table."""
+    wiat_date = datetime.date(2024, 1, 1)
+    fetch = mocker.patch(
+        "ctk_functions.routers.pyrite.sql_data.fetch_participant_columns",
+        side_effect=lambda _, __, ___, column_names: dict.fromkeys(column_names)
+        | {"WIAT_Date": wiat_date},
+    )
+
+    intro = introduction.test_ids_to_introduction("mrn", ["wiat_4", "wisc_5"])
+
+    fetch.assert_called_once()
+    assert fetch.call_args.args[2] is models.SummaryScores
+    assert set(fetch.call_args.args[3]) == {
+        "WIAT_Date",
+        "WIAT_Part2_Date",
+        "WIAT_Screen_Date",
+        "WIAT_Writing_date",
+        "WISC_Date",
+    }
+    overview_sections = [
+        section for section in intro if isinstance(section, sections.RunsSection)
+    ]
+    assert [section.content[-1] for section in overview_sections] == [
+        str(wiat_date),
+        str(wiat_date),
+        str(wiat_date),
+        "FILL-IN",
+    ]
+
+
+def test_test_overview_prefers_first_column() -> None:
+    """Test that the first non-null column takes priority."""
+    overview = introduction.TestOverviewManager().wiat_4_essay
+    first_date = datetime.date(2024, 1, 1)
+    rows: dict[type[models.Base], dict[str, Any]] = {
+        models.SummaryScores: {
+            "WIAT_Writing_date": first_date,
+            "WIAT_Date": datetime.date(2023, 1, 1),
+        }
+    }
+
+    assert overview.select_data(rows) == first_date
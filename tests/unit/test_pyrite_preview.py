@@ -0,0 +1,125 @@
+"""Tests for the Pyrite preview rendering."""
+
+import cmi_docx
+
+from ctk_functions.routers.pyrite import preview
+from ctk_functions.routers.pyrite.reports import sections
+from ctk_functions.routers.pyrite.tables import base
+
+
+def test_paragraph_section_to_preview() -> None:
+    """Test converting a ParagraphSection with a subsection to a preview."""
+    section = sections.ParagraphSection(
+        content="Hello world!",
+        style="Heading 1",
+        subsections=[
+            sections.ParagraphSection(
+                content="Goodbye world!", style=cmi_docx.ParagraphStyle(bold=True)
+            ),
+            sections.ParagraphSection(
+                content="Hidden", style=None, condition=lambda: False
+            ),
+        ],
+    )
+
+    nodes = section.to_preview()
+
+    assert len(nodes) == 2  # noqa: PLR2004
+    assert isinstance(nodes[0], preview.PreviewParagraph)
+    assert isinstance(nodes[1], preview.PreviewParagraph)
+    assert nodes[0].text == "Hello world!"
+    assert nodes[0].style_name == "Heading 1"
+    assert nodes[1].text == "Goodbye world!"
+    assert nodes[1].style.bold
+
+
+def test_runs_section_to_preview() -> None:
+    """Test converting a RunsSection to a preview."""
+    section = sections.RunsSection(
+        content=("Test ", "content"),
+        run_styles=("Emphasis", cmi_docx.RunStyle(italic=True)),
+    )
+
+    (node,) = section.to_preview()
+
+    assert isinstance(node, preview.PreviewParagraph)
+    assert node.runs[0].style_name == "Emphasis"
+    assert node.runs[1].style.italic
+    assert node.text == "Test content"
+
+
+def test_table_renderer_to_preview() -> None:
+    """Test that the table preview resolves styles and merges."""
+    bold = cmi_docx.CellStyle(cmi_docx.ParagraphStyle(bold=True))
+    merging = base.Formatter(merge_top=True)
+    markup = base.WordTableMarkup(
+        rows=[
+            [
+                base.WordTableCell(
+                    content="A",
+                    formatter=base.Formatter(
+                        conditional_cell_styles=[
+                            base.ConditionalCellStyle(
+                                condition=lambda text: text == "A", style=bold
+                            )
+                        ]
+                    ),
+                ),
+                base.WordTableCell(content="B"),
+            ],
+            [
+                base.WordTableCell(content="A", formatter=merging),
+                base.WordTableCell(content="C", formatter=merging),
+            ],
+        ]
+    )
+    renderer = base.WordDocumentTableRenderer(markup=markup)
+
+    table = renderer.to_preview()
+
+    assert len(table.rows[0]) == 2  # noqa: PLR2004
+    assert len(table.rows[1]) == 1
+    assert table.rows[0][0].row_span == 2  # noqa: PLR2004
+    assert table.rows[0][0].style.bold
+    assert not table.rows[0][1].style.bold
+    assert table.rows[1][0].content == "C"
+
+
+def test_preview_document_replace_and_html() -> None:
+    """Test text replacement and HTML rendering of a preview document."""
+    document = preview.PreviewDocument(
+        nodes=[
+            preview.paragraph("{{FULL_NAME}} <report>", "Heading 1"),
+            preview.PreviewTable(
+                rows=[[preview.PreviewCell(content="{{FULL_NAME}}", col_span=2)]]
+            ),
+            preview.PreviewPageBreak(),
+        ]
+    )
+
+    document.replace({"{{FULL_NAME}}": "Lea Test"})
+    html = document.to_html()
+
+    assert '<h1 class="heading-1">Lea Test &lt;report&gt;</h1>' in html
+    assert '<td colspan="2">Lea Test</td>' in html
+    assert '<hr class="page-break">' in html
+
+
+def test_preview_document_json_roundtrip() -> None:
+    """Test that the preview document can be serialized and validated."""
+    document = preview.PreviewDocument(
+        nodes=[preview.paragraph("Text"), preview.PreviewPageBreak()]
+    )
+
+    parsed = preview.PreviewDocument.model_validate_json(document.model_dump_json())
+
+    assert parsed == document
+
+
+def test_paragraph_block_to_preview() -> None:
+    """Test that paragraph blocks map their level to a heading style."""
+    block = base.ParagraphBlock(content="Title", level=2)
+
+    para = block.to_preview()
+
+    assert para.style_name == "Heading 2"
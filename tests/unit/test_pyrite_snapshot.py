@@ -0,0 +1,115 @@
+"""Tests for the Pyrite snapshot store."""
+
+import datetime
+import decimal
+import pathlib
+import uuid
+from collections.abc import Callable, Generator
+
+import pytest
+import pytest_mock
+
+from ctk_functions.core import config
+from ctk_functions.microservices.sql import models
+from ctk_functions.routers.pyrite import controller, snapshot, sql_data
+from ctk_functions.routers.pyrite.tables import base
+
+
+@pytest.fixture
+def snapshot_store(
+    tmp_path: pathlib.Path, monkeypatch: pytest.MonkeyPatch
+) -> Generator[None, None, None]:
+    """Enables the snapshot store in a temporary directory."""
+    monkeypatch.setattr(
+        config.get_settings(), "PYRITE_SNAPSHOT_PATH", tmp_path / "snapshots.db"
+    )
+    snapshot._get_engine.cache_clear()
+    yield
+    snapshot._get_engine.cache_clear()
+
+
+def test_refresh_snapshots_serves_rows(
+    snapshot_store: None,
+    add_participant: Callable[[str, int | None], None],
+    select_statements: list[str],
+) -> None:
+    """Test that refreshed snapshots are served without database queries."""
+    add_participant("1", 5)
+    add_participant("2", None)
+
+    refreshed = controller.refresh_snapshots(["1", "2", "3"])
+    select_statements.clear()
+    row = sql_data.fetch_participant_row("EID", "1", models.Scq)
+    ids = sql_data.mrn_to_ids("1")
+    with pytest.raises(base.TableDataNotFoundError):
+        sql_data.fetch_participant_row("EID", "2", models.Scq)
+
+    assert refreshed == ("1", "2")
+    assert isinstance(row, models.Scq)
+    assert row.SCQ_Total == 5  # noqa: PLR2004
+    assert ids.EID == "EID1"
+    assert isinstance(ids.person_id, uuid.UUID)
+    assert select_statements == []
+
+
+def test_use_record_looks_up_the_snapshot_once(
+    snapshot_store: None,
+    add_participant: Callable[[str, int | None], None],
+    mocker: pytest_mock.MockerFixture,
+) -> None:
+    """Test that a report's reads are served by a single snapshot lookup."""
+    add_participant("1", 5)
+    controller.refresh_snapshots(["1"])
+    read_record = mocker.spy(snapshot, "_read_record")
+
+    with snapshot.use_record("1") as record:
+        assert sql_data.serves_rows_locally("1")
+        row = sql_data.fetch_participant_row("EID", "1", models.Scq)
+        ids = sql_data.mrn_to_ids("1")
+
+    assert record is not None
+    assert row.SCQ_Total == 5  # noqa: PLR2004
+    assert ids.EID == "EID1"
+    assert read_record.call_count == 1
+    snapshot.get_record("1")
+    assert read_record.call_count == 2  # noqa: PLR2004
+
+
+def test_stale_snapshots_are_ignored(
+    snapshot_store: None,
+    add_participant: Callable[[str, int | None], None],
+) -> None:
+    """Test that stale snapshots are not served, and refreshed by default."""
+    add_participant("1", 5)
+    record = snapshot.SnapshotRecord(ids={}, tables={})
+    stale_time = datetime.datetime.now(datetime.UTC) - datetime.timedelta(days=2)
+    snapshot.put_records({"1": record}, refreshed_at=stale_time)
+
+    assert snapshot.get_record("1") is None
+    assert snapshot.get_stale_mrns() == ("1",)
+
+    controller.refresh_snapshots()
+
+    fresh_record = snapshot.get_record("1")
+    assert fresh_record is not None
+    assert fresh_record.covers(models.Scq)
+    assert snapshot.get_stale_mrns() == ()
+
+
+def test_snapshot_record_json_round_trip() -> None:
+    """Test that column types unsupported by JSON survive serialization."""
+    record = snapshot.SnapshotRecord(
+        ids={"person_id": uuid.UUID(int=1)},
+        tables={
+            "Wisc5": {
+                "WISC_FSIQ": 100,
+                "WISC_FSIQ_Percentile": decimal.Decimal("50.5"),
+                "WISC_Date": datetime.date(2024, 1, 2),
+            },
+            "Scq": None,
+        },
+    )
+
+    actual = snapshot.SnapshotRecord.from_json(record.to_json())
+
+    assert actual == record
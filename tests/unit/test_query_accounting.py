@@ -0,0 +1,75 @@
+"""Tests for the accounting of SQL statements."""
+
+import fastapi
+import pytest
+import sqlalchemy
+from fastapi import testclient
+from sqlalchemy import engine, pool
+
+from ctk_functions.core import middleware, query_accounting
+
+
+@pytest.fixture
+def instrumented_engine() -> engine.Engine:
+    """Returns an instrumented in-memory SQLite engine."""
+    sqlite_engine = sqlalchemy.create_engine("sqlite://", poolclass=pool.StaticPool)
+    query_accounting.instrument(sqlite_engine)
+    return sqlite_engine
+
+
+def _execute(target: engine.Engine, n_times: int) -> None:
+    with target.connect() as connection:
+        for _ in range(n_times):
+            connection.execute(sqlalchemy.text("SELECT 1"))
+
+
+def test_track_queries_nested(instrumented_engine: engine.Engine) -> None:
+    """Test that statements are recorded in all active contexts."""
+    _execute(instrumented_engine, 1)
+
+    with query_accounting.track_queries() as outer:
+        _execute(instrumented_engine, 1)
+        with query_accounting.track_queries() as inner:
+            _execute(instrumented_engine, 2)
+
+    assert outer.statements == 3  # noqa: PLR2004
+    assert inner.statements == 2  # noqa: PLR2004
+    assert inner.duration > 0
+    assert outer.most_repeated() == ("SELECT 1", 3)
+
+
+def test_instrument_is_idempotent(instrumented_engine: engine.Engine) -> None:
+    """Test that instrumenting an engine twice does not double count."""
+    query_accounting.instrument(instrumented_engine)
+
+    with query_accounting.track_queries() as stats:
+        _execute(instrumented_engine, 1)
+
+    assert stats.statements == 1
+
+
+def test_query_budget_exceeded(instrumented_engine: engine.Engine) -> None:
+    """Test that exceeding the query budget fails with the repeated statement."""
+    with (
+        pytest.raises(
+            query_accounting.QueryBudgetExceededError,
+            match="Executed 3 times: SELECT 1",
+        ),
+        query_accounting.query_budget(2),
+    ):
+        _execute(instrumented_engine, 3)
+
+
+def test_middleware_adds_query_headers(instrumented_engine: engine.Engine) -> None:
+    """Test that the statements of a synchronous endpoint are in the headers."""
+    app = fastapi.FastAPI()
+    app.add_middleware(middleware.LoggingMiddleware)
+
+    @app.get("/")
+    def endpoint() -> None:
+        _execute(instrumented_engine, 2)
+
+    response = testclient.TestClient(app).get("/", headers={"X-Request-Id": "abc"})
+
+    assert response.headers["X-Query-Count"] == "2"
+    assert float(response.headers["X-Query-Time-Ms"]) >= 0
@@ -0,0 +1,81 @@
+"""Tests for the routing of read-only sessions over read replicas."""
+
+import pathlib
+import sqlite3
+
+import pytest
+import sqlalchemy
+from sqlalchemy import engine
+
+from ctk_functions.microservices.sql import client
+
+
+def _create_database(path: pathlib.Path, name: str) -> engine.Engine:
+    """Creates a read-only SQLite database that identifies itself by name."""
+    if name != "missing":
+        with sqlite3.connect(path) as connection:
+            connection.execute("CREATE TABLE origin (name TEXT)")
+            connection.execute("INSERT INTO origin VALUES (?)", (name,))
+        connection.close()
+    return sqlalchemy.create_engine(f"sqlite:///file:{path}?mode=ro&uri=true")
+
+
+def _session_origin(router: client.ReadReplicaRouter) -> str:
+    with router.get_session() as session:
+        return str(session.execute(sqlalchemy.text("SELECT name FROM origin")).scalar())
+
+
+@pytest.fixture
+def databases(tmp_path: pathlib.Path) -> dict[str, engine.Engine]:
+    """Creates a primary database, two replicas, and one unreachable replica."""
+    return {
+        name: _create_database(tmp_path / f"{name}.db", name)
+        for name in ("primary", "replica_a", "replica_b", "missing")
+    }
+
+
+def test_round_robin_skips_unavailable_replicas(
+    databases: dict[str, engine.Engine],
+) -> None:
+    """Test that sessions alternate over the available replicas."""
+    router = client.ReadReplicaRouter(
+        databases["primary"],
+        [databases["replica_a"], databases["missing"], databases["replica_b"]],
+        cooldown=60,
+    )
+
+    origins = [_session_origin(router) for _ in range(6)]
+
+    assert set(origins) == {"replica_a", "replica_b"}
+    assert origins[0] != origins[1]
+    assert router._unavailable_until[1] > 0
+
+
+def test_falls_back_to_primary(databases: dict[str, engine.Engine]) -> None:
+    """Test that the primary is used if no replica is available."""
+    router = client.ReadReplicaRouter(
+        databases["primary"], [databases["missing"]], cooldown=60
+    )
+
+    assert _session_origin(router) == "primary"
+    assert _session_origin(router) == "primary"
+
+
+def test_retries_replica_after_cooldown(
+    tmp_path: pathlib.Path, databases: dict[str, engine.Engine]
+) -> None:
+    """Test that an unavailable replica is used again after its cooldown."""
+    replica_path = tmp_path / "late.db"
+    replica = _create_database(replica_path, "missing")
+    router = client.ReadReplicaRouter(databases["primary"], [replica], cooldown=0)
+
+    assert _session_origin(router) == "primary"
+    _create_database(replica_path, "late")
+    assert _session_origin(router) == "late"
+
+
+def test_no_replicas_uses_primary(databases: dict[str, engine.Engine]) -> None:
+    """Test that the primary is used without replicas."""
+    router = client.ReadReplicaRouter(databases["primary"], [], cooldown=60)
+
+    assert _session_origin(router) == "primary"
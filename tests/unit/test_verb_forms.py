@@ -0,0 +1,42 @@
+"""Tests for the tagging of verb forms."""
+
+import pytest
+
+from ctk_functions.microservices import verb_forms
+
+
+@pytest.mark.parametrize(
+    ("phrase", "expected"),
+    [
+        ("is", "VBZ"),
+        ("are", "VBP"),
+        ("Has", "VBZ"),
+        ("have", "VBP"),
+        ("doesn't go", "VBZ"),
+        ("don’t", "VBP"),  # noqa: RUF001
+        ("can", "MD"),
+        ("won't", "MD"),
+        ("be", "VB"),
+        ("walks", "VBZ"),
+        ("watches", "VBZ"),
+        ("walk", "VBP"),
+        ("discuss", "VBP"),
+        ("focus", "VBP"),
+        ("walked", "VBD"),
+        ("walking", "VBG"),
+        ("need", "VBP"),
+        ("proceed", "VBP"),
+        ("succeed", "VBP"),
+        ("bring", "VBP"),
+        ("string", "VBP"),
+        ("needed", "VBD"),
+        ("bringing", "VBG"),
+        ("agreed", None),
+        ("fled", None),
+        ("", None),
+        ("3", None),
+    ],
+)
+def test_get_tag(phrase: str, expected: str | None) -> None:
+    """Test the tags of verb forms."""
+    assert verb_forms.get_tag(phrase) == expected
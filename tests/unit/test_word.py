@@ -0,0 +1,50 @@
+"""Tests for the Word document utilities."""
+
+import docx
+import pytest
+from docx.shared import RGBColor
+
+from ctk_functions.core import word
+
+
+def _make_paragraph(*texts: str) -> docx.text.paragraph.Paragraph:
+    paragraph = docx.Document().add_paragraph()
+    for text in texts:
+        paragraph.add_run(text)
+    return paragraph
+
+
+def test_replace_in_runs_within_and_across_runs() -> None:
+    """Test that replacements preserve the formatting of the start run."""
+    paragraph = _make_paragraph("they is ", "here and ", "she go home.")
+    paragraph.runs[1].bold = True
+    paragraph.runs[2].font.color.rgb = RGBColor(255, 0, 0)
+
+    word.replace_in_runs(
+        paragraph, [(13, 16, "&"), (16, 20, " he"), (5, 7, "are"), (21, 23, "goes")]
+    )
+
+    assert [run.text for run in paragraph.runs] == [
+        "they are ",
+        "here & he",
+        " goes home.",
+    ]
+    assert paragraph.runs[1].bold
+    assert paragraph.runs[2].font.color.rgb == RGBColor(255, 0, 0)
+
+
+def test_replace_in_runs_at_paragraph_end() -> None:
+    """Test that insertions at the end of the paragraph use the last run."""
+    paragraph = _make_paragraph("Hello", " world")
+
+    word.replace_in_runs(paragraph, [(11, 11, "!"), (0, 1, "h")])
+
+    assert [run.text for run in paragraph.runs] == ["hello", " world!"]
+
+
+def test_replace_in_runs_overlapping() -> None:
+    """Test that overlapping replacements are rejected."""
+    paragraph = _make_paragraph("Hello world")
+
+    with pytest.raises(ValueError, match="overlap"):
+        word.replace_in_runs(paragraph, [(0, 5, "Hi"), (3, 7, "")])